@@ -0,0 +1,267 @@
+import numpy as np
+import pytest
+
+import toolstr
+
+
+nan = float('nan')
+number_values = [
+    0,
+    1,
+    -1,
+    7,
+    999,
+    1000,
+    -1000,
+    999_999,
+    1_000_000,
+    123_456_789,
+    10**15,
+    10**18,
+    0.0,
+    -0.0,
+    0.5,
+    -0.5,
+    0.00005,
+    -0.00005,
+    1.5,
+    -2.25,
+    999.999,
+    1000.0,
+    999_999.5,
+    1e6,
+    -1e6,
+    1e9,
+    1e12,
+    1e15,
+    1e18,
+    1e21,
+    nan,
+]
+number_kwargs = [
+    {},
+    {'order_of_magnitude': True},
+    {'order_of_magnitude': True, 'oom_blank': ' ', 'postfix': 'x'},
+    {'decimals': 1},
+    {'decimals': 0},
+    {'percentage': True},
+    {'scientific': True},
+    {'signed': True, 'commas': False},
+    {'trailing_zeros': True, 'prefix': '$'},
+    {'nan': 'NaN'},
+]
+
+
+def get_inputs(values):
+    """get mixed input plus inputs of each type, as lists and arrays"""
+    ints = [value for value in values if isinstance(value, int)]
+    floats = [value for value in values if isinstance(value, float)]
+    return [values, ints, floats, np.array(ints), np.array(floats)]
+
+
+def get_python_values(values):
+    """arrays are formatted like their python values"""
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    else:
+        return values
+
+
+@pytest.mark.parametrize('kwargs', number_kwargs)
+def test_format_numbers_matches_format_number(kwargs):
+    for values in get_inputs(number_values):
+        expected = [
+            toolstr.format_number(value, **kwargs)
+            for value in get_python_values(values)
+        ]
+        assert toolstr.format_numbers(values, **kwargs) == expected
+
+
+def test_format_numbers_missing_values():
+    assert toolstr.format_numbers([1.5, nan], nan='?') == ['1.5', '?']
+    assert toolstr.format_numbers(np.array([nan]), nan='?') == ['?']
+    with pytest.raises(TypeError):
+        toolstr.format_number(None)  # type: ignore
+    with pytest.raises(TypeError):
+        toolstr.format_numbers([1.5, None])
+
+
+nbytes_values = [
+    0,
+    1,
+    1023,
+    1024,
+    1025,
+    1536,
+    2**20 - 1,
+    2**20,
+    2**40,
+    2**80,
+    2**90,
+    0.5,
+    1023.999,
+    1024.0,
+    1.5 * 2**30,
+    nan,
+]
+
+
+@pytest.mark.parametrize(
+    'kwargs', [{}, {'decimals': 0}, {'bibytes': True}, {'commas': True}]
+)
+def test_format_nbytes_matches_scalar(kwargs):
+    for values in get_inputs(nbytes_values):
+        expected = [
+            toolstr.format_nbytes(value, **kwargs)
+            for value in get_python_values(values)
+        ]
+        assert toolstr.format_nbytes(values, **kwargs) == expected
+
+
+def test_format_nbytes_negative():
+    with pytest.raises(Exception):
+        toolstr.format_nbytes(-1)
+    with pytest.raises(Exception):
+        toolstr.format_nbytes([1, -1])
+
+
+timestamp_values = [
+    0,
+    1,
+    -1,
+    -86400,
+    1.5,
+    -0.5,
+    59.999,
+    86399,
+    86400,
+    951782400,
+    1_000_000_000,
+    1_700_000_000.25,
+    253402300799,
+]
+
+
+@pytest.mark.parametrize(
+    'representation', ['TimestampISO', 'TimestampISOPretty', 'TimestampDate']
+)
+def test_format_timestamps_matches_format_timestamp(representation):
+    for values in get_inputs(timestamp_values):
+        expected = [
+            toolstr.format_timestamp(value, representation=representation)
+            for value in get_python_values(values)
+        ]
+        actual = toolstr.format_timestamps(
+            values, representation=representation
+        )
+        assert actual == expected
+
+
+def test_format_timestamps_datetime64():
+    values = np.array(
+        ['1969-12-31T23:59:59', '2000-02-29T12:30:00'], dtype='datetime64[s]'
+    )
+    expected = [
+        toolstr.format_timestamp(int(value.astype(int))) for value in values
+    ]
+    assert toolstr.format_timestamps(values) == expected
+
+
+def test_format_timestamps_missing_values():
+    for value in [None, nan]:
+        with pytest.raises(Exception):
+            toolstr.format_timestamp(value)  # type: ignore
+        with pytest.raises(Exception):
+            toolstr.format_timestamps([1, value])
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [{}, {'order_of_magnitude': True}, {'decimals': 1}, {'percentage': True}],
+)
+def test_format_changes_matches_format_change(kwargs):
+    from_values = [1, 2.5, 1000, 1500.0, 3, -4, 0.25, 10**6]
+    to_values = [2.0, 3, 1000.0, 1499, -2, 8.5, 1e6, 10**9]
+    expected = [
+        toolstr.format_change(from_value, to_value, **kwargs)
+        for from_value, to_value in zip(from_values, to_values)
+    ]
+    actual = toolstr.format_changes(from_values, to_values, **kwargs)
+    assert actual == expected
+
+
+def test_format_changes_missing_values():
+    changes = toolstr.format_changes([1, None, 0], [2, 3, 5])
+    assert changes == ['1 ⟶ 2 (+100%)', '- ⟶ 3 (-)', '0 ⟶ 5 (-)']
+
+
+parse_values = [
+    0,
+    1,
+    -1,
+    7,
+    0.125,
+    -2.5,
+    999,
+    1000,
+    1234.5678,
+    -98765.4321,
+    1e6,
+    2.5e9,
+    3e12,
+    -4.75e15,
+]
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {},
+        {'order_of_magnitude': True},
+        {'percentage': True},
+        {'decimals': 6},
+        {'signed': True},
+        {'commas': False},
+        {'nan': 'NaN'},
+    ],
+)
+def test_parse_number_round_trip(kwargs):
+    nan_str = kwargs.get('nan', '-')
+    strs = [toolstr.format_number(value, **kwargs) for value in parse_values]
+    parsed = [toolstr.parse_number(text, nan=nan_str) for text in strs]
+    assert parsed == pytest.approx(parse_values, rel=5e-3, abs=5e-3)
+    if kwargs.get('decimals') == 6 or kwargs.get('percentage'):
+        assert parsed == parse_values
+
+    strs.append(toolstr.format_number(nan, **kwargs))
+    parsed_array = toolstr.parse_numbers(strs, nan=nan_str)
+    assert parsed_array[:-1].tolist() == parsed
+    assert np.isnan(parsed_array[-1])
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'bibytes': True}, {'decimals': 0}])
+def test_parse_nbytes_round_trip(kwargs):
+    values = [0, 1, 1023, 1024, 1536, 2**20, 3.5 * 2**30, 2**40]
+    strs = [toolstr.format_nbytes(value, **kwargs) for value in values]
+    parsed = [toolstr.parse_number(text, nbytes=True) for text in strs]
+    assert parsed == pytest.approx(values, rel=0.5)
+    if kwargs.get('decimals') != 0:
+        assert parsed == values
+    parsed_array = toolstr.parse_numbers(strs, nbytes=True)
+    assert parsed_array.tolist() == parsed
+
+
+def test_parse_number_bare_b_suffix():
+    assert toolstr.format_nbytes(1) == '1.00B'
+    assert toolstr.parse_number('1.00B') == 1e9
+    assert toolstr.parse_number('1.00B', nbytes=True) == 1
+    assert toolstr.parse_numbers(['1.00B', '2KB']).tolist() == [1e9, 2048]
+    assert toolstr.parse_numbers(['1.00B'], nbytes=True).tolist() == [1]
+
+
+def test_parse_number_invalid():
+    for text in ['', 'abc', '1.2.3', '1X']:
+        with pytest.raises(Exception):
+            toolstr.parse_number(text)
+    with pytest.raises(Exception):
+        toolstr.parse_numbers(['1', 'abc'])
@@ -0,0 +1,126 @@
+import gc
+import sys
+
+import pytest
+
+import toolstr
+
+
+@pytest.fixture(autouse=True)
+def render_cache():
+    global initial_stats
+
+    toolstr.enable_render_cache()
+    initial_stats = toolstr.get_render_cache_stats()
+    yield
+    toolstr.disable_render_cache()
+
+
+def get_stats():
+    """get hits and misses since start of test, and number of entries"""
+    stats = toolstr.get_render_cache_stats()
+    return (
+        stats['hits'] - initial_stats['hits'],
+        stats['misses'] - initial_stats['misses'],
+        stats['n_entries'],
+    )
+
+
+def test_hit_and_miss():
+    rows = [[1, 'a'], [2.5, None]]
+    first = toolstr.print_table(rows, ['x', 'y'], return_str=True)
+    second = toolstr.print_table(rows, ['x', 'y'], return_str=True)
+    assert first == second
+    hits, misses, n_entries = get_stats()
+    assert (hits, n_entries) == (1, 1)
+
+    # equal values of different types render differently
+    for changed in [[[True, 'a'], [2.5, None]], [[1.0, 'a'], [2.5, None]]]:
+        as_str = toolstr.print_table(changed, ['x', 'y'], return_str=True)
+        uncached = toolstr.print_table(
+            changed, ['x', 'y'], return_str=True, use_render_cache=False
+        )
+        assert as_str == uncached
+    assert get_stats()[0] == 1
+
+
+def test_disabled_cache():
+    toolstr.disable_render_cache()
+    toolstr.print_table([[1]], return_str=True)
+    toolstr.print_table([[1]], return_str=True)
+    assert get_stats() == (0, 0, 0)
+
+    toolstr.enable_render_cache()
+    with toolstr.use_render_context(use_render_cache=False):
+        toolstr.print_table([[1]], return_str=True)
+    assert get_stats() == (0, 0, 0)
+
+
+def test_evict_by_max_bytes():
+    toolstr.print_table([[0]], return_str=True)
+    n_bytes = toolstr.get_render_cache_stats()['n_bytes']
+    toolstr.enable_render_cache(max_bytes=int(n_bytes * 2.5))
+    for value in range(1, 4):
+        toolstr.print_table([[value]], return_str=True)
+
+    stats = toolstr.get_render_cache_stats()
+    assert stats['n_entries'] == 2
+    assert stats['evictions'] - initial_stats['evictions'] == 2
+    assert stats['n_bytes'] <= stats['max_bytes']
+
+    # least recently used entries were evicted
+    toolstr.print_table([[3]], return_str=True)
+    toolstr.print_table([[0]], return_str=True)
+    assert get_stats()[0] == 1
+
+
+def test_key_size_counts_toward_max_bytes():
+    # keys are fixed-size digests, so entries do not grow with input size
+    small = toolstr.print_table([[0]] * 10, limit_rows=4, return_str=True)
+    n_small = toolstr.get_render_cache_stats()['n_bytes']
+    large = toolstr.print_table([[0]] * 100_000, limit_rows=4, return_str=True)
+    n_total = toolstr.get_render_cache_stats()['n_bytes']
+
+    assert small == large
+    assert n_small > sys.getsizeof(small)
+    assert n_total == 2 * n_small
+
+
+def test_changed_style_function_misses():
+    def create_style(threshold):
+        return lambda context: 'red' if context['cell'] > threshold else None
+
+    rows = [[1], [5], [20]]
+    outputs = {}
+    for threshold in [0, 10, 0, 10]:
+        outputs.setdefault(threshold, set()).add(
+            toolstr.print_table(
+                rows,
+                column_styles=[create_style(threshold)],
+                use_styles=True,
+                return_str=True,
+            )
+        )
+        gc.collect()
+    assert len(outputs[0]) == 1
+    assert len(outputs[10]) == 1
+    assert outputs[0] != outputs[10]
+    assert get_stats()[0] == 0
+
+    # same function object hits
+    style = create_style(0)
+    for _ in range(2):
+        toolstr.print_table(rows, column_styles=[style], return_str=True)
+    assert get_stats()[0] == 1
+
+
+def test_changed_style_misses():
+    rows = [[1], [2]]
+    red = toolstr.print_table(
+        rows, style='red', use_styles=True, return_str=True
+    )
+    blue = toolstr.print_table(
+        rows, style='blue', use_styles=True, return_str=True
+    )
+    assert red != blue
+    assert get_stats()[0] == 0
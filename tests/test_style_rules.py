@@ -0,0 +1,79 @@
+import numpy as np
+
+import toolstr
+from toolstr.tables import style_rules
+
+
+nan = float('nan')
+
+
+def get_cell_styles(rule, values):
+    styles, indices = style_rules._evaluate_style_rule(rule, values)
+    return [styles[index] for index in indices.tolist()]
+
+
+def test_rule():
+    rule = toolstr.rule(gt=0, style='green', else_style='red')
+    values = [1, -1, 0, 2.5, None, nan, '...']
+    assert get_cell_styles(rule, values) == [
+        'green',
+        'red',
+        'red',
+        'green',
+        None,
+        None,
+        None,
+    ]
+    assert get_cell_styles(rule, np.array([1.0, nan, -1.0])) == [
+        'green',
+        None,
+        'red',
+    ]
+
+
+def test_rule_missing_values():
+    # missing cells get no style even when a comparison would be satisfied
+    rule = toolstr.rule(ne=0, style='green', else_style='red')
+    assert get_cell_styles(rule, [1, 0, None, nan]) == [
+        'green',
+        'red',
+        None,
+        None,
+    ]
+
+    rule = toolstr.rule(eq='a', style='green', else_style='red')
+    assert get_cell_styles(rule, ['a', 'b', None, nan]) == [
+        'green',
+        'red',
+        None,
+        None,
+    ]
+
+
+def test_rule_multiple_comparisons():
+    rule = toolstr.rule(ge=0, lt=10, style='green', else_style='red')
+    assert get_cell_styles(rule, [-1, 0, 5, 10, None]) == [
+        'red',
+        'green',
+        'green',
+        'red',
+        None,
+    ]
+
+
+def test_quantile_rule():
+    rule = toolstr.quantile_rule(
+        [0.25, 0.75], ['red', None, 'green'], else_style='dim'
+    )
+    values = [1, 2, 3, 4, 5, None, nan, '...']
+    assert get_cell_styles(rule, values) == [
+        'red',
+        None,
+        None,
+        'green',
+        'green',
+        'dim',
+        'dim',
+        None,
+    ]
+    assert get_cell_styles(rule, [None, nan]) == ['dim', 'dim']
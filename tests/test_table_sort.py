@@ -0,0 +1,72 @@
+import pytest
+
+import toolstr
+from toolstr.tables import table_utils
+
+
+nan = float('nan')
+labels = ['group', 'value', 'name']
+rows = [
+    ['b', 2, 'w'],
+    ['a', None, 'x'],
+    ['b', nan, 'y'],
+    ['a', 3, 'z'],
+    [None, 1, 'v'],
+    ['a', 1, 'u'],
+    ['b', 5, 't'],
+]
+
+
+def get_names(sorted_rows):
+    return [row[2] for row in sorted_rows]
+
+
+@pytest.mark.parametrize(
+    'descending,sort_nulls,expected',
+    [
+        (False, 'last', 'u z x w t y v'),
+        (False, 'first', 'v x u z y w t'),
+        ([False, True], 'last', 'z u x t w y v'),
+        ([True, False], 'last', 'w t y u z x v'),
+        ([True, True], 'first', 'v y t w x z u'),
+    ],
+)
+def test_sort_multiple_columns(descending, sort_nulls, expected):
+    columnar_rows = table_utils._ColumnarRows(
+        [list(column) for column in zip(*rows)]
+    )
+    for input_rows in [rows, columnar_rows]:
+        sorted_rows = table_utils._sort_rows(
+            input_rows,
+            labels,
+            sort_column=['group', 'value'],
+            descending=descending,
+            sort_nulls=sort_nulls,
+        )
+        if input_rows is columnar_rows:
+            # columnar rows are sorted column by column without building rows
+            assert isinstance(sorted_rows, table_utils._ColumnarRows)
+            assert columnar_rows._rows is None
+            assert sorted_rows._rows is None
+        assert get_names(sorted_rows) == expected.split()
+
+
+def test_sort_descending_length():
+    with pytest.raises(Exception):
+        table_utils._sort_rows(
+            rows, labels, sort_column=['group', 'value'], descending=[True]
+        )
+
+
+def test_print_table_sort_column():
+    as_str = toolstr.print_table(
+        rows,
+        labels,
+        sort_column=['group', 'value'],
+        descending=[False, True],
+        use_styles=False,
+        return_str=True,
+    )
+    assert as_str is not None
+    names = [line.split()[-1] for line in as_str.split('\n')[2:]]
+    assert names == 'z u x t w y v'.split()
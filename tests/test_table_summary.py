@@ -0,0 +1,102 @@
+import io
+
+import pytest
+
+import toolstr
+
+
+labels = ['id', 'name', 'value']
+old_rows = [[1, 'a', 1.5], [2, 'b', 2000.25], [3, 'c', 3.0]]
+new_rows = [[4, 'd', 4.0], [2, 'b', 3000.75], [1, 'a', 1.5]]
+
+
+def test_get_table_diff():
+    diff = toolstr.get_table_diff(old_rows, new_rows, key='id', labels=labels)
+    assert diff['added'] == [[4, 'd', 4.0]]
+    assert diff['removed'] == [[3, 'c', 3.0]]
+    assert diff['changed'] == [
+        {
+            'key': 2,
+            'old_row': [2, 'b', 2000.25],
+            'new_row': [2, 'b', 3000.75],
+            'changed_columns': [2],
+        }
+    ]
+    assert diff['n_unchanged'] == 1
+
+
+def test_get_table_diff_duplicate_keys():
+    with pytest.raises(Exception):
+        toolstr.get_table_diff(old_rows + [[1, 'x', 0]], new_rows, key=0)
+    with pytest.raises(Exception):
+        toolstr.get_table_diff(old_rows, new_rows + [[1, 'x', 0]], key=0)
+
+
+def test_print_table_diff_rows():
+    as_str = toolstr.print_table_diff(
+        old_rows,
+        new_rows,
+        key='id',
+        labels=labels,
+        use_styles=False,
+        return_str=True,
+    )
+    assert as_str is not None
+    lines = as_str.split('\n')
+    assert lines[0] == '1 added, 1 removed, 1 changed, 1 unchanged'
+    changes = [line.split()[0] for line in lines[4:]]
+    assert changes == ['changed', 'added', 'removed']
+    assert '2,000.25 → 3,000.75' in lines[4]
+
+
+def test_print_table_diff_output():
+    file = io.StringIO()
+    result = toolstr.print_table_diff(
+        old_rows, new_rows, key=0, file=file, use_styles=False
+    )
+    assert result is None
+    expected = toolstr.print_table_diff(
+        old_rows, new_rows, key=0, use_styles=False, return_str=True
+    )
+    assert expected is not None
+    assert file.getvalue() == expected + '\n'
+
+    with toolstr.use_render_context(file=io.StringIO()) as context:
+        toolstr.print_table_diff(old_rows, old_rows, key=0, use_styles=False)
+        assert context['file'].getvalue() == (
+            '0 added, 0 removed, 0 changed, 3 unchanged\n'
+        )
+
+
+def test_print_table_diff_formats():
+    as_str = toolstr.print_table_diff(
+        old_rows,
+        new_rows,
+        key=0,
+        column_formats={3: {'decimals': 3}},
+        use_styles=False,
+        return_str=True,
+    )
+    assert as_str is not None
+    assert '2,000.250 → 3,000.750' in as_str
+    assert '4.000' in as_str
+
+
+def test_print_table_diff_style():
+    as_str = toolstr.print_table_diff(
+        old_rows,
+        new_rows,
+        key=0,
+        style='blue',
+        use_styles=True,
+        return_str=True,
+    )
+    assert as_str is not None
+    assert '[blue]b[/blue]' in as_str
+    assert '[green]d[/green]' in as_str
+    assert '[bold yellow]changed[/bold yellow]' in as_str
+
+    with pytest.raises(Exception):
+        toolstr.print_table_diff(
+            old_rows, new_rows, key=0, style=toolstr.rule(gt=0, style='red')
+        )
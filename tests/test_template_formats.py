@@ -0,0 +1,53 @@
+import os
+
+import toolstr
+
+
+def test_aggregate_scandir_in_processes(tmp_path):
+    for chunk in range(25):
+        for part in range(3):
+            name = 'data__' + str(chunk) + '__' + str(part) + '.parquet'
+            (tmp_path / name).touch()
+    parser = toolstr.TemplateParser('data__{chunk:d}__{part:d}.parquet')
+    aggregations = {'chunk': ['count', 'min', 'max'], 'part': 'count_distinct'}
+
+    with os.scandir(tmp_path) as entries:
+        result = parser.aggregate(
+            entries, aggregations, n_workers=2, chunk_size=10
+        )
+    with os.scandir(tmp_path) as entries:
+        expected = parser.aggregate(entries, aggregations)
+
+    assert result == expected
+    assert result['chunk'] == {'count': 75, 'min': '0', 'max': '24'}
+    assert result['part'] == {'count_distinct': 3}
+
+
+def test_renderer_escaped_braces():
+    for template in ['{a}{{lit}}', '{a}-{{x}}-{b}', '{{x}}{a:03d}{{', '%{a}']:
+        renderer = toolstr.TemplateRenderer(template)
+        assert renderer.render(a=1, b=2) == template.format(a=1, b=2)
+        assert renderer.render_many({'a': [1, 2], 'b': [3, 4]}) == [
+            template.format(a=1, b=3),
+            template.format(a=2, b=4),
+        ]
+
+
+def test_values_read_by_key_name():
+    # groups in default_pattern or template literals must not shift values
+    strs = ['x_y', 'yy_x']
+    parser = toolstr.TemplateParser('{a}_{b}', default_pattern='(x|y)+')
+    assert parser.parse_many(strs, columns=True) == {
+        'a': ['x', 'yy'],
+        'b': ['y', 'x'],
+    }
+    aggregations = {'a': 'last', 'b': ['first', 'last']}
+    assert parser.aggregate(strs, aggregations) == {
+        'a': {'last': 'yy'},
+        'b': {'first': 'y', 'last': 'x'},
+    }
+
+    result = toolstr.parse_aggregate_by_template(
+        ['1_2', '3-2'], '{a}(_|-){b}', {'a': 'max'}
+    )
+    assert result == {'a': '3', 'b': '2'}
@@ -4,6 +4,8 @@ from .buffers import *
 from .charts import *
 from .formats import *
 from .outlines import *
+from .render_cache import *
+from .render_context import *
 from .spec import *
 from .tables import *
 from .summaries import *
@@ -3,3 +3,4 @@ from .grid_utils import *
 from .raster_utils import *
 from .render_utils import *
 from .plot_utils import *
+from .sparkline_utils import *
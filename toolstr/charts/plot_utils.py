@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing
 
 from .. import formats
+from .. import render_cache
 from .. import spec
 from . import char_dicts
 from . import grid_utils
@@ -22,8 +23,28 @@ def render_line_plot(
     yaxis_kwargs: typing.Mapping[typing.Any, typing.Any] | None = None,
     char_dict: spec.SampleMode | spec.GridCharDict | None = None,
     y_axis_width: int = 9,
+    use_render_cache: bool = True,
 ) -> str:
 
+    # reuse rendered plot if inputs are identical to a cached render
+    if use_render_cache:
+        options = {
+            key: value
+            for key, value in locals().items()
+            if key not in ('xvals', 'yvals', 'use_render_cache')
+        }
+        render_key = render_cache._get_render_key(
+            'render_line_plot', xvals, yvals, **options
+        )
+        if render_key is not None:
+            rendered = render_cache._get_cached_render(render_key)
+            if rendered is None:
+                rendered = render_line_plot(
+                    xvals, yvals, use_render_cache=False, **options
+                )
+                render_cache._cache_render(render_key, rendered)
+            return rendered
+
     import numpy as np
 
     # determine char dict
@@ -85,12 +106,11 @@ def render_line_plot(
     )
 
     # stylize plot line
+    plot_lines = plot.split('\n')
     if line_style is not None:
-        new_lines = [
-            formats.add_style(line, line_style)
-            for line in plot.split('\n')
+        plot_lines = [
+            formats.add_style(line, line_style) for line in plot_lines
         ]
-        plot = '\n'.join(new_lines)
 
     # create y axis
     if yaxis_kwargs is None:
@@ -102,7 +122,7 @@ def render_line_plot(
         tick_label_style=tick_label_style,
         **yaxis_kwargs
     )
-    graph = formats.concatenate_blocks([y_axis, plot])
+    graph = formats.concatenate_blocks([y_axis, plot_lines])
 
     # create x axis
     if xaxis_kwargs is None:
@@ -114,9 +134,8 @@ def render_line_plot(
         **xaxis_kwargs
     )
     x_axis = formats.indent_block(x_axis, indent=y_axis_width)
-    graph = graph + '\n' + x_axis
 
-    return graph
+    return formats.stack_blocks([graph, x_axis])
 
 
 def print_line_plot(
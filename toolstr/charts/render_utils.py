@@ -169,12 +169,7 @@ def render_x_axis(
 
     if formatter is None:
         if tick_label_format == 'date':
-            import functools
-
-            formatter = functools.partial(
-                formats.format_timestamp,
-                representation='TimestampDate',
-            )
+            formatter = _format_date_tick
         elif tick_label_format == 'age':
             import tooltime
 
@@ -183,12 +178,7 @@ def render_x_axis(
                 return phrase.split(', ')[0]
 
         elif tick_label_format == 'iso':
-            import functools
-
-            formatter = functools.partial(
-                formats.format_timestamp,
-                representation='TimestampISOPretty',
-            )
+            formatter = _format_iso_tick
 
         elif tick_label_format is None:
 
@@ -240,9 +230,7 @@ def render_x_axis(
         rows.append('')
 
     if formatter is None:
-        import functools
-
-        formatter = functools.partial(toolstr.format, order_of_magnitude=True)
+        formatter = _format_number_tick
 
     # label row
     labels = ' ' * grid['n_columns']
@@ -269,3 +257,17 @@ def render_x_axis(
     rows.append(labels)
 
     return '\n'.join(rows)
+
+
+def _format_date_tick(xval: typing.Any) -> str:
+    return formats.format_timestamps([xval], representation='TimestampDate')[0]
+
+
+def _format_iso_tick(xval: typing.Any) -> str:
+    return formats.format_timestamps(
+        [xval], representation='TimestampISOPretty'
+    )[0]
+
+
+def _format_number_tick(xval: typing.Any) -> str:
+    return toolstr.format(xval, order_of_magnitude=True)
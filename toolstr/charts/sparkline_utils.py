@@ -0,0 +1,226 @@
+"""render many small charts at once, such as one sparkline per table row"""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+from . import char_dicts
+
+
+# braille dot bit of each (row, column) of a 4x2 cell, top row first
+_braille_bits = [[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]]
+
+
+def create_braille_sparklines(
+    series: typing.Sequence[typing.Sequence[int | float]],
+    width: int,
+    height: int | None = None,
+) -> list[str]:
+    """create braille sparkline of each series, rasterized in one batch
+
+    output matches create_braille_sparkline() of each series, missing values
+    break the line, and empty series are rendered as blank
+    """
+    import numpy as np
+
+    if height is None:
+        height = 1
+    n_rows = 4 * height
+    n_columns = 2 * width
+    samples = _sample_series(series, n_columns)
+    n_series = len(samples)
+
+    # find row of each sample, using grid padded by a tenth of range
+    missing = np.isnan(samples)
+    ymin, ymax = _get_bounds(samples, missing)
+    with np.errstate(invalid='ignore'):
+        dy = ymax - ymin
+        borders = _linspace(ymin - 0.1 * dy, ymax + 0.1 * dy, n_rows + 1)
+    rows = (borders[:, :, np.newaxis] < samples[:, np.newaxis, :]).sum(axis=1)
+    rows = rows - 1
+
+    # each column of a line is a run of rows from its sample's row toward
+    # the neighboring samples' rows, as drawn by line_utils.draw_line()
+    to_next = np.zeros((n_series, n_columns), dtype=int)
+    to_previous = np.zeros((n_series, n_columns), dtype=int)
+    if n_columns > 1:
+        delta = rows[:, 1:] - rows[:, :-1]
+        distance = np.abs(delta)
+        direction = np.where(delta > 0, 1, -1)
+        n_left = np.maximum((distance - 1) // 2, 0)
+        n_right = np.where(distance >= 2, distance - 1 - n_left, 0)
+        broken = missing[:, 1:] | missing[:, :-1]
+        n_left[broken] = 0
+        n_right[broken] = 0
+        to_next[:, :-1] = direction * n_left
+        to_previous[:, 1:] = -direction * n_right
+    low = rows + np.minimum(np.minimum(to_next, to_previous), 0)
+    high = rows + np.maximum(np.maximum(to_next, to_previous), 0)
+    low[missing] = n_rows
+    high[missing] = -1
+
+    # rasterize, with top row first
+    row_indices = np.arange(n_rows - 1, -1, -1)[np.newaxis, :, np.newaxis]
+    raster = (row_indices >= low[:, np.newaxis, :]) & (
+        row_indices <= high[:, np.newaxis, :]
+    )
+
+    # convert each 4x2 cell to a braille char
+    cells = raster.reshape(n_series, height, 4, width, 2)
+    bits = np.array(_braille_bits)[np.newaxis, np.newaxis, :, np.newaxis, :]
+    codes = (cells * bits).sum(axis=(2, 4))
+    chars = np.array([chr(0x2800 + code) for code in range(256)])
+    return _join_chars(chars[codes])
+
+
+def create_bar_sparklines(
+    series: typing.Sequence[typing.Sequence[int | float]],
+    width: int,
+    height: int | None = None,
+) -> list[str]:
+    """create sparkline of vertical bars of each series, in one batch
+
+    bars are scaled from each series' min to its max, missing values are
+    rendered as blank, and empty series are rendered as blank
+    """
+    import numpy as np
+
+    if height is None:
+        height = 1
+    samples = _sample_series(series, width)
+
+    # scale each series to levels between one eighth and full height
+    n_levels = 8 * height
+    ymin, ymax = _get_bounds(samples, np.isnan(samples))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dy = (ymax - ymin)[:, np.newaxis]
+        fraction = np.where(dy > 0, (samples - ymin[:, np.newaxis]) / dy, 0.5)
+    levels = 1 + np.round(fraction * (n_levels - 1))
+    levels[np.isnan(samples)] = 0
+    levels = levels.astype(int)
+
+    # split levels into lines, with top line first
+    offsets = 8 * np.arange(height - 1, -1, -1)[np.newaxis, :, np.newaxis]
+    line_levels = np.clip(levels[:, np.newaxis, :] - offsets, 0, 8)
+    chars = np.array(_get_split_chars(char_dicts.height_split_dict))
+    return _join_chars(chars[line_levels])
+
+
+def create_fraction_bars(
+    values: typing.Sequence[int | float | None],
+    width: int,
+    min_value: int | float = 0,
+    max_value: int | float | None = None,
+) -> list[str]:
+    """create horizontal bar of each value, in one batch
+
+    bars are scaled from min_value to max_value, using max of values if
+    max_value is None, and missing values are rendered as blank
+    """
+    import numpy as np
+
+    array = np.array(
+        [float('nan') if value is None else value for value in values],
+        dtype=float,
+    )
+    if max_value is None:
+        valid = array[~np.isnan(array)]
+        max_value = valid.max() if len(valid) > 0 else min_value
+
+    # count filled eighths of each bar
+    span = max_value - min_value
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if span > 0:
+            fraction = (array - min_value) / span
+        else:
+            fraction = np.where(array > min_value, 1.0, 0.0)
+    eighths = np.round(np.clip(fraction, 0, 1) * 8 * width)
+    eighths[np.isnan(array)] = 0
+    eighths = eighths.astype(int)
+
+    offsets = 8 * np.arange(width)[np.newaxis, :]
+    cell_eighths = np.clip(eighths[:, np.newaxis] - offsets, 0, 8)
+    chars = np.array(_get_split_chars(char_dicts.width_split_dict))
+    return _join_chars(chars[cell_eighths[:, np.newaxis, :]])
+
+
+def _sample_series(
+    series: typing.Sequence[typing.Sequence[int | float]],
+    n_samples: int,
+) -> np.ndarray[typing.Any, np.dtype[np.float64]]:
+    """sample each series at n_samples evenly spaced indices
+
+    uses same indices as np.linspace(0, len - 1, n_samples, dtype=int)
+    """
+    import numpy as np
+
+    lengths = np.array([len(values) for values in series], dtype=int)
+    if len(series) == 0:
+        return np.zeros((0, n_samples))
+    flat = np.concatenate(
+        [np.asarray(values, dtype=float).ravel() for values in series]
+        + [np.array([np.nan])]
+    )
+    offsets = np.zeros(len(series), dtype=int)
+    offsets[1:] = np.cumsum(lengths)[:-1]
+
+    indices = _linspace(
+        np.zeros(len(series)), (lengths - 1).astype(float), n_samples
+    ).astype(int)
+    indices = indices + offsets[:, np.newaxis]
+
+    # empty series sample the trailing nan
+    indices[lengths == 0] = len(flat) - 1
+    samples: np.ndarray[typing.Any, np.dtype[np.float64]] = flat[indices]
+    return samples
+
+
+def _get_bounds(
+    samples: np.ndarray[typing.Any, np.dtype[np.float64]],
+    missing: np.ndarray[typing.Any, np.dtype[np.bool_]],
+) -> tuple[
+    np.ndarray[typing.Any, np.dtype[np.float64]],
+    np.ndarray[typing.Any, np.dtype[np.float64]],
+]:
+    """get min and max of each row of samples, ignoring missing values"""
+    import numpy as np
+
+    present = ~missing
+    ymin = np.min(samples, axis=1, initial=np.inf, where=present)
+    ymax = np.max(samples, axis=1, initial=-np.inf, where=present)
+    return ymin, ymax
+
+
+def _linspace(
+    start: np.ndarray[typing.Any, np.dtype[np.float64]],
+    stop: np.ndarray[typing.Any, np.dtype[np.float64]],
+    num: int,
+) -> np.ndarray[typing.Any, np.dtype[np.float64]]:
+    """np.linspace() of each start and stop, as rows of output"""
+    import numpy as np
+
+    if num == 1:
+        return start[:, np.newaxis].copy()
+    step = (stop - start) / (num - 1)
+    points = np.arange(num)[np.newaxis, :] * step[:, np.newaxis]
+    points = points + start[:, np.newaxis]
+    points[:, -1] = stop
+    return points
+
+
+def _get_split_chars(char_dict: typing.Mapping[typing.Any, str]) -> list[str]:
+    """get chars of split char dict ordered by number of filled eighths"""
+    chars_by_count = {
+        sum(sum(row) for row in key): char for key, char in char_dict.items()
+    }
+    return [chars_by_count[count] for count in range(len(chars_by_count))]
+
+
+def _join_chars(
+    chars: np.ndarray[typing.Any, typing.Any],
+) -> list[str]:
+    """join array of chars with shape (n_charts, height, width) into strs"""
+    return ['\n'.join(''.join(line) for line in chart) for chart in chars]
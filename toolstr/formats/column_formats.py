@@ -5,7 +5,11 @@ import typing
 
 from . import positional_formats
 
+if typing.TYPE_CHECKING:
+    import numpy as np
 
+
+@typing.overload
 def columnize(
     text: str,
     *,
@@ -13,13 +17,71 @@ def columnize(
     max_height: int | None = None,
     header_height: int | None = None,
     gap: int | str | None = None,
+    max_width: int | None = None,
+    flow: typing.Literal['column', 'row'] = 'column',
 ) -> str:
+    ...
+
+
+@typing.overload
+def columnize(
+    text: positional_formats.Block,
+    *,
+    n_columns: int | None = None,
+    max_height: int | None = None,
+    header_height: int | None = None,
+    gap: int | str | None = None,
+    max_width: int | None = None,
+    flow: typing.Literal['column', 'row'] = 'column',
+) -> positional_formats.Block:
+    ...
+
+
+def columnize(
+    text: str | positional_formats.Block,
+    *,
+    n_columns: int | None = None,
+    max_height: int | None = None,
+    header_height: int | None = None,
+    gap: int | str | None = None,
+    max_width: int | None = None,
+    flow: typing.Literal['column', 'row'] = 'column',
+) -> str | positional_formats.Block:
     """number of columns is determined by n_columns or height
 
+    if neither n_columns nor max_height is given, uses as many columns as fit
+    in max_width, which defaults to width of render context or terminal
+
+    flow is 'column' to fill each column before the next, or 'row' to fill
+    each row before the next
+
+    gap defaults to 1 space when fitting columns to max_width or using row
+    flow, since those columns are padded to their widths, and to no gap
+    otherwise
+
     TODO: implement flexbox justification styles
     - https://css-tricks.com/snippets/css/a-guide-to-flexbox/
     """
 
+    if flow not in ('column', 'row'):
+        raise Exception('unknown flow: ' + str(flow))
+    if (n_columns is None and max_height is None) or flow == 'row':
+        if gap is None:
+            gap = 1
+        columnized = _fit_columnize(
+            positional_formats.as_block(text),
+            n_columns=n_columns,
+            max_height=max_height,
+            header_height=header_height,
+            gap=positional_formats.indent_to_str(gap),
+            max_width=max_width,
+            flow=flow,
+        )
+        if isinstance(text, str):
+            return str(columnized)
+        else:
+            return columnized
+
     columns = _raw_columnize(
         text=text,
         n_columns=n_columns,
@@ -28,50 +90,184 @@ def columnize(
     )
 
     # upper block
-    min_height = len(columns[-1])
+    min_height = columns[-1].height
     columnized = positional_formats.concatenate_blocks(
         [column[:min_height] for column in columns],
         gap=gap,
     )
 
     # lower block
-    if min_height < len(columns[0]):
+    if min_height < columns[0].height:
         lower_block = positional_formats.concatenate_blocks(
             [column[min_height:] for column in columns[:-1]],
             gap=gap,
         )
-        columnized = columnized + '\n' + lower_block
+        columnized = positional_formats.stack_blocks(
+            [columnized, lower_block]
+        )
 
-    return columnized
+    if isinstance(text, str):
+        return str(columnized)
+    else:
+        return columnized
 
 
 def _raw_columnize(
-    text: str,
+    text: str | positional_formats.Block,
     *,
     n_columns: int | None = None,
     max_height: int | None = None,
     header_height: int | None = None,
-) -> typing.Sequence[typing.Sequence[str]]:
+) -> typing.Sequence[positional_formats.Block]:
 
-    lines = text.split('\n')
+    block = positional_formats.as_block(text)
 
     if header_height is None:
         header_height = 0
-    header = lines[:header_height]
-    remaining_lines = lines[header_height:]
+    header = block[:header_height]
 
     if max_height is None and n_columns is None:
         raise Exception('must specify max_height or n_columns')
     if n_columns is not None:
-        max_height = math.ceil(len(lines) / n_columns)
+        max_height = math.ceil(block.height / n_columns)
     if max_height is None:
         raise Exception('must specify max_height')
 
+    column_size = max_height - header_height
+    if column_size < 1:
+        raise Exception('max_height must be greater than header_height')
     columns = []
-    while len(remaining_lines) > 0:
-        column = header + remaining_lines[: max_height - header_height]
+    for start in range(header_height, block.height, column_size):
+        column = positional_formats.stack_blocks(
+            [header, block[start : start + column_size]]
+        )
         columns.append(column)
-        column_size = len(column)
-        remaining_lines = remaining_lines[column_size:]
 
     return columns
+
+
+def _fit_columnize(
+    block: positional_formats.Block,
+    *,
+    n_columns: int | None,
+    max_height: int | None,
+    header_height: int | None,
+    gap: str,
+    max_width: int | None,
+    flow: typing.Literal['column', 'row'],
+) -> positional_formats.Block:
+    """columnize lines into aligned columns, fitting max_width if needed"""
+    import numpy as np
+
+    if header_height is None:
+        header_height = 0
+    header = block[:header_height]
+    body = block[header_height:]
+    n_lines = body.height
+    if n_lines == 0:
+        return block
+
+    # determine number of columns
+    widths = np.array(body.widths, dtype=int)
+    header_width = header.width
+    gap_width = positional_formats._get_line_width(gap)
+    if n_columns is not None:
+        n_columns = max(1, min(n_columns, n_lines))
+    elif max_height is not None:
+        if max_height <= header_height:
+            raise Exception('max_height must be greater than header_height')
+        n_columns = math.ceil(n_lines / (max_height - header_height))
+    else:
+        if max_width is None:
+            from .. import render_context
+
+            max_width = render_context._get_render_width()
+        n_columns = _get_max_fitting_columns(
+            widths, header_width, gap_width, max_width, flow
+        )
+
+    # split lines into columns
+    if flow == 'column':
+        height = math.ceil(n_lines / n_columns)
+        n_columns = math.ceil(n_lines / height)
+        columns = [
+            body[start : start + height]
+            for start in range(0, n_lines, height)
+        ]
+    else:
+        columns = [
+            positional_formats.Block(
+                body.lines[c::n_columns], body.widths[c::n_columns]
+            )
+            for c in range(n_columns)
+        ]
+    column_widths = [
+        max(header_width, column.width) for column in columns
+    ]
+    columns = [
+        positional_formats.stack_blocks([header, column]) for column in columns
+    ]
+
+    # join rows of columns, padding each cell to its column width
+    lines = []
+    line_widths = []
+    for row in range(columns[0].height):
+        pieces: list[str] = []
+        line_width = 0
+        for column, column_width in zip(columns, column_widths):
+            if row >= column.height:
+                break
+            if len(pieces) > 0:
+                pieces.append(gap)
+                line_width += gap_width
+            pieces.append(column.lines[row])
+            pieces.append(' ' * (column_width - column.widths[row]))
+            line_width += column_width
+        if len(pieces) > 0:
+            line_width -= len(pieces[-1])
+            pieces.pop()
+        lines.append(''.join(pieces))
+        line_widths.append(line_width)
+
+    return positional_formats.Block(lines, line_widths)
+
+
+def _get_max_fitting_columns(
+    widths: np.ndarray[typing.Any, np.dtype[np.int_]],
+    header_width: int,
+    gap_width: int,
+    max_width: int,
+    flow: typing.Literal['column', 'row'],
+) -> int:
+    """binary search for most columns whose total width fits max_width
+
+    widths of each candidate layout are maxima over partitions of the line
+    widths, so each step takes linear time
+    """
+    import numpy as np
+
+    n_lines = len(widths)
+
+    def get_total_width(n_columns: int) -> int:
+        if flow == 'column':
+            height = math.ceil(n_lines / n_columns)
+            starts = np.arange(0, n_lines, height)
+            column_widths = np.maximum.reduceat(widths, starts)
+        else:
+            n_rows = math.ceil(n_lines / n_columns)
+            padded = np.zeros(n_rows * n_columns, dtype=int)
+            padded[:n_lines] = widths
+            column_widths = padded.reshape(n_rows, n_columns).max(axis=0)
+        column_widths = np.maximum(column_widths, header_width)
+        n_gaps = len(column_widths) - 1
+        return int(column_widths.sum()) + gap_width * n_gaps
+
+    lower = 1
+    upper = n_lines
+    while lower < upper:
+        middle = (lower + upper + 1) // 2
+        if get_total_width(middle) <= max_width:
+            lower = middle
+        else:
+            upper = middle - 1
+    return lower
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import math
+import re
 import typing
 
 if typing.TYPE_CHECKING:
+    import numpy as np
     import tooltime
 
 from .. import spec
@@ -32,11 +35,12 @@ def format(
     elif format_type == 'timestamp':
         return format_timestamp(value, **kwargs)
     elif format_type == 'nbytes':
-        return format_nbytes(value, **kwargs)
+        return _format_nbytes_value(value, **kwargs)
     else:
         raise Exception('unknown format_type: ' + str(format_type))
 
 
+@typing.overload
 def format_nbytes(
     nbytes: int | float,
     *,
@@ -45,16 +49,72 @@ def format_nbytes(
     bibytes: bool = False,
     **format_kwargs: typing.Any,
 ) -> str:
+    ...
 
+
+@typing.overload
+def format_nbytes(
+    nbytes: typing.Sequence[int | float] | np.ndarray[typing.Any, typing.Any],
+    *,
+    decimals: int = 2,
+    commas: bool = False,
+    bibytes: bool = False,
+    **format_kwargs: typing.Any,
+) -> list[str]:
+    ...
+
+
+def format_nbytes(
+    nbytes: int
+    | float
+    | typing.Sequence[int | float]
+    | np.ndarray[typing.Any, typing.Any],
+    *,
+    decimals: int = 2,
+    commas: bool = False,
+    bibytes: bool = False,
+    **format_kwargs: typing.Any,
+) -> str | list[str]:
+    """format number of bytes using largest prefix below value
+
+    sequences and arrays of values are formatted in batch, returning a list
+    """
+
+    if not isinstance(nbytes, (int, float)) and hasattr(nbytes, '__len__'):
+        return _format_nbytes_array(
+            nbytes,
+            decimals=decimals,
+            commas=commas,
+            bibytes=bibytes,
+            **format_kwargs,
+        )
+    else:
+        return _format_nbytes_value(
+            nbytes,  # type: ignore
+            decimals=decimals,
+            commas=commas,
+            bibytes=bibytes,
+            **format_kwargs,
+        )
+
+
+def _format_nbytes_value(
+    nbytes: int | float,
+    *,
+    decimals: int = 2,
+    commas: bool = False,
+    bibytes: bool = False,
+    **format_kwargs: typing.Any,
+) -> str:
     if nbytes < 0:
         raise Exception('input must be non-negative')
     elif nbytes == 0:
         return '0B'
     else:
         if bibytes:
-            prefixes = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB', 'ZiB', 'YiB']
+            prefixes = _bibyte_prefixes
         else:
-            prefixes = ['B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB']
+            prefixes = _byte_prefixes
         divisions = 0
         while nbytes >= 1024:
             nbytes = nbytes / 1024
@@ -70,6 +130,76 @@ def format_nbytes(
         return number_str + prefixes[divisions]
 
 
+_byte_prefixes = ['B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB']
+_bibyte_prefixes = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB', 'ZiB', 'YiB']
+
+
+def _format_nbytes_array(
+    values: typing.Sequence[int | float] | np.ndarray[typing.Any, typing.Any],
+    *,
+    decimals: int,
+    commas: bool,
+    bibytes: bool,
+    **format_kwargs: typing.Any,
+) -> list[str]:
+    """format many numbers of bytes, matching format_nbytes() of each value"""
+    import numpy as np
+
+    array = np.asarray(values)
+    if (
+        array.ndim != 1
+        or array.dtype.kind not in 'iuf'
+        or (
+            not isinstance(values, np.ndarray)
+            and len({type(value) for value in values}) > 1
+        )
+    ):
+        # mixed python types keep their scalar formatting
+        return [
+            _format_nbytes_value(
+                value,
+                decimals=decimals,
+                commas=commas,
+                bibytes=bibytes,
+                **format_kwargs,
+            )
+            for value in values
+        ]
+    if (array < 0).any():
+        raise Exception('input must be non-negative')
+
+    if bibytes:
+        prefixes = _bibyte_prefixes
+    else:
+        prefixes = _byte_prefixes
+
+    # count divisions by 1024 of each value, stopping at last prefix
+    thresholds = 2.0 ** (10 * np.arange(1, len(prefixes)))
+    divisions = np.searchsorted(thresholds, array, side='right')
+    if array.dtype.kind == 'f':
+        divisions[np.isnan(array)] = 0
+
+    # divisions by powers of two are exact, so scaling in one step matches
+    # repeated division
+    output = np.empty(len(array), dtype=object)
+    undivided = np.flatnonzero(divisions == 0)
+    divided = np.flatnonzero(divisions > 0)
+    for indices, scaled in [
+        (undivided, array[undivided]),
+        (
+            divided,
+            array[divided].astype(float) / thresholds[divisions[divided] - 1],
+        ),
+    ]:
+        if len(indices) > 0:
+            output[indices] = format_numbers(
+                scaled, decimals=decimals, commas=commas, **format_kwargs
+            )
+    output = output + np.array(prefixes, dtype=object)[divisions]
+    output[array == 0] = '0B'
+    return output.tolist()  # type: ignore
+
+
 def format_timestamp(
     timestamp: tooltime.Timestamp,
     representation: tooltime.TimestampExtendedRepresentation = 'TimestampISO',
@@ -88,6 +218,120 @@ def format_timestamp(
         return str(converted)
 
 
+def format_timestamps(
+    timestamps: typing.Sequence[tooltime.Timestamp]
+    | np.ndarray[typing.Any, typing.Any],
+    representation: tooltime.TimestampExtendedRepresentation = 'TimestampISO',
+) -> list[str]:
+    """format many timestamps, output matches format_timestamp() of each
+
+    arrays of epoch seconds or datetime64 values are converted using datetime64
+    arithmetic for TimestampISO, TimestampISOPretty, and TimestampDate, and
+    other timestamps are converted one distinct value at a time
+    """
+    import numpy as np
+
+    array = np.asarray(timestamps)
+    if (
+        array.ndim == 1
+        and array.dtype.kind in 'iufM'
+        and representation in _datetime64_representations
+    ):
+        # convert to whole seconds
+        if array.dtype.kind == 'M':
+            seconds = array.astype('datetime64[s]').astype(np.int64)
+            convertible = ~np.isnat(array)
+        else:
+            seconds = _get_whole_seconds(array)
+            convertible = np.isfinite(array)
+        convertible &= (seconds >= _min_datetime64_seconds) & (
+            seconds <= _max_datetime64_seconds
+        )
+
+        # format each distinct second once
+        output = np.empty(len(array), dtype=object)
+        unique_seconds, inverse = np.unique(
+            seconds[convertible], return_inverse=True
+        )
+        unique_strs = _format_datetime64_seconds(unique_seconds, representation)
+        output[convertible] = unique_strs[inverse]
+
+        # values outside datetime64 fast path use scalar conversion
+        for index in np.flatnonzero(~convertible).tolist():
+            output[index] = _format_timestamp_cached(
+                array[index].item(), representation
+            )
+        return output.tolist()
+
+    else:
+        output_list = []
+        for timestamp in timestamps:
+            try:
+                output_list.append(
+                    _format_timestamp_cached(timestamp, representation)
+                )
+            except TypeError:
+                # unhashable timestamps
+                output_list.append(
+                    format_timestamp(timestamp, representation=representation)
+                )
+        return output_list
+
+
+_datetime64_representations = {
+    'TimestampISO',
+    'TimestampISOPretty',
+    'TimestampDate',
+}
+
+# seconds of years 1000 through 9999, which strftime renders with 4 digits
+_min_datetime64_seconds = -30610224000
+_max_datetime64_seconds = 253402300799
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp_cached(
+    timestamp: tooltime.Timestamp,
+    representation: tooltime.TimestampExtendedRepresentation,
+) -> str:
+    return format_timestamp(timestamp, representation=representation)
+
+
+def _get_whole_seconds(
+    array: np.ndarray[typing.Any, typing.Any],
+) -> np.ndarray[typing.Any, np.dtype[np.int64]]:
+    """get whole seconds of epoch times, rounding like fromtimestamp()
+
+    datetime.fromtimestamp() rounds to the nearest microsecond before
+    truncating to seconds
+    """
+    import numpy as np
+
+    if array.dtype.kind in 'iu':
+        return array.astype(np.int64)
+    with np.errstate(invalid='ignore'):
+        fraction, whole = np.modf(array.astype(float))
+        microseconds = np.round(fraction * 1e6)
+        whole = whole + (microseconds >= 1e6) - (microseconds < 0)
+        whole[~np.isfinite(whole)] = 0
+    return whole.astype(np.int64)  # type: ignore
+
+
+def _format_datetime64_seconds(
+    seconds: np.ndarray[typing.Any, np.dtype[np.int64]],
+    representation: str,
+) -> np.ndarray[typing.Any, typing.Any]:
+    import numpy as np
+
+    datetimes = seconds.astype('datetime64[s]')
+    if representation == 'TimestampDate':
+        return np.datetime_as_string(datetimes, unit='D').astype(object)
+    strs = np.char.add(np.datetime_as_string(datetimes, unit='s'), 'Z')
+    if representation == 'TimestampISOPretty':
+        strs = np.char.replace(strs, 'T', ' ')
+    return strs.astype(object)
+
+
 def format_number(
     value: typing.SupportsFloat,
     *,
@@ -177,12 +421,343 @@ def format_number(
                     fractional_decimals = 6
             decimals = fractional_decimals
 
+    format_str = _get_number_format_str(decimals, scientific, commas, signed)
+    if decimals == 0 and not scientific and not isinstance(numeric, int):
+        numeric = round(numeric)
+
+    # format
+    formatted = format_str.format(numeric)
+    formatted = _finalize_number_str(
+        formatted,
+        scientific=scientific,
+        trailing_zeros=trailing_zeros,
+        percentage=percentage,
+        prefix=prefix,
+        postfix=postfix,
+    )
+
+    if match_width is None:
+        return formatted
+    else:
+        return formatted.rjust(len(match_value))
+
+
+def format_numbers(
+    values: typing.Sequence[typing.SupportsFloat] | typing.Any,
+    *,
+    percentage: bool = False,
+    scientific: typing.Optional[bool] = None,
+    signed: bool = False,
+    commas: bool = True,
+    decimals: typing.Optional[int] = None,
+    nonfractional_decimals: typing.Optional[int] = None,
+    fractional_decimals: typing.Optional[int] = None,
+    trailing_zeros: bool | None = None,
+    prefix: typing.Optional[str] = None,
+    postfix: typing.Optional[str] = None,
+    order_of_magnitude: bool = False,
+    oom_blank: str = '',
+    nan: str = '-',
+) -> list[str]:
+    """format many numbers, output matches format_number() of each value
+
+    values are grouped by which formatting rules apply to them, so the
+    per-value work is reduced to a single str.format() call
+
+    numpy arrays are formatted like their python values, array.tolist(), so
+    integer arrays are formatted as ints, and sequences that mix python types
+    are formatted one value at a time
+    """
+    import numpy as np
+
+    array = np.asarray(values)
+    if (
+        array.ndim != 1
+        or array.dtype.kind not in 'iuf'
+        or (
+            not isinstance(values, np.ndarray)
+            and len({type(value) for value in values}) > 1
+        )
+    ):
+        # mixed python types keep their scalar formatting
+        return [
+            format_number(
+                value,
+                percentage=percentage,
+                scientific=scientific,
+                signed=signed,
+                commas=commas,
+                decimals=decimals,
+                nonfractional_decimals=nonfractional_decimals,
+                fractional_decimals=fractional_decimals,
+                trailing_zeros=trailing_zeros,
+                prefix=prefix,
+                postfix=postfix,
+                order_of_magnitude=order_of_magnitude,
+                oom_blank=oom_blank,
+                nan=nan,
+            )
+            for value in values
+        ]
+
+    n = len(array)
+    output = np.empty(n, dtype=object)
+    is_int = array.dtype.kind in 'iu'
+    if trailing_zeros is None:
+        trailing_zeros = decimals is not None or order_of_magnitude
+
+    # nan values
+    if is_int:
+        valid = np.ones(n, dtype=bool)
+    else:
+        valid = ~np.isnan(array)
+        output[~valid] = nan
+
+    # order of magnitude of each value
+    if order_of_magnitude:
+        oom_thresholds = np.array([1e3, 1e6, 1e9, 1e12, 1e15, 1e18])
+        oom_divisors = np.array([1, 1e3, 1e6, 1e9, 1e12, 1e15, 1])
+        oom_postfixes = [oom_blank, 'K', 'M', 'B', 'T', 'Q']
+        oom_index = np.searchsorted(
+            oom_thresholds, np.abs(array.astype(float)), side='right'
+        )
+
+        # values too big for an oom label fall back to scalar formatting
+        too_big = valid & (oom_index == len(oom_thresholds))
+        for index in np.flatnonzero(too_big):
+            output[index] = format_number(
+                array[index].item(),
+                percentage=percentage,
+                scientific=scientific,
+                signed=signed,
+                commas=commas,
+                decimals=decimals,
+                nonfractional_decimals=nonfractional_decimals,
+                fractional_decimals=fractional_decimals,
+                trailing_zeros=trailing_zeros,
+                prefix=prefix,
+                postfix=postfix,
+                order_of_magnitude=order_of_magnitude,
+                oom_blank=oom_blank,
+                nan=nan,
+            )
+        valid = valid & ~too_big
+        scaled = np.where(oom_index > 0, array / oom_divisors[oom_index], array)
+        if is_int:
+            scaled_is_int = oom_index == 0
+        else:
+            scaled_is_int = np.zeros(n, dtype=bool)
+    else:
+        oom_index = np.zeros(n, dtype=int)
+        scaled = array
+        scaled_is_int = np.full(n, is_int)
+
+    # determine scientific notation and decimals of each value
+    numeric = scaled * 100.0 if percentage else scaled
+    abs_numeric = np.abs(numeric)
+    if percentage:
+        value_scientific = np.zeros(n, dtype=bool)
+    elif scientific is None:
+        value_scientific = (abs_numeric < 0.0001) & (numeric != 0)
+    else:
+        value_scientific = np.full(n, bool(scientific))
+    if decimals is not None:
+        value_decimals = np.full(n, decimals)
+    else:
+        if nonfractional_decimals is None:
+            nonfractional_decimals = 2
+        if fractional_decimals is None:
+            value_fractional = np.where(value_scientific, 3, 6)
+        else:
+            value_fractional = np.full(n, fractional_decimals)
+        value_decimals = np.where(
+            abs_numeric >= 1,
+            np.where(scaled_is_int, 0, nonfractional_decimals),
+            value_fractional,
+        )
+
+    # format each group of values that share formatting rules
+    group_keys = (
+        (oom_index * 2 + value_scientific) * 2 + scaled_is_int
+    ) * 1000 + value_decimals
+    valid_indices = np.flatnonzero(valid)
+    unique_keys, group_ids = np.unique(
+        group_keys[valid_indices], return_inverse=True
+    )
+    for g, group_key in enumerate(unique_keys.tolist()):
+        group_flags, group_decimals = divmod(group_key, 1000)
+        group_oom, group_flags = divmod(group_flags, 4)
+        group_scientific, group_is_int = divmod(group_flags, 2)
+        indices = valid_indices[group_ids == g]
+
+        # build format shared by group
+        format_str = _get_number_format_str(
+            group_decimals, bool(group_scientific), commas, signed
+        )
+        group_postfix = postfix
+        if order_of_magnitude:
+            if group_postfix is None:
+                group_postfix = oom_postfixes[group_oom]
+            else:
+                group_postfix = group_postfix + oom_postfixes[group_oom]
+
+        # format values
+        if group_is_int:
+            python_values = array[indices].tolist()
+            if percentage:
+                python_values = [value * 100 for value in python_values]
+        else:
+            python_values = numeric[indices].tolist()
+        if group_decimals == 0 and not group_scientific and not group_is_int:
+            python_values = [round(value) for value in python_values]
+        formatted = [format_str.format(value) for value in python_values]
+        output[indices] = [
+            _finalize_number_str(
+                item,
+                scientific=bool(group_scientific),
+                trailing_zeros=trailing_zeros,
+                percentage=percentage,
+                prefix=prefix,
+                postfix=group_postfix,
+            )
+            for item in formatted
+        ]
+
+    return output.tolist()
+
+
+def format_aligned_numbers(
+    values: typing.Sequence[typing.SupportsFloat] | typing.Any,
+    *,
+    percentage: bool = False,
+    scientific: bool = False,
+    signed: bool = False,
+    commas: bool = True,
+    decimals: typing.Optional[int] = None,
+    nonfractional_decimals: typing.Optional[int] = None,
+    fractional_decimals: typing.Optional[int] = None,
+    trailing_zeros: bool | None = None,
+    prefix: typing.Optional[str] = None,
+    postfix: typing.Optional[str] = None,
+    order_of_magnitude: bool = False,
+    oom_blank: str = '',
+    nan: str = '-',
+) -> list[str]:
+    """format numbers to one shared layout with decimal points aligned
+
+    the column is scanned once to choose decimals shared by every value, then
+    values are formatted in batch and padded to shared integer-part and
+    fraction-part widths, with each value keeping its own order of magnitude
+    suffix
+
+    all output strs have the same width
+    """
+    import numpy as np
+
+    array = np.asarray(values)
+    if array.ndim != 1 or array.dtype.kind not in 'iuf':
+        array = np.asarray(values, dtype=float)
+    is_int = array.dtype.kind in 'iu'
+    if is_int:
+        valid = np.ones(len(array), dtype=bool)
+    else:
+        valid = ~np.isnan(array)
+    abs_values = np.abs(array[valid].astype(float))
+    if trailing_zeros is None:
+        trailing_zeros = decimals is not None or order_of_magnitude
+
+    # scale each value by its own order of magnitude
+    oom_postfixes = [oom_blank, 'K', 'M', 'B', 'T', 'Q']
+    oom_index = np.zeros(len(array), dtype=int)
+    if order_of_magnitude:
+        oom_thresholds = [1e3, 1e6, 1e9, 1e12, 1e15]
+        oom_divisors = np.array([1.0] + oom_thresholds)
+        oom_index[valid] = np.searchsorted(
+            oom_thresholds, abs_values, side='right'
+        )
+        if np.any(oom_index > 0):
+            array = array / oom_divisors[oom_index]
+            abs_values = abs_values / oom_divisors[oom_index[valid]]
+            is_int = False
+
+    # use decimals of most precise value for whole column
+    if decimals is None:
+        if is_int:
+            decimals = 0
+        else:
+            if nonfractional_decimals is None:
+                nonfractional_decimals = 2
+            if fractional_decimals is None:
+                fractional_decimals = 3 if scientific else 6
+            if percentage:
+                abs_values = abs_values * 100
+            if np.any(abs_values < 1):
+                decimals = max(nonfractional_decimals, fractional_decimals)
+            else:
+                decimals = nonfractional_decimals
+
+    formatted = format_numbers(
+        array,
+        percentage=percentage,
+        scientific=scientific,
+        signed=signed,
+        commas=commas,
+        decimals=decimals,
+        trailing_zeros=trailing_zeros,
+        nan=nan,
+    )
+
+    # split each value into integer part and remainder
+    suffix = ''
+    if percentage:
+        suffix += '%'
+        formatted = [
+            item[:-1] if is_valid else item
+            for item, is_valid in zip(formatted, valid.tolist())
+        ]
+    if postfix is not None:
+        suffix += postfix
+    int_parts = []
+    remainders = []
+    for item, is_valid, oom in zip(
+        formatted, valid.tolist(), oom_index.tolist()
+    ):
+        if not is_valid:
+            int_parts.append(item)
+            remainders.append('')
+            continue
+        int_part, point, fraction = item.partition('.')
+        if scientific and point == '':
+            int_part, point, fraction = int_part.partition('e')
+        int_parts.append(int_part)
+        if order_of_magnitude:
+            remainders.append(point + fraction + suffix + oom_postfixes[oom])
+        else:
+            remainders.append(point + fraction + suffix)
+
+    # pad parts to shared widths
+    if len(formatted) == 0:
+        return []
+    int_width = max(map(len, int_parts))
+    remainder_width = max(map(len, remainders))
+    if prefix is None:
+        prefix = ''
+    return [
+        prefix + int_part.rjust(int_width) + remainder.ljust(remainder_width)
+        for int_part, remainder in zip(int_parts, remainders)
+    ]
+
+
+def _get_number_format_str(
+    decimals: int | None,
+    scientific: bool | None,
+    commas: bool,
+    signed: bool,
+) -> str:
     if scientific:
         format_str = '{:,.' + str(decimals) + 'e}'
     elif decimals == 0:
         format_str = '{:,d}'
-        if not isinstance(numeric, int):
-            numeric = round(numeric)
     else:
         format_str = '{:,.' + str(decimals) + 'f}'
 
@@ -194,8 +769,18 @@ def format_number(
     if signed:
         format_str = format_str.replace(':', ':+')
 
-    # format
-    formatted = format_str.format(numeric)
+    return format_str
+
+
+def _finalize_number_str(
+    formatted: str,
+    *,
+    scientific: bool | None,
+    trailing_zeros: bool | None,
+    percentage: bool,
+    prefix: str | None,
+    postfix: str | None,
+) -> str:
 
     # remove trailing zeros
     if trailing_zeros is not None and not trailing_zeros:
@@ -227,10 +812,7 @@ def format_number(
     if postfix is not None:
         formatted = formatted + postfix
 
-    if match_width is None:
-        return formatted
-    else:
-        return formatted.rjust(len(match_value))
+    return formatted
 
 
 def format_change(
@@ -266,6 +848,103 @@ def format_change(
     )
 
 
+@typing.overload
+def format_changes(
+    from_values: typing.Sequence[spec.Numeric]
+    | np.ndarray[typing.Any, typing.Any],
+    to_values: typing.Sequence[spec.Numeric]
+    | np.ndarray[typing.Any, typing.Any],
+    *,
+    as_columns: typing.Literal[False] = False,
+    **format_kwargs: typing.Any,
+) -> list[str]:
+    ...
+
+
+@typing.overload
+def format_changes(
+    from_values: typing.Sequence[spec.Numeric]
+    | np.ndarray[typing.Any, typing.Any],
+    to_values: typing.Sequence[spec.Numeric]
+    | np.ndarray[typing.Any, typing.Any],
+    *,
+    as_columns: typing.Literal[True],
+    **format_kwargs: typing.Any,
+) -> tuple[list[str], list[str], list[str]]:
+    ...
+
+
+def format_changes(
+    from_values: typing.Sequence[spec.Numeric]
+    | np.ndarray[typing.Any, typing.Any],
+    to_values: typing.Sequence[spec.Numeric]
+    | np.ndarray[typing.Any, typing.Any],
+    *,
+    as_columns: bool = False,
+    **format_kwargs: typing.Any,
+) -> list[str] | tuple[list[str], list[str], list[str]]:
+    """format many changes, output matches format_change() of each pair
+
+    None values are missing, and changes from zero or to or from missing
+    values have a percent change of nan
+
+    if as_columns, return from, to, and percent change as separate columns
+    """
+    import numpy as np
+
+    from_items = _fill_missing_values(from_values)
+    to_items = _fill_missing_values(to_values)
+    from_array = np.asarray(from_items, dtype=float)
+    to_array = np.asarray(to_items, dtype=float)
+    if from_array.shape != to_array.shape or from_array.ndim != 1:
+        raise Exception('from_values and to_values must have same length')
+
+    # compute percent changes
+    with np.errstate(divide='ignore', invalid='ignore'):
+        changes = to_array / from_array - 1
+    changes = np.where(from_array == 0, np.nan, changes)
+
+    # format each column in batch
+    if format_kwargs.get('format_type', 'number') == 'number':
+        number_kwargs = {
+            key: value
+            for key, value in format_kwargs.items()
+            if key != 'format_type'
+        }
+        from_strs = format_numbers(from_items, **number_kwargs)
+        to_strs = format_numbers(to_items, **number_kwargs)
+    else:
+        from_strs = [format(value, **format_kwargs) for value in from_items]
+        to_strs = [format(value, **format_kwargs) for value in to_items]
+    change_strs = format_numbers(changes, percentage=True, signed=True)
+
+    if as_columns:
+        return from_strs, to_strs, change_strs
+
+    # join columns elementwise
+    joined = (
+        np.array(from_strs, dtype=object)
+        + ' ⟶ '
+        + np.array(to_strs, dtype=object)
+        + ' ('
+        + np.array(change_strs, dtype=object)
+        + ')'
+    )
+    return joined.tolist()  # type: ignore
+
+
+def _fill_missing_values(
+    values: typing.Sequence[spec.Numeric | None]
+    | np.ndarray[typing.Any, typing.Any],
+) -> typing.Sequence[typing.Any] | np.ndarray[typing.Any, typing.Any]:
+    """replace None values with nan, keeping the type of other values"""
+    import numpy as np
+
+    if isinstance(values, np.ndarray) and values.dtype.kind != 'O':
+        return values
+    return [np.nan if value is None else value for value in values]
+
+
 def _get_order_of_magnitude(
     value: typing.SupportsFloat,
     oom_blank: str = '',
@@ -288,3 +967,149 @@ def _get_order_of_magnitude(
         return value / 1e3, 'K'
     else:
         return value, oom_blank
+
+
+def parse_number(
+    text: str,
+    *,
+    nbytes: bool = False,
+    nan: str = '-',
+) -> float:
+    """parse number formatted by format_number() or format_nbytes()
+
+    accepts commas, scientific notation, percentages, order of magnitude
+    suffixes (K, M, B, T, Q), and byte prefixes (KB, KiB, ...)
+
+    a bare B suffix is ambiguous, format_number() uses it for billions and
+    format_nbytes() uses it for bytes, so it is parsed as billions unless
+    nbytes is True, for example parse_number('1.00B') is 1e9 but
+    parse_number(format_nbytes(1), nbytes=True) is 1
+    """
+    match = _get_number_scanner(nan).fullmatch(text)
+    if match is None:
+        raise Exception('could not parse number: ' + repr(text))
+    number, suffix = match.groups()
+    return _parse_number_groups(number, suffix, nan=nan, nbytes=nbytes)
+
+
+def parse_numbers(
+    texts: typing.Iterable[str],
+    *,
+    nbytes: bool = False,
+    nan: str = '-',
+) -> np.ndarray[typing.Any, np.dtype[np.float64]]:
+    """parse many numbers formatted by format_number() or format_nbytes()
+
+    all strs are scanned in one pass of one regex, see parse_number()
+
+    use nbytes=True for output of format_nbytes(), otherwise a bare B suffix
+    is parsed as billions
+    """
+    import operator
+    import numpy as np
+
+    texts = list(texts)
+    if len(texts) == 0:
+        return np.zeros(0)
+    text = '\n'.join(texts)
+    matches = _get_number_scanner(nan, multiline=True).findall(text)
+    if len(matches) != len(texts) or text.count('\n') + 1 != len(texts):
+        # find first str that cannot be parsed
+        for item in texts:
+            parse_number(item, nbytes=nbytes, nan=nan)
+        raise Exception('could not parse numbers')
+
+    # apply decimal suffixes to all numbers as exponents in one pass
+    numbers = list(map(operator.itemgetter(0), matches))
+    suffixes = list(map(operator.itemgetter(1), matches))
+    if nan in numbers:
+        numbers = ['nan' if number == nan else number for number in numbers]
+    scales = _get_suffix_scales(nbytes)
+    float_strs = '\n'.join(
+        map(str.__add__, numbers, [scales[suffix][0] for suffix in suffixes])
+    )
+
+    # numbers that have their own exponents are parsed one at a time, as are
+    # inf and nan followed by suffixes
+    values = None
+    if 'e' not in '\n'.join(numbers).lower():
+        try:
+            values = np.array(
+                float_strs.replace(',', '').split('\n'), dtype=float
+            )
+        except ValueError:
+            pass
+    if values is None:
+        return np.array(
+            [
+                _parse_number_groups(number, suffix, nan=nan, nbytes=nbytes)
+                for number, suffix in matches
+            ],
+            dtype=float,
+        )
+
+    # apply byte prefixes as multipliers
+    if any(scales[suffix][1] != 1 for suffix in set(suffixes)):
+        multipliers = [scales[suffix][1] for suffix in suffixes]
+        values = values * np.array(multipliers, dtype=float)
+    return values
+
+
+@functools.lru_cache(maxsize=2)
+def _get_suffix_scales(nbytes: bool) -> dict[str, tuple[str, int]]:
+    """get exponent str and multiplier of each suffix
+
+    decimal suffixes are applied as exponents so that values are correctly
+    rounded, and byte prefixes are applied as multipliers
+    """
+    scales = {
+        '': ('', 1),
+        '%': ('e-2', 1),
+        'K': ('e3', 1),
+        'M': ('e6', 1),
+        'B': ('e9', 1),
+        'T': ('e12', 1),
+        'Q': ('e15', 1),
+    }
+    for prefixes in [_byte_prefixes, _bibyte_prefixes]:
+        for p, prefix in enumerate(prefixes):
+            if prefix != 'B' or nbytes:
+                scales[prefix] = ('', 1024**p)
+    return scales
+
+
+@functools.lru_cache(maxsize=16)
+def _get_number_scanner(nan: str, multiline: bool = False) -> re.Pattern[str]:
+    """compile regex with groups (number, suffix)"""
+    pattern = (
+        r'[ \t]*('
+        + re.escape(nan)
+        + r'|[-+]?(?:[0-9]+(?:,[0-9]{3})*(?:\.[0-9]*)?|\.[0-9]+|inf|nan)'
+        + r'(?:[eE][-+]?[0-9]+)?)'
+        + r'[ \t]*([KMGTPEZY]i?B|[KMBTQ%]|)[ \t]*'
+    )
+    if multiline:
+        return re.compile('^' + pattern + '$', re.MULTILINE)
+    else:
+        return re.compile(pattern)
+
+
+def _parse_number_groups(
+    number: str,
+    suffix: str,
+    *,
+    nan: str,
+    nbytes: bool,
+) -> float:
+    if number == nan:
+        return float('nan')
+    number = number.replace(',', '')
+    shift, multiplier = _get_suffix_scales(nbytes)[suffix]
+    if shift == '' or number[-3:] in ('inf', 'nan'):
+        value = float(number)
+    else:
+        # shift decimal exponent in str so that value is correctly rounded
+        mantissa, _, exponent = number.lower().partition('e')
+        exponent = str(int(exponent or 0) + int(shift[1:]))
+        value = float(mantissa + 'e' + exponent)
+    return value * multiplier
@@ -5,6 +5,106 @@ import typing
 from .. import spec
 
 
+class Block:
+    """lines of text with cached display widths
+
+    positional helpers accept and return blocks, so that a layout built in
+    several stages splits, measures, and joins its text only once
+    """
+
+    lines: tuple[str, ...]
+    _widths: tuple[int, ...] | None
+    _str: str | None
+
+    def __init__(
+        self,
+        lines: typing.Iterable[str],
+        widths: typing.Iterable[int] | None = None,
+    ) -> None:
+        self.lines = tuple(lines)
+        if widths is not None:
+            self._widths = tuple(widths)
+            if len(self._widths) != len(self.lines):
+                raise Exception('need one width per line')
+        else:
+            self._widths = None
+        self._str = None
+
+    @classmethod
+    def from_str(cls, text: str) -> Block:
+        block = cls(text.split('\n'))
+        block._str = text
+        return block
+
+    @property
+    def widths(self) -> tuple[int, ...]:
+        """display width of each line, measured once"""
+        if self._widths is None:
+            self._widths = tuple(_get_line_width(line) for line in self.lines)
+        return self._widths
+
+    @property
+    def width(self) -> int:
+        return max(self.widths, default=0)
+
+    @property
+    def height(self) -> int:
+        return len(self.lines)
+
+    def __getitem__(self, index: slice) -> Block:
+        """get block of a slice of lines"""
+        if not isinstance(index, slice):
+            raise Exception('blocks can only be indexed by slices')
+        if self._widths is None:
+            return Block(self.lines[index])
+        else:
+            return Block(self.lines[index], self._widths[index])
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = '\n'.join(self.lines)
+        return self._str
+
+    def __rich__(self) -> str:
+        return str(self)
+
+    def __repr__(self) -> str:
+        return 'Block(' + repr(self.lines) + ')'
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, Block) and self.lines == other.lines
+
+    def __hash__(self) -> int:
+        return hash(self.lines)
+
+
+def as_block(text: str | typing.Sequence[str] | Block) -> Block:
+    """convert str or sequence of lines to Block"""
+    if isinstance(text, Block):
+        return text
+    elif isinstance(text, str):
+        return Block.from_str(text)
+    else:
+        return Block(text)
+
+
+def _get_line_width(line: str) -> int:
+    """get display width of line, skipping rich for plain ascii"""
+    if line.isascii() and line.isprintable() and '[' not in line:
+        return len(line)
+    else:
+        from . import rich_formats
+
+        return rich_formats.get_styled_width(line)
+
+
+def _get_known_widths(
+    block: Block,
+) -> tuple[int, ...] | None:
+    """get widths of block only if they have already been measured"""
+    return block._widths
+
+
 def hjustify(
     text: str,
     justification: spec.HorizontalJustification,
@@ -33,48 +133,106 @@ def hjustify(
         raise Exception('unknown justification: ' + str(justification))
 
 
+@typing.overload
 def vjustify(
     text: str,
     justification: spec.VerticalJustification,
     height: int,
 ) -> str:
+    ...
+
+
+@typing.overload
+def vjustify(
+    text: Block,
+    justification: spec.VerticalJustification,
+    height: int,
+) -> Block:
+    ...
+
+
+@typing.overload
+def vjustify(
+    text: str | Block,
+    justification: spec.VerticalJustification,
+    height: int,
+) -> str | Block:
+    ...
+
 
-    n_lines = text.count('\n') + 1
+def vjustify(
+    text: str | Block,
+    justification: spec.VerticalJustification,
+    height: int,
+) -> str | Block:
+    block = as_block(text)
+    widths = _get_known_widths(block)
 
     # check if exceeds height
-    if n_lines > height:
-        return '\n'.join(text.split('\n')[:height])
+    if block.height > height:
+        lines = block.lines[:height]
+        if widths is not None:
+            widths = widths[:height]
+        return _same_type(text, Block(lines, widths))
 
-    missing = height - n_lines
+    missing = height - block.height
     if justification == 'top':
-        return text + '\n' * missing
+        top = 0
     elif justification == 'bottom':
-        return '\n' * missing + text
+        top = missing
     elif justification == 'center':
         top = int(missing / 2)
-        bottom = missing - top
-        return '\n' * top + text + '\n' * bottom
     else:
         raise Exception('unknown justification: ' + str(justification))
+    bottom = missing - top
+    lines = ('',) * top + block.lines + ('',) * bottom
+    if widths is not None:
+        widths = (0,) * top + widths + (0,) * bottom
+    return _same_type(text, Block(lines, widths))
 
 
+@typing.overload
 def concatenate_blocks(
     blocks: typing.Sequence[str | typing.Sequence[str]],
     *,
     gap: int | str | None = None,
 ) -> str:
-    """concatenate blocks of text horizontally"""
+    ...
+
+
+@typing.overload
+def concatenate_blocks(
+    blocks: typing.Sequence[Block],
+    *,
+    gap: int | str | None = None,
+) -> Block:
+    ...
+
+
+@typing.overload
+def concatenate_blocks(
+    blocks: typing.Sequence[str | typing.Sequence[str] | Block],
+    *,
+    gap: int | str | None = None,
+) -> str | Block:
+    ...
+
+
+def concatenate_blocks(
+    blocks: typing.Sequence[str | typing.Sequence[str] | Block],
+    *,
+    gap: int | str | None = None,
+) -> str | Block:
+    """concatenate blocks of text horizontally
+
+    returns Block if any input block is a Block, otherwise returns str
+    """
 
     # split blocks into lines
-    blocks_lines: typing.MutableSequence[typing.Sequence[str]] = []
-    for block in blocks:
-        if isinstance(block, str):
-            blocks_lines.append(block.split('\n'))
-        else:
-            blocks_lines.append(block)
-    n_lines = len(blocks_lines[0])
-    for block_lines in blocks_lines:
-        if len(block_lines) != n_lines:
+    as_blocks = [as_block(block) for block in blocks]
+    n_lines = as_blocks[0].height
+    for block in as_blocks:
+        if block.height != n_lines:
             raise Exception(
                 'every block needs to have the same number of lines'
             )
@@ -89,18 +247,92 @@ def concatenate_blocks(
         raise Exception('unknown gap format: ' + str(type(gap)))
 
     # concatenate into new lines
-    new_lines = []
-    for pieces in zip(*blocks_lines):
-        new_lines.append(gap.join(pieces))
+    new_lines = [
+        gap.join(pieces) for pieces in zip(*(b.lines for b in as_blocks))
+    ]
+
+    if not any(isinstance(block, Block) for block in blocks):
+        return '\n'.join(new_lines)
 
-    return '\n'.join(new_lines)
+    # add widths of pieces if they are already known
+    blocks_widths = [_get_known_widths(block) for block in as_blocks]
+    new_widths: list[int] | None = None
+    if all(widths is not None for widths in blocks_widths):
+        gaps_width = _get_line_width(gap) * (len(as_blocks) - 1)
+        new_widths = [
+            sum(line_widths) + gaps_width
+            for line_widths in zip(*blocks_widths)
+        ]
+    return Block(new_lines, new_widths)
 
 
+@typing.overload
+def stack_blocks(blocks: typing.Sequence[str]) -> str:
+    ...
+
+
+@typing.overload
+def stack_blocks(blocks: typing.Sequence[Block]) -> Block:
+    ...
+
+
+@typing.overload
+def stack_blocks(blocks: typing.Sequence[str | Block]) -> str | Block:
+    ...
+
+
+def stack_blocks(blocks: typing.Sequence[str | Block]) -> str | Block:
+    """concatenate blocks of text vertically
+
+    returns Block if any input block is a Block, otherwise returns str
+    """
+    if not any(isinstance(block, Block) for block in blocks):
+        return '\n'.join(typing.cast(typing.Sequence[str], blocks))
+
+    as_blocks = [as_block(block) for block in blocks]
+    lines = [line for block in as_blocks for line in block.lines]
+    blocks_widths = [_get_known_widths(block) for block in as_blocks]
+    widths: list[int] | None = None
+    if all(block_widths is not None for block_widths in blocks_widths):
+        widths = [
+            width
+            for block_widths in blocks_widths
+            for width in block_widths  # type: ignore
+        ]
+    return Block(lines, widths)
+
+
+@typing.overload
 def indent_block(block: str, indent: typing.Union[str, int, None]) -> str:
+    ...
+
+
+@typing.overload
+def indent_block(
+    block: Block, indent: typing.Union[str, int, None]
+) -> Block:
+    ...
+
+
+@typing.overload
+def indent_block(
+    block: str | Block, indent: typing.Union[str, int, None]
+) -> str | Block:
+    ...
+
+
+def indent_block(
+    block: str | Block, indent: typing.Union[str, int, None]
+) -> str | Block:
     indent = indent_to_str(indent)
-    lines = block.split('\n')
-    new_lines = [indent + line for line in lines]
-    return '\n'.join(new_lines)
+    new_lines = [indent + line for line in as_block(block).lines]
+    if isinstance(block, str):
+        return '\n'.join(new_lines)
+    widths = _get_known_widths(block)
+    if widths is not None:
+        indent_width = _get_line_width(indent)
+        widths = tuple(indent_width + width for width in widths)
+    return Block(new_lines, widths)
 
 
 def indent_to_str(indent: typing.Union[str, int, None]) -> str:
@@ -116,3 +348,11 @@ def indent_to_str(indent: typing.Union[str, int, None]) -> str:
         return indent
     else:
         raise Exception('unknown indent format')
+
+
+def _same_type(text: str | Block, block: Block) -> str | Block:
+    """convert block to str if text was a str"""
+    if isinstance(text, str):
+        return str(block)
+    else:
+        return block
@@ -16,12 +16,6 @@ if typing.TYPE_CHECKING:
         'windows',
     ]
 
-    class _FormatDefaults(typing.TypedDict):
-        color_system: RichColorSystem
-
-
-_format_defaults: _FormatDefaults = {'color_system': None}
-
 
 def get_styled_width(text: str) -> int:
     import rich.text
@@ -44,7 +38,13 @@ def fit_styled_width(text: str, width: int, ellipses: bool = False) -> str:
 
 
 def set_default_color_system(color_system: RichColorSystem) -> None:
-    _format_defaults['color_system'] = color_system
+    """set process-wide default color system
+
+    contexts can override it with set_render_context(color_system=...)
+    """
+    from .. import render_context
+
+    render_context.set_default_render_context(color_system=color_system)
 
 
 def print(
@@ -56,23 +56,28 @@ def print(
 ) -> None:
     import rich.console
     import rich.theme
+    from .. import render_context
 
     if indent is not None:
         text = (
             positional_formats.indent_block(str(text[0]), indent=indent),
         ) + tuple(text[1:])
 
-    if color_system is None:
-        color_system = _format_defaults['color_system']
-
-    if color_system is not None:
-        kwargs = {'color_system': color_system}
-    else:
-        kwargs = {}
-    console = rich.console.Console(
-        theme=rich.theme.Theme(inherit=False),
-        **kwargs,  # type: ignore
-    )
+    context = render_context.get_render_context()
+    console = context['console']
+    if console is None or color_system is not None:
+        if color_system is None:
+            color_system = context['color_system']
+        kwargs: dict[str, typing.Any] = {}
+        if color_system is not None:
+            kwargs['color_system'] = color_system
+        if context['width'] is not None:
+            kwargs['width'] = context['width']
+        console = rich.console.Console(
+            theme=rich.theme.Theme(inherit=False),
+            file=context['file'],
+            **kwargs,
+        )
     console.print(*text, style=style, **rich_kwargs)
 
 
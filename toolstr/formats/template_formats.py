@@ -1,23 +1,26 @@
 """functions related to python str templates"""
 from __future__ import annotations
 
+import functools
+import re
 import typing
 
 
 def get_template_keys(template: str) -> typing.Mapping[str, str | None]:
     keys = {}
-    temp = template
-    while '{' in temp:
-        start_index = temp.index('{')
-        end_index = temp.index('}')
-        keypattern = temp[slice(start_index, end_index + 1)]
+    end_index = -1
+    while True:
+        start_index = template.find('{', end_index + 1)
+        if start_index == -1:
+            break
+        end_index = template.index('}', start_index)
+        keypattern = template[start_index + 1 : end_index]
         if ':' in keypattern:
-            name, pattern = keypattern[1:-1].split(':')
+            name, pattern = keypattern.split(':', 1)
         else:
-            name = keypattern[1:-1]
+            name = keypattern
             pattern = None
         keys[name] = pattern
-        temp = temp[end_index + 1 :]
 
     return keys
 
@@ -41,17 +44,443 @@ def template_to_regex(template: str) -> str:
     return regex
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_template_regex(template: str) -> re.Pattern[str]:
+    return re.compile(template_to_regex(template))
+
+
 #
 # # template parsing
 #
 
 
+class TemplateParser:
+    """parser of strs that follow a template, compiled once for many strs
+
+    keys with a format spec match values of that type, for example {n:d}
+    matches digits and {x:f} matches decimal numbers, other keys match
+    default_pattern, literal text matches exactly, and a key that repeats
+    must have the same value each time
+
+    example: TemplateParser('{name}_{n:d}.csv').parse('data_12.csv')
+    """
+
+    template: str
+    anchored: bool
+    keys: tuple[str, ...]
+    regex: re.Pattern[str]
+    _match: typing.Callable[[str], re.Match[str] | None]
+
+    def __init__(
+        self,
+        template: str,
+        *,
+        anchored: bool = True,
+        default_pattern: str = '[a-zA-Z0-9_]+',
+    ) -> None:
+        import string
+
+        keys: list[str] = []
+        pieces = []
+        for literal, key, spec, conversion in string.Formatter().parse(
+            template
+        ):
+            pieces.append(re.escape(literal))
+            if key is None:
+                continue
+            if key == '' or not key.isidentifier():
+                raise Exception('template keys must be names: ' + str(key))
+            if key in keys:
+                pieces.append('(?P=' + key + ')')
+            else:
+                pattern = _get_spec_pattern(spec, default_pattern)
+                pieces.append('(?P<' + key + '>' + pattern + ')')
+                keys.append(key)
+
+        self.template = template
+        self.anchored = anchored
+        self.keys = tuple(keys)
+        self.regex = re.compile(''.join(pieces))
+        if anchored:
+            self._match = self.regex.fullmatch
+        else:
+            self._match = self.regex.search
+
+    def parse(self, target: str) -> dict[str, str]:
+        """parse str, raising exception if it does not fit template"""
+        match = self._match(target)
+        if match is None:
+            raise Exception('str does not fit template')
+        return match.groupdict()
+
+    def parse_many(
+        self,
+        strs: typing.Iterable[str],
+        *,
+        columns: bool = False,
+        unique: bool = False,
+        skip_unmatched: bool = False,
+    ) -> list[dict[str, str]] | dict[str, list[str]]:
+        """parse many strs
+
+        returns a dict of each parsed str, or if columns is True, a list of
+        values for each key, with unique keeping the first of each value
+        """
+        matches = list(map(self._match, strs))
+        if None in matches:
+            if not skip_unmatched:
+                raise Exception('str does not fit template')
+            matches = [match for match in matches if match is not None]
+
+        if not columns:
+            return [match.groupdict() for match in matches]  # type: ignore
+
+        # collect values of each key, using dicts as ordered sets if unique
+        value_columns = [
+            [match.group(key) for match in matches]  # type: ignore
+            for key in self.keys
+        ]
+        if unique:
+            return {
+                key: list(dict.fromkeys(values))
+                for key, values in zip(self.keys, value_columns)
+            }
+        else:
+            return dict(zip(self.keys, value_columns))
+
+    def aggregate(
+        self,
+        strs: typing.Iterable[typing.Any],
+        aggregations: typing.Mapping[str, str | typing.Sequence[str]],
+        *,
+        skip_unmatched: bool = False,
+        n_workers: int | None = None,
+        chunk_size: int = 100000,
+    ) -> dict[str, dict[str, typing.Any]]:
+        """aggregate values of keys over strs in a single streaming pass
+
+        strs can be any iterable, including lines of a file, where trailing
+        newlines are ignored, or os.scandir() entries, where names are parsed
+
+        aggregations can be count, count_distinct, first, last, min, max,
+        lexical_min, and lexical_max, where min and max compare numerically
+
+        only running aggregates are kept, so memory does not grow with the
+        number of strs, except for count_distinct which keeps distinct values
+
+        with n_workers, chunks of chunk_size strs are aggregated in a
+        process pool and merged in order
+        """
+        key_aggregations = {
+            key: [aggregation] if isinstance(aggregation, str) else aggregation
+            for key, aggregation in aggregations.items()
+        }
+        for key in key_aggregations:
+            if key not in self.keys:
+                raise Exception('key not in template: ' + str(key))
+
+        if n_workers is None:
+            states = _aggregate_strs(
+                strs, self._match, self.keys, key_aggregations, skip_unmatched
+            )
+        else:
+            states = self._aggregate_in_processes(
+                strs, key_aggregations, skip_unmatched, n_workers, chunk_size
+            )
+
+        if states is None:
+            states = {
+                key: [None] * len(key_aggregations[key])
+                for key in key_aggregations
+            }
+        return {
+            key: {
+                aggregation: _finalize_aggregate(aggregation, state)
+                if state is not None
+                else (0 if aggregation.startswith('count') else None)
+                for aggregation, state in zip(
+                    key_aggregations[key], states[key]
+                )
+            }
+            for key in key_aggregations
+        }
+
+    def _aggregate_in_processes(
+        self,
+        strs: typing.Iterable[typing.Any],
+        aggregations: typing.Mapping[str, typing.Sequence[str]],
+        skip_unmatched: bool,
+        n_workers: int,
+        chunk_size: int,
+    ) -> dict[str, list[typing.Any]] | None:
+        import collections
+        import concurrent.futures
+        import itertools
+
+        iterator = iter(strs)
+        pending: collections.deque[
+            concurrent.futures.Future[dict[str, list[typing.Any]] | None]
+        ] = collections.deque()
+        states = None
+        with concurrent.futures.ProcessPoolExecutor(n_workers) as executor:
+            while True:
+                # keep a bounded number of chunks in flight
+                while len(pending) < 2 * n_workers:
+                    # convert items to strs, since directory entries
+                    # cannot be pickled
+                    chunk = list(
+                        map(
+                            _to_template_str,
+                            itertools.islice(iterator, chunk_size),
+                        )
+                    )
+                    if len(chunk) == 0:
+                        break
+                    pending.append(
+                        executor.submit(
+                            _aggregate_template_chunk,
+                            self.regex.pattern,
+                            self.anchored,
+                            self.keys,
+                            chunk,
+                            aggregations,
+                            skip_unmatched,
+                        )
+                    )
+                if len(pending) == 0:
+                    break
+
+                # merge chunks in order
+                chunk_states = pending.popleft().result()
+                if chunk_states is None:
+                    continue
+                elif states is None:
+                    states = chunk_states
+                else:
+                    states = {
+                        key: [
+                            _merge_aggregates(aggregation, state, other, key)
+                            for aggregation, state, other in zip(
+                                aggregations[key], states[key], other_states
+                            )
+                        ]
+                        for key, other_states in chunk_states.items()
+                    }
+        return states
+
+
+class TemplateRenderer:
+    """renderer of many strs from a template, compiled once
+
+    the template is split once into literal text and fields, and values are
+    formatted column by column, so the template is not re-parsed per str
+
+    example: TemplateRenderer('{dataset}/{chunk:05d}.parquet')
+    """
+
+    template: str
+    keys: tuple[str, ...]
+    _fields: list[tuple[str, str, str | None]]
+    _pattern: str
+
+    def __init__(self, template: str) -> None:
+        import string
+
+        # escaped braces are parsed as separate literal chunks, so merge
+        # consecutive literals into the literal before the next field
+        keys: list[str] = []
+        fields = []
+        literals = []
+        literal = ''
+        for text, key, spec, conversion in string.Formatter().parse(template):
+            literal += text.replace('%', '%%')
+            if key is None:
+                continue
+            if key == '' or not key.isidentifier():
+                raise Exception('template keys must be names: ' + str(key))
+            literals.append(literal)
+            literal = ''
+            fields.append((key, spec or '', conversion))
+            if key not in keys:
+                keys.append(key)
+        literals.append(literal)
+
+        self.template = template
+        self.keys = tuple(keys)
+        self._fields = fields
+        self._pattern = '%s'.join(literals)
+
+    def render(self, **values: typing.Any) -> str:
+        """render single str"""
+        self._check_keys(values)
+        return self._pattern % tuple(
+            _format_values([values[key]], spec, conversion)[0]
+            for key, spec, conversion in self._fields
+        )
+
+    def render_many(
+        self,
+        columns: typing.Mapping[str, typing.Iterable[typing.Any]],
+        *,
+        as_generator: bool = False,
+    ) -> list[str] | typing.Iterator[str]:
+        """render one str for each row of columns of values
+
+        columns can be lazy iterables if as_generator is True
+        """
+        import itertools
+
+        self._check_keys(columns)
+        if len(self._fields) == 0:
+            raise Exception('template has no keys')
+
+        # share each column between fields that use the same key
+        n_uses = {key: 0 for key in self.keys}
+        for key, spec, conversion in self._fields:
+            n_uses[key] += 1
+        key_columns = {
+            key: list(itertools.tee(columns[key], n_uses[key]))
+            if n_uses[key] > 1
+            else [iter(columns[key])]
+            for key in self.keys
+        }
+
+        # format each field lazily, then fill pattern row by row
+        formatted_fields = [
+            _iterate_formatted_values(
+                key_columns[key].pop(), spec, conversion
+            )
+            for key, spec, conversion in self._fields
+        ]
+        rendered = map(self._pattern.__mod__, zip(*formatted_fields))
+        if as_generator:
+            return rendered
+        else:
+            return list(rendered)
+
+    def render_product(
+        self,
+        values: typing.Mapping[str, typing.Sequence[typing.Any]],
+        *,
+        as_generator: bool = False,
+    ) -> list[str] | typing.Iterator[str]:
+        """render one str for each combination of values of keys
+
+        each value is formatted once, and combinations are ordered with the
+        first key of the template varying slowest
+        """
+        import itertools
+
+        self._check_keys(values)
+        if len(self._fields) == 0:
+            raise Exception('template has no keys')
+
+        # format values of each key once for each field that uses it
+        key_fields = {
+            key: [
+                (spec, conversion)
+                for field_key, spec, conversion in self._fields
+                if field_key == key
+            ]
+            for key in self.keys
+        }
+        formatted_keys = []
+        for key in self.keys:
+            formatted_by_field = [
+                _format_values(values[key], spec, conversion)
+                for spec, conversion in key_fields[key]
+            ]
+            formatted_keys.append(list(zip(*formatted_by_field)))
+
+        # map fields back to their key and use of that key
+        field_positions = []
+        n_used = {key: 0 for key in self.keys}
+        for key, spec, conversion in self._fields:
+            field_positions.append((self.keys.index(key), n_used[key]))
+            n_used[key] += 1
+
+        combinations = itertools.product(*formatted_keys)
+        if all(len(fields) == 1 for fields in key_fields.values()):
+            field_values: typing.Iterator[typing.Sequence[str]] = map(
+                itertools.chain.from_iterable, combinations  # type: ignore
+            )
+            field_values = map(tuple, field_values)
+        else:
+            field_values = (
+                tuple(combination[k][u] for k, u in field_positions)
+                for combination in combinations
+            )
+        rendered = map(self._pattern.__mod__, field_values)
+        if as_generator:
+            return rendered
+        else:
+            return list(rendered)
+
+    def _check_keys(self, values: typing.Mapping[str, typing.Any]) -> None:
+        for key in self.keys:
+            if key not in values:
+                raise Exception('missing values for key: ' + str(key))
+
+
+def _format_values(
+    values: typing.Iterable[typing.Any],
+    spec: str,
+    conversion: str | None,
+) -> list[str]:
+    return list(_iterate_formatted_values(values, spec, conversion))
+
+
+def _iterate_formatted_values(
+    values: typing.Iterable[typing.Any],
+    spec: str,
+    conversion: str | None,
+) -> typing.Iterator[str]:
+    """format values like str.format() formats a field"""
+    import itertools
+
+    if conversion == 'r':
+        values = map(repr, values)
+    elif conversion == 's':
+        values = map(str, values)
+    elif conversion == 'a':
+        values = map(ascii, values)
+    elif conversion is not None:
+        raise Exception('unknown conversion: ' + str(conversion))
+    if spec == '':
+        return map(str, values)
+    else:
+        return map(format, values, itertools.repeat(spec))
+
+
+def _get_spec_pattern(spec: str | None, default_pattern: str) -> str:
+    """get regex pattern of values formatted with format spec"""
+    if spec is None or spec == '':
+        return default_pattern
+    spec_type = spec[-1]
+    if spec_type in 'dn':
+        return '[-+]?[0-9]+'
+    elif spec_type in 'fFeEgG':
+        return _float_pattern
+    elif spec_type == '%':
+        return '(?:' + _float_pattern + ')%'
+    elif spec_type in 'xX':
+        return '[-+]?[0-9a-fA-F]+'
+    elif spec_type == 'b':
+        return '[-+]?[01]+'
+    elif spec_type == 'o':
+        return '[-+]?[0-7]+'
+    else:
+        return default_pattern
+
+
+_float_pattern = (
+    r'[-+]?(?:(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][-+]?[0-9]+)?|inf|nan)'
+)
+
+
 def parse_by_template(target: str, template: str) -> typing.Mapping[str, str]:
     """parse str according to template"""
-    import re
-
-    regex = template_to_regex(template)
-    match = re.search(regex, target)
+    match = _compile_template_regex(template).search(target)
     if match is None:
         raise Exception('str does not fit template')
     else:
@@ -65,19 +494,25 @@ def parse_strs_by_template(
     unique: bool = False,
 ) -> typing.Mapping[str, typing.Sequence[str]]:
     """parse strs according to template"""
-    parsed: dict[str, list[str]] = {}
+    regex = _compile_template_regex(template)
+    parsed: dict[str, dict[str, None] | list[str]] = {}
     for s in strs:
-        for k, v in parse_by_template(s, template).items():
+        match = regex.search(s)
+        if match is None:
+            raise Exception('str does not fit template')
+        for k, v in match.groupdict().items():
             if k not in parsed:
-                parsed[k] = []
-            if unique and v in parsed[k]:
-                continue
-            parsed[k].append(v)
-    return parsed
+                parsed[k] = {} if unique else []
+            values = parsed[k]
+            if isinstance(values, dict):
+                values[v] = None
+            else:
+                values.append(v)
+    return {k: list(values) for k, values in parsed.items()}
 
 
 def parse_aggregate_by_template(
-    strs: typing.Sequence[str],
+    strs: typing.Iterable[str],
     template: str,
     aggregations: typing.Mapping[str, str],
 ) -> typing.Mapping[str, str]:
@@ -85,29 +520,219 @@ def parse_aggregate_by_template(
 
     keys with multiple values should have aggregation specified
     """
-    parse_values = parse_strs_by_template(
-        strs=strs,
-        template=template,
-        unique=True,
-    )
-    output = {}
-    for key, value in parse_values.items():
-        if key in aggregations:
-            output[key] = _get_str_aggregation(value, aggregations[key])
-        elif len(value) == 1:
-            output[key] = next(iter(value))
+    regex = _compile_template_regex(template)
+    keys = tuple(regex.groupindex)
+    key_aggregations = {
+        key: [aggregations.get(key, 'single')] for key in keys
+    }
+    states = _aggregate_strs(strs, regex.search, keys, key_aggregations, False)
+    if states is None:
+        return {}
+    return {
+        key: _finalize_aggregate(key_aggregations[key][0], key_states[0])
+        for key, key_states in states.items()
+    }
+
+
+#
+# # streaming aggregation
+#
+
+def _to_template_str(item: typing.Any) -> str:
+    """use names of directory entries and contents of file lines"""
+    import os
+
+    if type(item) is not str:
+        if isinstance(item, os.DirEntry):
+            item = item.name
         else:
-            raise Exception(
-                'multiple values for key, need to aggregate: ' + str(key)
-            )
-    return output
+            item = os.fspath(item)
+    if item.endswith('\n'):
+        item = item.rstrip('\r\n')
+    return typing.cast(str, item)
+
 
+def _aggregate_strs(
+    strs: typing.Iterable[typing.Any],
+    match_str: typing.Callable[[str], re.Match[str] | None],
+    keys: typing.Sequence[str],
+    aggregations: typing.Mapping[str, typing.Sequence[str]],
+    skip_unmatched: bool,
+) -> dict[str, list[typing.Any]] | None:
+    """aggregate values of each key in one pass, keeping only running state
+
+    returns None if no strs were matched
+    """
+    for key_aggregations in aggregations.values():
+        for aggregation in key_aggregations:
+            if aggregation not in _aggregate_updaters:
+                raise Exception('invalid aggregation: ' + str(aggregation))
 
-def _get_str_aggregation(strs: typing.Sequence[str], aggregation: str) -> str:
-    if aggregation == 'max':
-        return max((float(value), value) for value in strs)[1]
-    elif aggregation == 'min':
-        return min((float(value), value) for value in strs)[1]
+    # aggregations of each key, read from regex groups by name
+    group_aggregations = [
+        (k, aggregations.get(key, ())) for k, key in enumerate(keys)
+    ]
+    group_aggregations = [
+        (k, key_aggregations)
+        for k, key_aggregations in group_aggregations
+        if len(key_aggregations) > 0
+    ]
+    group_states: list[list[typing.Any]] = [
+        [None] * len(key_aggregations)
+        for k, key_aggregations in group_aggregations
+    ]
+    group_updaters = [
+        (
+            keys[k],
+            states,
+            [_aggregate_updaters[name] for name in key_aggregations],
+        )
+        for (k, key_aggregations), states in zip(
+            group_aggregations, group_states
+        )
+    ]
+
+    matched = False
+    for item in strs:
+        if type(item) is not str or item.endswith('\n'):
+            item = _to_template_str(item)
+
+        match = match_str(item)
+        if match is None:
+            if skip_unmatched:
+                continue
+            raise Exception('str does not fit template')
+        matched = True
+        for key, states, updaters in group_updaters:
+            value = match.group(key)
+            for a, update in enumerate(updaters):
+                states[a] = update(states[a], value, key)
+
+    if not matched:
+        return None
+    return {
+        keys[k]: states
+        for (k, key_aggregations), states in zip(
+            group_aggregations, group_states
+        )
+    }
+
+
+def _aggregate_template_chunk(
+    pattern: str,
+    anchored: bool,
+    keys: typing.Sequence[str],
+    chunk: typing.Sequence[typing.Any],
+    aggregations: typing.Mapping[str, typing.Sequence[str]],
+    skip_unmatched: bool,
+) -> dict[str, list[typing.Any]] | None:
+    regex = re.compile(pattern)
+    if anchored:
+        match_str = regex.fullmatch
     else:
-        raise Exception('invalid aggregation: ' + str(aggregation))
+        match_str = regex.search
+    return _aggregate_strs(
+        chunk, match_str, keys, aggregations, skip_unmatched
+    )
+
+
+def _update_count(state: int | None, value: str, key: str) -> int:
+    return 1 if state is None else state + 1
+
+
+def _update_count_distinct(
+    state: set[str] | None, value: str, key: str
+) -> set[str]:
+    if state is None:
+        state = set()
+    state.add(value)
+    return state
+
+
+def _update_first(state: str | None, value: str, key: str) -> str:
+    return value if state is None else state
+
+
+def _update_last(state: str | None, value: str, key: str) -> str:
+    return value
+
+
+def _update_min(
+    state: tuple[float, str] | None, value: str, key: str
+) -> tuple[float, str]:
+    candidate = (float(value), value)
+    return candidate if state is None or candidate < state else state
+
 
+def _update_max(
+    state: tuple[float, str] | None, value: str, key: str
+) -> tuple[float, str]:
+    candidate = (float(value), value)
+    return candidate if state is None or candidate > state else state
+
+
+def _update_lexical_min(state: str | None, value: str, key: str) -> str:
+    return value if state is None or value < state else state
+
+
+def _update_lexical_max(state: str | None, value: str, key: str) -> str:
+    return value if state is None or value > state else state
+
+
+def _update_single(state: str | None, value: str, key: str) -> str:
+    if state is not None and state != value:
+        raise Exception(
+            'multiple values for key, need to aggregate: ' + str(key)
+        )
+    return value
+
+
+_aggregate_updaters: dict[
+    str, typing.Callable[[typing.Any, str, str], typing.Any]
+] = {
+    'count': _update_count,
+    'count_distinct': _update_count_distinct,
+    'first': _update_first,
+    'last': _update_last,
+    'min': _update_min,
+    'max': _update_max,
+    'lexical_min': _update_lexical_min,
+    'lexical_max': _update_lexical_max,
+    'single': _update_single,
+}
+
+
+def _merge_aggregates(
+    aggregation: str,
+    state: typing.Any,
+    other: typing.Any,
+    key: str,
+) -> typing.Any:
+    """merge state of earlier strs with state of later strs"""
+    if state is None:
+        return other
+    elif other is None:
+        return state
+    elif aggregation == 'count':
+        return state + other
+    elif aggregation == 'count_distinct':
+        return state | other
+    elif aggregation == 'first':
+        return state
+    elif aggregation == 'last':
+        return other
+    elif aggregation in ('min', 'lexical_min'):
+        return min(state, other)
+    elif aggregation in ('max', 'lexical_max'):
+        return max(state, other)
+    else:
+        return _update_single(state, other, key)
+
+
+def _finalize_aggregate(aggregation: str, state: typing.Any) -> typing.Any:
+    if aggregation == 'count_distinct':
+        return len(state)
+    elif aggregation in ('min', 'max'):
+        return state[1]
+    else:
+        return state
@@ -16,12 +16,9 @@ def print_horizontal_line(
 ) -> None:
 
     if n is None:
-        try:
-            import subprocess
+        from .. import render_context
 
-            n = int(subprocess.check_output('tput cols', shell=True))
-        except Exception:
-            n = 80
+        n = render_context._get_render_width()
 
     if character == 'bottom':
         char = '▁'
@@ -37,7 +34,7 @@ def print_horizontal_line(
 
 
 def print_outlined_text(
-    text: str,
+    text: str | formats.Block,
     *,
     width: typing.Optional[int] = None,
     justify: typing.Optional[spec.HorizontalJustification] = None,
@@ -130,6 +127,7 @@ def print_header(
     formats.print(as_str)
 
 
+@typing.overload
 def get_outlined_text(
     text: str,
     *,
@@ -148,12 +146,60 @@ def get_outlined_text(
     style: str | None = None,
     **border_style: typing.Any,
 ) -> str:
+    ...
+
+
+@typing.overload
+def get_outlined_text(
+    text: formats.Block,
+    *,
+    width: typing.Optional[int] = None,
+    justify: typing.Optional[spec.HorizontalJustification] = None,
+    upper_border: typing.Optional[bool] = None,
+    lower_border: typing.Optional[bool] = None,
+    left_border: typing.Optional[bool] = None,
+    right_border: typing.Optional[bool] = None,
+    pad: typing.Optional[int] = None,
+    upper_pad: typing.Optional[int] = None,
+    lower_pad: typing.Optional[int] = None,
+    left_pad: typing.Optional[int] = None,
+    right_pad: typing.Optional[int] = None,
+    text_style: str | None = None,
+    style: str | None = None,
+    **border_style: typing.Any,
+) -> formats.Block:
+    ...
+
+
+def get_outlined_text(
+    text: str | formats.Block,
+    *,
+    width: typing.Optional[int] = None,
+    justify: typing.Optional[spec.HorizontalJustification] = None,
+    upper_border: typing.Optional[bool] = None,
+    lower_border: typing.Optional[bool] = None,
+    left_border: typing.Optional[bool] = None,
+    right_border: typing.Optional[bool] = None,
+    pad: typing.Optional[int] = None,
+    upper_pad: typing.Optional[int] = None,
+    lower_pad: typing.Optional[int] = None,
+    left_pad: typing.Optional[int] = None,
+    right_pad: typing.Optional[int] = None,
+    text_style: str | None = None,
+    style: str | None = None,
+    **border_style: typing.Any,
+) -> str | formats.Block:
+    """outline text with borders and padding
+
+    returns Block if text is a Block, otherwise returns str
+    """
 
     # set defaults
     if justify is None:
         justify = 'left'
 
-    text_lines = text.split('\n')
+    block = formats.as_block(text)
+    text_lines = list(block.lines)
 
     # process padding
     if pad is not None:
@@ -171,10 +217,12 @@ def get_outlined_text(
         right_pad = 0
     left_pad_str = left_pad * ' '
     right_pad_str = right_pad * ' '
-    if upper_pad is not None:
-        text_lines = [''] * upper_pad + text_lines
-    if lower_pad is not None:
-        text_lines = text_lines + [''] * lower_pad
+    if upper_pad is None:
+        upper_pad = 0
+    if lower_pad is None:
+        lower_pad = 0
+    text_lines = [''] * upper_pad + text_lines + [''] * lower_pad
+    text_widths = [0] * upper_pad + list(block.widths) + [0] * lower_pad
 
     # compute widths
     if left_border and right_border:
@@ -185,9 +233,7 @@ def get_outlined_text(
         border_width = 0
     pad_width = left_pad + right_pad
     if width is None:
-        max_line_width = max(
-            formats.get_styled_width(line) for line in text_lines
-        )
+        max_line_width = max(text_widths)
         width = border_width + pad_width + max_line_width
     text_width = width - border_width - pad_width
 
@@ -213,18 +259,17 @@ def get_outlined_text(
         lower_right_postfix = ''
 
     # add upper border
-    outlined = ''
+    outlined = []
     if upper_border:
-        outlined = (
+        outlined.append(
             upper_left_prefix
             + (text_width + pad_width) * border_chars['horizontal']
             + upper_right_postfix
-            + '\n'
         )
 
     # add text
-    for line in text_lines:
-        if formats.get_styled_width(line) > text_width:
+    for line, line_width in zip(text_lines, text_widths):
+        if line_width > text_width:
             line = line[: text_width - 3] + '...'
 
         if text_style is not None:
@@ -247,24 +292,35 @@ def get_outlined_text(
             + right_pad_str
             + middle_right_postfix
         )
-        line = line.rstrip()
-
-        outlined += line + '\n'
+        outlined.append(line.rstrip())
 
     # add lower border
     if lower_border:
-        outlined += (
+        outlined.append(
             lower_left_prefix
             + (text_width + pad_width) * border_chars['horizontal']
             + lower_right_postfix
         )
 
-    outlined = outlined.rstrip()
+    # remove trailing whitespace
+    while len(outlined) > 0 and outlined[-1].rstrip() == '':
+        outlined.pop()
+    if len(outlined) > 0:
+        outlined[-1] = outlined[-1].rstrip()
+    else:
+        outlined.append('')
 
-    if style is not None:
-        outlined = formats.add_style(outlined, style)
+    if isinstance(text, str):
+        return formats.add_style('\n'.join(outlined), style)
 
-    return outlined
+    # style spans all lines, so measure lines before adding style
+    outlined_block = formats.Block(outlined)
+    if style is not None and style != '':
+        outlined_block = formats.Block(
+            formats.add_style(str(outlined_block), style).split('\n'),
+            outlined_block.widths,
+        )
+    return outlined_block
 
 
 def get_text_box_str(
@@ -0,0 +1,229 @@
+"""opt-in cache of rendered tables and charts
+
+keys are fixed-size digests of the inputs plus the normalized options, so
+re-rendering identical inputs returns the previously rendered str
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    import hashlib
+
+    from typing_extensions import TypedDict
+
+    # name of render, digest of inputs, and objects compared by equality
+    RenderKey = typing.Tuple[str, bytes, typing.Tuple[typing.Any, ...]]
+
+    class RenderCacheStats(TypedDict):
+        enabled: bool
+        hits: int
+        misses: int
+        evictions: int
+        n_entries: int
+        n_bytes: int
+        max_entries: int
+        max_bytes: int
+
+
+_lock = threading.Lock()
+_entries: collections.OrderedDict[RenderKey, str] = (
+    collections.OrderedDict()
+)
+_stats: RenderCacheStats = {
+    'enabled': False,
+    'hits': 0,
+    'misses': 0,
+    'evictions': 0,
+    'n_entries': 0,
+    'n_bytes': 0,
+    'max_entries': 256,
+    'max_bytes': 16 * 1024 * 1024,
+}
+
+
+class _Unfingerprintable(Exception):
+    pass
+
+
+def enable_render_cache(
+    *,
+    max_entries: int = 256,
+    max_bytes: int = 16 * 1024 * 1024,
+) -> None:
+    """cache rendered tables and charts, evicting least recently used"""
+    with _lock:
+        _stats['enabled'] = True
+        _stats['max_entries'] = max_entries
+        _stats['max_bytes'] = max_bytes
+        _evict()
+
+
+def disable_render_cache() -> None:
+    """stop caching rendered tables and charts, and clear cache"""
+    with _lock:
+        _stats['enabled'] = False
+    clear_render_cache()
+
+
+def clear_render_cache() -> None:
+    with _lock:
+        _entries.clear()
+        _stats['n_entries'] = 0
+        _stats['n_bytes'] = 0
+
+
+def get_render_cache_stats() -> RenderCacheStats:
+    """get hit and miss counters and current size of render cache"""
+    with _lock:
+        return _stats.copy()
+
+
+def _get_render_key(
+    name: str,
+    *args: typing.Any,
+    **options: typing.Any,
+) -> RenderKey | None:
+    """get cache key of render inputs, or None if they should not be cached"""
+    import hashlib
+
+    from . import render_context
+
+    if not _stats['enabled']:
+        return None
+    if not render_context.get_render_context()['use_render_cache']:
+        return None
+    hasher = hashlib.blake2b(digest_size=16)
+    refs: list[typing.Any] = []
+    try:
+        _update_fingerprint(hasher, args, refs)
+        _update_fingerprint(hasher, options, refs)
+        key = (name, hasher.digest(), tuple(refs))
+        hash(key)
+    except (_Unfingerprintable, TypeError):
+        return None
+    return key
+
+
+def _get_cached_render(key: RenderKey) -> str | None:
+    with _lock:
+        rendered = _entries.get(key)
+        if rendered is None:
+            _stats['misses'] += 1
+        else:
+            _stats['hits'] += 1
+            _entries.move_to_end(key)
+        return rendered
+
+
+def _cache_render(key: RenderKey, rendered: str) -> None:
+    with _lock:
+        if not _stats['enabled'] or key in _entries:
+            return
+        n_bytes = _get_n_bytes(key, rendered)
+        if n_bytes > _stats['max_bytes']:
+            return
+        _entries[key] = rendered
+        _stats['n_entries'] += 1
+        _stats['n_bytes'] += n_bytes
+        _evict()
+
+
+def _evict() -> None:
+    while (
+        _stats['n_entries'] > _stats['max_entries']
+        or _stats['n_bytes'] > _stats['max_bytes']
+    ):
+        key, rendered = _entries.popitem(last=False)
+        _stats['n_entries'] -= 1
+        _stats['n_bytes'] -= _get_n_bytes(key, rendered)
+        _stats['evictions'] += 1
+
+
+def _get_n_bytes(key: RenderKey, rendered: str) -> int:
+    """get size of cache entry, counting its key and referenced objects"""
+    import sys
+
+    name, digest, refs = key
+    return (
+        sys.getsizeof(rendered)
+        + sys.getsizeof(key)
+        + sys.getsizeof(name)
+        + sys.getsizeof(digest)
+        + sys.getsizeof(refs)
+        + sum(map(sys.getsizeof, refs))
+    )
+
+
+# scalars whose repr is unambiguous and determines how they render
+_repr_types = {type(None), str, int, float, bool, bytes}
+
+
+def _update_fingerprint(
+    hasher: hashlib.blake2b,
+    value: typing.Any,
+    refs: list[typing.Any],
+) -> None:
+    """add value to digest of render inputs
+
+    - builtin scalars are digested by repr, which includes their type and
+      distinguishes values like 1, 1.0, True, -0.0, and nan
+    - numpy arrays are digested by their dtype, shape, and buffer, and numpy
+      scalars by their type and repr
+    - functions and other objects are appended to refs, so that cache keys
+      hold a reference to them and compare them by equality, which prevents
+      ids of garbage collected functions from being reused
+    """
+    value_type = type(value)
+    if value_type in _repr_types:
+        hasher.update(repr(value).encode() + b'\x00')
+
+    elif value_type is list or value_type is tuple:
+        if set(map(type, value)) <= _repr_types:
+            # digest flat sequences such as rows of cells in one pass
+            hasher.update(repr(value).encode() + b'\x00')
+        else:
+            hasher.update(b'[%d\x00' % len(value))
+            for item in value:
+                _update_fingerprint(hasher, item, refs)
+            hasher.update(b']\x00')
+
+    elif isinstance(value, dict):
+        hasher.update(b'{%d\x00' % len(value))
+        for key, item in sorted(value.items(), key=lambda pair: str(pair[0])):
+            _update_fingerprint(hasher, key, refs)
+            _update_fingerprint(hasher, item, refs)
+        hasher.update(b'}\x00')
+
+    elif value_type.__name__ == '_ColumnarRows':
+        hasher.update(b'columns\x00')
+        _update_fingerprint(hasher, value.columns, refs)
+
+    elif value_type.__name__ in ('ndarray', 'memmap'):
+        import numpy as np
+
+        if value.dtype.kind == 'O':
+            hasher.update(b'object_array\x00')
+            _update_fingerprint(hasher, value.tolist(), refs)
+        else:
+            header = repr(('ndarray', value.dtype.str, value.shape))
+            hasher.update(header.encode())
+            hasher.update(np.ascontiguousarray(value).view(np.uint8).data)
+
+    elif value_type.__module__ == 'numpy':
+        # numpy scalars
+        hasher.update((value_type.__name__ + repr(value)).encode() + b'\x00')
+
+    elif isinstance(value, (list, tuple)):
+        _update_fingerprint(hasher, list(value), refs)
+
+    else:
+        try:
+            hash(value)
+        except TypeError:
+            raise _Unfingerprintable()
+        hasher.update(b'ref\x00')
+        refs.append(value)
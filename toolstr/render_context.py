@@ -0,0 +1,128 @@
+"""context-local settings of rendering and printing
+
+process-wide defaults can be overridden in a contextvars.ContextVar, so each
+thread and each asyncio task can render with its own settings without locks
+
+settings are never mutated in place, each change stores a new dict
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import typing
+
+if typing.TYPE_CHECKING:
+    import rich.console
+    from typing_extensions import TypedDict
+
+    from .formats.rich_formats import RichColorSystem
+
+    class RenderContext(TypedDict):
+        color_system: RichColorSystem
+        width: int | None
+        file: typing.TextIO | None
+        console: rich.console.Console | None
+        number_format: typing.Mapping[str, typing.Any] | None
+        use_render_cache: bool
+
+
+# process-wide defaults, replaced rather than mutated when changed
+_default_render_context: RenderContext = {
+    'color_system': None,
+    'width': None,
+    'file': None,
+    'console': None,
+    'number_format': None,
+    'use_render_cache': True,
+}
+
+# settings overridden by current context, or None to use defaults
+_render_context: contextvars.ContextVar[
+    typing.Mapping[str, typing.Any] | None
+] = contextvars.ContextVar('toolstr_render_context', default=None)
+
+
+def get_render_context() -> RenderContext:
+    """get render settings of current context
+
+    - color_system: color system of rich consoles, or None for rich default
+    - width: width of output, or None to use terminal width
+    - file: file to print to, or None for stdout
+    - console: rich console to print to, overriding file and color_system
+    - number_format: default format kwargs of numbers in tables
+    - use_render_cache: whether renders can use the render cache
+    """
+    overrides = _render_context.get()
+    if overrides is None:
+        return _default_render_context
+    else:
+        return typing.cast(
+            'RenderContext', dict(_default_render_context, **overrides)
+        )
+
+
+def set_default_render_context(**settings: typing.Any) -> None:
+    """set process-wide default render settings
+
+    defaults are used by every thread and task, except for settings that
+    their context overrides with set_render_context() or use_render_context()
+    """
+    global _default_render_context
+
+    _check_render_settings(settings)
+    _default_render_context = typing.cast(
+        'RenderContext', dict(_default_render_context, **settings)
+    )
+
+
+def set_render_context(**settings: typing.Any) -> None:
+    """override render settings in current context
+
+    overrides are inherited by asyncio tasks created afterwards, but not by
+    other threads, see get_render_context() for settings
+    """
+    _render_context.set(_update_render_overrides(settings))
+
+
+@contextlib.contextmanager
+def use_render_context(
+    **settings: typing.Any,
+) -> typing.Iterator[RenderContext]:
+    """override render settings in current context within a with block
+
+    example: with toolstr.use_render_context(color_system='truecolor'):
+    """
+    token = _render_context.set(_update_render_overrides(settings))
+    try:
+        yield get_render_context()
+    finally:
+        _render_context.reset(token)
+
+
+def _check_render_settings(settings: typing.Mapping[str, typing.Any]) -> None:
+    for key in settings.keys():
+        if key not in _default_render_context:
+            raise Exception('unknown render setting: ' + str(key))
+
+
+def _update_render_overrides(
+    settings: typing.Mapping[str, typing.Any],
+) -> typing.Mapping[str, typing.Any]:
+    _check_render_settings(settings)
+    overrides = _render_context.get()
+    if overrides is None:
+        return dict(settings)
+    else:
+        return dict(overrides, **settings)
+
+
+def _get_render_width() -> int:
+    """get width of output from context, or else from terminal"""
+    width = get_render_context()['width']
+    if width is not None:
+        return width
+    else:
+        import shutil
+
+        return shutil.get_terminal_size().columns
@@ -1,3 +1,4 @@
 from .nested_summary import *
 from .set_summary import *
+from .table_summary import *
 
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+    import polars as pl
+    import rich.console
+
+    from ..tables.table_utils import Style
+
+    Rows = typing.Sequence[typing.Sequence[typing.Any]]
+
+    class ChangedRow(typing.TypedDict):
+        key: typing.Any
+        old_row: typing.Sequence[typing.Any]
+        new_row: typing.Sequence[typing.Any]
+        changed_columns: list[int]
+
+    class TableDiff(typing.TypedDict):
+        labels: typing.Sequence[str] | None
+        added: list[typing.Sequence[typing.Any]]
+        removed: list[typing.Sequence[typing.Any]]
+        changed: list[ChangedRow]
+        n_unchanged: int
+
+
+def get_table_diff(
+    old_rows: Rows | pl.DataFrame | pd.DataFrame,
+    new_rows: Rows | pl.DataFrame | pd.DataFrame,
+    *,
+    key: str | int | typing.Sequence[str | int],
+    labels: typing.Sequence[str] | None = None,
+) -> TableDiff:
+    """compare two tables by joining their rows on key columns
+
+    rows are matched by key rather than by position, so inserting a row only
+    marks that row as added, and the join takes linear time
+    """
+    old_rows, old_labels = _get_rows_and_labels(old_rows, labels)
+    new_rows, new_labels = _get_rows_and_labels(new_rows, labels)
+    if old_labels != new_labels:
+        raise Exception('tables have different columns')
+    labels = new_labels
+    key_indices = _get_key_indices(key, labels)
+
+    # index old rows by key
+    old_by_key: dict[typing.Any, typing.Sequence[typing.Any]] = {}
+    for old_row in old_rows:
+        if old_row is None:
+            continue
+        old_key = _get_row_key(old_row, key_indices)
+        if old_key in old_by_key:
+            raise Exception('duplicate key in old rows: ' + str(old_key))
+        old_by_key[old_key] = old_row
+
+    # probe index with new rows
+    added: list[typing.Sequence[typing.Any]] = []
+    changed: list[ChangedRow] = []
+    matched = set()
+    n_unchanged = 0
+    for new_row in new_rows:
+        if new_row is None:
+            continue
+        new_key = _get_row_key(new_row, key_indices)
+        if new_key in matched:
+            raise Exception('duplicate key in new rows: ' + str(new_key))
+        matched_row = old_by_key.get(new_key)
+        if matched_row is None:
+            added.append(new_row)
+            continue
+        old_row = matched_row
+        matched.add(new_key)
+        if tuple(old_row) == tuple(new_row):
+            n_unchanged += 1
+            continue
+        changed_columns = [
+            c
+            for c, (old_cell, new_cell) in enumerate(zip(old_row, new_row))
+            if not _cells_equal(old_cell, new_cell)
+        ]
+        if len(changed_columns) == 0:
+            n_unchanged += 1
+        else:
+            changed.append(
+                {
+                    'key': new_key,
+                    'old_row': old_row,
+                    'new_row': new_row,
+                    'changed_columns': changed_columns,
+                }
+            )
+
+    removed = [
+        old_row
+        for old_key, old_row in old_by_key.items()
+        if old_key not in matched
+    ]
+
+    return {
+        'labels': labels,
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+        'n_unchanged': n_unchanged,
+    }
+
+
+def print_table_diff(
+    old_rows: Rows | pl.DataFrame | pd.DataFrame,
+    new_rows: Rows | pl.DataFrame | pd.DataFrame,
+    *,
+    key: str | int | typing.Sequence[str | int],
+    labels: typing.Sequence[str] | None = None,
+    added_style: str | None = 'green',
+    removed_style: str | None = 'red',
+    changed_style: str | None = 'bold yellow',
+    style: Style | None = None,
+    return_str: bool = False,
+    file: typing.TextIO | None = None,
+    console: rich.console.Console | None = None,
+    **table_kwargs: typing.Any,
+) -> str | None:
+    """print rows that were added, removed, or changed between two tables
+
+    changed cells are shown as old → new and highlighted with changed_style,
+    changed rows are listed in new order, then added rows in new order, then
+    removed rows in old order
+
+    style is used for cells that are not styled as added, removed, or changed
+    """
+    from .. import render_context
+    from ..tables import style_rules
+    from ..tables import table_utils
+
+    if style_rules._is_style_rule(style):
+        raise Exception(
+            'print_table_diff() does not support style rules for style, use'
+            ' column_styles instead'
+        )
+
+    diff = get_table_diff(old_rows, new_rows, key=key, labels=labels)
+    key_indices = _get_key_indices(key, diff['labels'])
+    if diff['labels'] is not None:
+        diff_labels: list[str] | None = ['change'] + list(diff['labels'])
+    else:
+        diff_labels = None
+
+    # format changed cells like the other cells of their column
+    if len(diff['changed']) > 0:
+        n_columns = len(diff['changed'][0]['new_row']) + 1
+    else:
+        n_columns = 0
+    format = table_kwargs.get('format')
+    if format is None:
+        format = render_context.get_render_context()['number_format']
+    column_formats = table_utils._convert_column_dict_to_list(
+        table_kwargs.get('column_formats'), n_columns, diff_labels
+    )
+    empty_str = table_kwargs.get('empty_str', '')
+
+    # build rows of changes
+    rows: list[list[typing.Any]] = []
+    changed_columns: dict[typing.Any, set[int]] = {}
+    for changed_row in diff['changed']:
+        row = ['changed'] + list(changed_row['new_row'])
+        old_row = changed_row['old_row']
+        for c in changed_row['changed_columns']:
+            if column_formats is not None:
+                cell_formats = [column_formats[c + 1]] * 2
+            else:
+                cell_formats = None
+            old_str, new_str = table_utils._stringify_cells(
+                [old_row[c], row[c + 1]], format, cell_formats, empty_str
+            )
+            row[c + 1] = old_str + ' → ' + new_str
+        changed_columns[changed_row['key']] = set(
+            changed_row['changed_columns']
+        )
+        rows.append(row)
+    for change, diff_rows in [
+        ('added', diff['added']),
+        ('removed', diff['removed']),
+    ]:
+        for diff_row in diff_rows:
+            rows.append([change] + list(diff_row))
+    n_columns = len(rows[0]) if len(rows) > 0 else 0
+
+    # style by change cell of each row, which survives sorting and limiting
+    def get_change_style(
+        context: table_utils.TableStyleContext,
+    ) -> str | None:
+        row = context['row']
+        offset = len(row) - n_columns
+        c = context['c'] - offset
+        if c < 0:
+            return None
+        change = row[offset]
+        if change == 'added':
+            return added_style
+        elif change == 'removed':
+            return removed_style
+        elif change == 'changed':
+            if c == 0:
+                return changed_style
+            row_key = _get_row_key(row[offset + 1 :], key_indices)
+            if c - 1 in changed_columns.get(row_key, ()):
+                return changed_style
+        return None
+
+    # fall back to style for cells without a change style
+    def get_style(context: table_utils.TableStyleContext) -> str | None:
+        cell_style = get_change_style(context)
+        if cell_style is not None or style is None:
+            return cell_style
+        elif isinstance(style, str):
+            return style
+        else:
+            return style(context)  # type: ignore
+
+    # render summary and table together so they share an output destination
+    diff_str = (
+        str(len(diff['added']))
+        + ' added, '
+        + str(len(diff['removed']))
+        + ' removed, '
+        + str(len(diff['changed']))
+        + ' changed, '
+        + str(diff['n_unchanged'])
+        + ' unchanged'
+    )
+    if len(rows) > 0:
+        table_str = table_utils.print_table(
+            rows,
+            labels=diff_labels,
+            style=get_style,
+            return_str=True,
+            **table_kwargs,
+        )
+        diff_str = diff_str + '\n\n' + str(table_str)
+
+    if return_str:
+        return diff_str
+    else:
+        use_styles = table_utils._should_use_styles(
+            table_kwargs.get('use_styles')
+        )
+        table_utils._print_table(diff_str, use_styles, console, file)
+        return None
+
+
+def _get_rows_and_labels(
+    rows: Rows | pl.DataFrame | pd.DataFrame,
+    labels: typing.Sequence[str] | None,
+) -> tuple[Rows, typing.Sequence[str] | None]:
+    from ..tables import table_adapters
+
+    if table_adapters._is_polars_dataframe(
+        rows
+    ) or table_adapters._is_pandas_dataframe(rows):
+        return table_adapters._dataframe_to_rows(rows, include_index=False)
+    else:
+        return rows, labels  # type: ignore
+
+
+def _get_key_indices(
+    key: str | int | typing.Sequence[str | int],
+    labels: typing.Sequence[str] | None,
+) -> list[int]:
+    if isinstance(key, (str, int)):
+        key = [key]
+    indices = []
+    for column in key:
+        if isinstance(column, int):
+            indices.append(column)
+        elif labels is None:
+            raise Exception('must specify labels to use str key')
+        elif column not in labels:
+            raise Exception('key column not in labels: ' + str(column))
+        else:
+            indices.append(list(labels).index(column))
+    return indices
+
+
+def _get_row_key(
+    row: typing.Sequence[typing.Any],
+    key_indices: typing.Sequence[int],
+) -> typing.Any:
+    if len(key_indices) == 1:
+        return row[key_indices[0]]
+    else:
+        return tuple(row[index] for index in key_indices)
+
+
+def _cells_equal(old_cell: typing.Any, new_cell: typing.Any) -> bool:
+    """whether cells are equal, treating missing floats as equal"""
+    if old_cell is new_cell:
+        return True
+    try:
+        if old_cell == new_cell:
+            return True
+        return old_cell != old_cell and new_cell != new_cell  # type: ignore
+    except (TypeError, ValueError):
+        return False
@@ -1,3 +1,5 @@
+from .async_tables import *
 from .table_adapters import *
 from .table_utils import *
 from .multiline_tables import *
+from .style_rules import *
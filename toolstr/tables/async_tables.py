@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+    import rich.console
+
+from .. import render_context
+from . import multiline_tables
+from . import table_utils
+
+
+_unsupported_stream_kwargs = [
+    'footer',
+    'footer_row',
+    'limit_rows',
+    'sort_column',
+    'sort_key',
+    'separate_all_rows',
+    'fold_columns',
+    'row_indices',
+    'return_str',
+]
+
+
+async def aprint_table(
+    rows: typing.AsyncIterable[typing.Sequence[typing.Any]]
+    | typing.Iterable[typing.Sequence[typing.Any]],
+    labels: typing.Sequence[str] | None = None,
+    *,
+    batch_size: int = 1000,
+    sample_rows: int | None = None,
+    total_rows: int | None = None,
+    column_widths: typing.Sequence[int] | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_rows: int | None = 1000,
+    write: typing.Callable[[str], typing.Any] | None = None,
+    file: typing.TextIO | None = None,
+    console: rich.console.Console | None = None,
+    **table_kwargs: typing.Any,
+) -> None:
+    """print table from async iterator of rows, printing batches as they arrive
+
+    column widths are fixed before output starts, either given by
+    column_widths or measured from the first sample_rows rows, and wider
+    cells in later rows are trimmed
+
+    the row index column is sized for total_rows rows, which defaults to
+    len(rows) when rows has a length, and otherwise to the sample size
+
+    write can be a function or coroutine function that receives each chunk
+    of output; by default chunks are printed like print_table()
+    """
+    import inspect
+
+    use_styles = table_utils._should_use_styles(table_kwargs.get('use_styles'))
+    table_kwargs = dict(table_kwargs, use_styles=use_styles)
+
+    async for lines in _agenerate_line_batches(
+        rows,
+        labels,
+        batch_size=batch_size,
+        sample_rows=sample_rows,
+        total_rows=total_rows,
+        column_widths=column_widths,
+        executor=executor,
+        offload_rows=offload_rows,
+        table_kwargs=table_kwargs,
+    ):
+        if len(lines) == 0:
+            continue
+        chunk = '\n'.join(lines)
+        if write is not None:
+            result = write(chunk + '\n')
+            if inspect.isawaitable(result):
+                await result
+        else:
+            table_utils._print_table(chunk, use_styles, console, file)
+
+
+async def agenerate_table_lines(
+    rows: typing.AsyncIterable[typing.Sequence[typing.Any]]
+    | typing.Iterable[typing.Sequence[typing.Any]],
+    labels: typing.Sequence[str] | None = None,
+    *,
+    batch_size: int = 1000,
+    sample_rows: int | None = None,
+    total_rows: int | None = None,
+    column_widths: typing.Sequence[int] | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    offload_rows: int | None = 1000,
+    **table_kwargs: typing.Any,
+) -> typing.AsyncIterator[str]:
+    """generate lines of table from async iterator of rows
+
+    see aprint_table() for how column widths are determined
+    """
+    async for lines in _agenerate_line_batches(
+        rows,
+        labels,
+        batch_size=batch_size,
+        sample_rows=sample_rows,
+        total_rows=total_rows,
+        column_widths=column_widths,
+        executor=executor,
+        offload_rows=offload_rows,
+        table_kwargs=table_kwargs,
+    ):
+        for line in lines:
+            yield line
+
+
+async def _agenerate_line_batches(
+    rows: typing.AsyncIterable[typing.Sequence[typing.Any]]
+    | typing.Iterable[typing.Sequence[typing.Any]],
+    labels: typing.Sequence[str] | None,
+    *,
+    batch_size: int,
+    sample_rows: int | None,
+    total_rows: int | None,
+    column_widths: typing.Sequence[int] | None,
+    executor: concurrent.futures.Executor | None,
+    offload_rows: int | None,
+    table_kwargs: typing.Mapping[str, typing.Any],
+) -> typing.AsyncIterator[list[str]]:
+    import asyncio
+    import contextvars
+    import functools
+
+    for key in _unsupported_stream_kwargs:
+        if table_kwargs.get(key):
+            raise Exception(key + ' is not supported for streamed tables')
+    label_location = table_kwargs.get('label_location')
+    if label_location is not None and label_location != 'top':
+        raise Exception('streamed tables only support labels at top')
+    if batch_size < 1:
+        raise Exception('batch_size must be positive')
+    if sample_rows is None:
+        sample_rows = batch_size
+    if total_rows is None and isinstance(rows, typing.Sized):
+        total_rows = len(rows)
+    has_outer_border = bool(table_kwargs.get('outer_border'))
+    row_start_index = table_kwargs.get('row_start_index', 1)
+    loop = asyncio.get_running_loop()
+
+    async def render(
+        batch: list[typing.Sequence[typing.Any]],
+        **kwargs: typing.Any,
+    ) -> list[str]:
+        render_batch = functools.partial(
+            table_utils.print_table,
+            batch,
+            **dict(table_kwargs, return_str=True, **kwargs),
+        )
+        if offload_rows is not None and len(batch) >= offload_rows:
+            # executor threads do not inherit the render context
+            context = contextvars.copy_context()
+            as_str = await loop.run_in_executor(
+                executor, context.run, render_batch
+            )
+        else:
+            as_str = render_batch()
+        if as_str is None:
+            raise Exception('could not render table')
+        return as_str.split('\n')
+
+    # read sample rows and use them to fix column widths
+    iterator = _aiter_rows(rows)
+    sample = await _read_batch(iterator, max(sample_rows, 1))
+    if column_widths is None:
+        column_widths = _get_sample_column_widths(
+            sample, labels, table_kwargs, total_rows
+        )
+
+    # render sample with labels, holding bottom border until stream ends
+    lines = await render(sample, labels=labels, column_widths=column_widths)
+    bottom_border = None
+    if has_outer_border:
+        bottom_border = lines.pop()
+    yield lines
+    n_rows = len(sample)
+
+    # render remaining batches without labels or outer borders
+    while len(sample) > 0:
+        batch = await _read_batch(iterator, batch_size)
+        if len(batch) == 0:
+            break
+        lines = await render(
+            batch,
+            labels=None,
+            column_widths=column_widths,
+            row_start_index=row_start_index + n_rows,
+        )
+        if has_outer_border:
+            lines = lines[1:-1]
+        yield lines
+        n_rows += len(batch)
+
+    if bottom_border is not None:
+        yield [bottom_border]
+
+
+async def _aiter_rows(
+    rows: typing.AsyncIterable[typing.Sequence[typing.Any]]
+    | typing.Iterable[typing.Sequence[typing.Any]],
+) -> typing.AsyncIterator[typing.Sequence[typing.Any]]:
+    if hasattr(rows, '__aiter__'):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def _read_batch(
+    iterator: typing.AsyncIterator[typing.Sequence[typing.Any]],
+    n: int,
+) -> list[typing.Sequence[typing.Any]]:
+    batch: list[typing.Sequence[typing.Any]] = []
+    while len(batch) < n:
+        try:
+            row = await iterator.__anext__()
+        except StopAsyncIteration:
+            break
+        if row is None:
+            raise Exception('row separators are not supported when streaming')
+        batch.append(row)
+    return batch
+
+
+def _get_sample_column_widths(
+    sample: list[typing.Sequence[typing.Any]],
+    labels: typing.Sequence[str] | None,
+    table_kwargs: typing.Mapping[str, typing.Any],
+    total_rows: int | None = None,
+) -> list[int]:
+    """measure column widths of sample rows as print_table() would"""
+    empty_str = table_kwargs.get('empty_str', '')
+    format = table_kwargs.get('format')
+    if format is None:
+        format = render_context.get_render_context()['number_format']
+    add_row_index = table_kwargs.get('add_row_index', False)
+    row_start_index = table_kwargs.get('row_start_index', 1)
+    rows, labels = table_utils._fix_missing_data(
+        sample, labels, table_kwargs.get('missing_columns', 'error'), empty_str
+    )
+    rows, labels = table_utils._add_index(
+        rows, labels, add_row_index, row_start_index
+    )
+    if len(rows) > 0:
+        n_columns = len(rows[0])
+    elif labels is not None:
+        n_columns = len(labels)
+    else:
+        return []
+
+    # measure cells
+    column_formats = table_utils._convert_column_dict_to_list(
+        table_kwargs.get('column_formats'), n_columns, labels
+    )
+    if column_formats is None:
+        column_formats = [None] * n_columns
+    if len(rows) > 0:
+        columns: list[typing.Sequence[typing.Any]] = list(zip(*rows))
+    else:
+        columns = [[] for c in range(n_columns)]
+    str_columns = [
+        table_utils._stringify_column(column, format, column_format, empty_str)
+        for column, column_format in zip(columns, column_formats)
+    ]
+
+    # measure labels
+    if labels is not None:
+        label_lines = multiline_tables._split_multiline_row(
+            labels,
+            vertical_justify=table_kwargs.get('label_vertical_justify', 'bottom'),
+        )
+        for label_line in label_lines:
+            str_label = table_utils._stringify_cells(
+                label_line, format, None, empty_str
+            )
+            for str_column, str_cell in zip(str_columns, str_label):
+                str_column.append(str_cell)
+
+    # size index column for last row of stream rather than last row of sample
+    if add_row_index and total_rows is not None and total_rows > 0:
+        str_columns[0].append(str(row_start_index + total_rows - 1))
+
+    max_column_widths = table_kwargs.get('max_column_widths')
+    if isinstance(max_column_widths, list) and add_row_index:
+        max_column_widths = [max_column_widths[0]] + max_column_widths
+    return table_utils._get_column_widths(
+        str_columns,
+        table_utils._convert_column_dict_to_list(
+            max_column_widths, n_columns, labels
+        ),
+    )
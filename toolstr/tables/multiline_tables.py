@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing
 
 from .. import spec
@@ -157,3 +158,96 @@ def _split_multiline_row(
             group_row.append(cell_line)
 
     return row_group
+
+
+def _get_longest_lines(str_column: typing.Sequence[str]) -> list[str]:
+    """replace each multiline str in column with its longest line"""
+    return [
+        max(str_cell.split('\n'), key=len) if '\n' in str_cell else str_cell
+        for str_cell in str_column
+    ]
+
+
+def _wrap_columns(
+    str_columns: typing.Sequence[typing.Sequence[str]],
+    column_widths: typing.Sequence[int],
+) -> tuple[list[list[str]], list[int]]:
+    """wrap cells wider than their column into multiple lines
+
+    returns str columns with one entry per line, and the row of each line
+    """
+    line_columns: list[list[str]] = [[] for str_column in str_columns]
+    line_rows: list[int] = []
+    for r, str_row in enumerate(zip(*str_columns)):
+        # wrap each cell of row
+        cell_lines: list[typing.Any] = []
+        for str_cell, width in zip(str_row, column_widths):
+            if len(str_cell) > width or '\n' in str_cell:
+                cell_lines.append(list(_wrap_cell(str_cell, width)))
+            else:
+                cell_lines.append(str_cell)
+
+        # lay out wrapped row as a multiline row group
+        if all(isinstance(cell, str) for cell in cell_lines):
+            row_group = [cell_lines]
+        else:
+            row_group = _split_multiline_row(cell_lines, vertical_justify='top')
+        for group_row in row_group:
+            for line_column, line in zip(line_columns, group_row):
+                line_column.append('' if line is None else line)
+            line_rows.append(r)
+
+    return line_columns, line_rows
+
+
+@functools.lru_cache(maxsize=4096)
+def _wrap_cell(text: str, width: int) -> tuple[str, ...]:
+    """wrap text at word boundaries into lines no wider than width
+
+    markup is not counted toward width and styles carry across lines
+    """
+    lines: list[str] = []
+    for paragraph in text.split('\n'):
+        if '[' in paragraph:
+            import rich.text
+
+            rich_text = rich.text.Text.from_markup(paragraph)
+            offsets = _get_wrap_offsets(rich_text.plain, width)
+            lines.extend(rich_text[start:end].markup for start, end in offsets)
+        else:
+            offsets = _get_wrap_offsets(paragraph, width)
+            lines.extend(paragraph[start:end] for start, end in offsets)
+    return tuple(lines)
+
+
+def _get_wrap_offsets(text: str, width: int) -> list[tuple[int, int]]:
+    """get (start, end) of each wrapped line, in time linear in len(text)
+
+    lines break at the last space that fits, or mid-word if no space fits
+    """
+    width = max(width, 1)
+    offsets = []
+    start = 0
+    n = len(text)
+    while True:
+        if n - start <= width:
+            offsets.append((start, n))
+            break
+        cut = text.rfind(' ', start, start + width + 1)
+        if cut <= start:
+            end = start + width
+            next_start = end
+        else:
+            end = cut
+            next_start = cut + 1
+        while end > start and text[end - 1] == ' ':
+            end -= 1
+        offsets.append((start, end))
+
+        # skip spaces between lines
+        start = next_start
+        while start < n and text[start] == ' ':
+            start += 1
+        if start == n:
+            break
+    return offsets
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypedDict, TypeGuard
+    import numpy as np
+
+    class StyleRule(TypedDict):
+        conditions: typing.Mapping[str, typing.Any]
+        style: str | None
+        quantiles: typing.Sequence[float] | None
+        styles: typing.Sequence[str | None] | None
+        else_style: str | None
+
+
+_comparisons = ['lt', 'le', 'gt', 'ge', 'eq', 'ne']
+
+
+def rule(
+    *,
+    lt: typing.Any = None,
+    le: typing.Any = None,
+    gt: typing.Any = None,
+    ge: typing.Any = None,
+    eq: typing.Any = None,
+    ne: typing.Any = None,
+    style: str | None = None,
+    else_style: str | None = None,
+) -> StyleRule:
+    """create style rule that compares each cell of column to thresholds
+
+    cells satisfying every given comparison get style, others get else_style,
+    and missing cells such as None or nan get no style
+
+    example: column_styles={'pnl': rule(lt=0, style='red', else_style='green')}
+    """
+    comparisons = {'lt': lt, 'le': le, 'gt': gt, 'ge': ge, 'eq': eq, 'ne': ne}
+    conditions = {
+        name: value for name, value in comparisons.items() if value is not None
+    }
+    if len(conditions) == 0:
+        raise Exception('must specify at least one comparison')
+    return {
+        'conditions': conditions,
+        'style': style,
+        'quantiles': None,
+        'styles': None,
+        'else_style': else_style,
+    }
+
+
+def quantile_rule(
+    quantiles: typing.Sequence[float],
+    styles: typing.Sequence[str | None],
+    *,
+    else_style: str | None = None,
+) -> StyleRule:
+    """create style rule that styles each cell by its quantile band in column
+
+    styles should have one more entry than quantiles, for example
+    quantile_rule([0.1, 0.9], ['red', None, 'green']) styles the bottom tenth
+    red and the top tenth green, and else_style is used for missing values
+    """
+    if len(styles) != len(quantiles) + 1:
+        raise Exception('styles must have one more entry than quantiles')
+    return {
+        'conditions': {},
+        'style': None,
+        'quantiles': quantiles,
+        'styles': styles,
+        'else_style': else_style,
+    }
+
+
+def _is_style_rule(style: typing.Any) -> TypeGuard[StyleRule]:
+    return isinstance(style, dict) and 'conditions' in style
+
+
+def _evaluate_style_rule(
+    style_rule: StyleRule,
+    values: typing.Sequence[typing.Any],
+) -> tuple[list[str | None], np.ndarray[typing.Any, typing.Any]]:
+    """evaluate style rule over whole column at once
+
+    returns distinct styles and the index into them of each cell's style
+
+    numeric thresholds and quantiles are evaluated only over numeric cells,
+    other cells such as the '...' row of limit_rows get no style, and missing
+    cells get no style from comparisons and else_style from quantiles
+    """
+    import numpy as np
+
+    numbers, is_number = _to_numbers(values)
+
+    if style_rule['quantiles'] is not None:
+        if style_rule['styles'] is None:
+            raise Exception('quantile rule must specify styles')
+        styles = list(style_rule['styles']) + [style_rule['else_style'], None]
+        valid = is_number & ~np.isnan(numbers)
+        indices = np.full(len(numbers), len(styles) - 1)
+        indices[is_number] = len(styles) - 2
+        if valid.any():
+            quantiles = style_rule['quantiles']
+            thresholds = np.quantile(numbers[valid], quantiles)
+            indices[valid] = np.searchsorted(
+                thresholds, numbers[valid], side='right'
+            )
+        return styles, indices
+
+    # evaluate comparisons as masks, nan never satisfies order comparisons
+    mask = np.ones(len(numbers), dtype=bool)
+    evaluated = np.ones(len(numbers), dtype=bool)
+    for name, threshold in style_rule['conditions'].items():
+        if name not in _comparisons:
+            raise Exception('unknown comparison: ' + str(name))
+        if _is_number(threshold):
+            with np.errstate(invalid='ignore'):
+                mask &= getattr(numbers, '__' + name + '__')(threshold)
+            evaluated &= is_number
+        else:
+            import operator
+
+            compare = getattr(operator, name)
+            for v, value in enumerate(values):
+                try:
+                    mask[v] &= bool(compare(value, threshold))
+                except TypeError:
+                    evaluated[v] = False
+    styles = [style_rule['else_style'], style_rule['style'], None]
+    indices = mask.astype(np.intp)
+    indices[~evaluated] = 2
+    indices[is_number & np.isnan(numbers)] = 2
+    return styles, indices
+
+
+def _to_numbers(
+    values: typing.Sequence[typing.Any],
+) -> tuple[
+    np.ndarray[typing.Any, typing.Any],
+    np.ndarray[typing.Any, np.dtype[np.bool_]],
+]:
+    """convert values to numeric array, and mask of which cells are numeric
+
+    missing values count as numeric and are converted to nan
+    """
+    import numpy as np
+
+    array = np.asarray(values)
+    if array.dtype.kind in 'iuf':
+        return array, np.ones(len(array), dtype=bool)
+    is_number = np.array(
+        [value is None or _is_number(value) for value in values], dtype=bool
+    )
+    numbers = np.array(
+        [
+            value if value is not None and is_cell_number else float('nan')
+            for value, is_cell_number in zip(values, is_number.tolist())
+        ],
+        dtype=float,
+    )
+    return numbers, is_number
+
+
+def _is_number(value: typing.Any) -> bool:
+    import numpy as np
+
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
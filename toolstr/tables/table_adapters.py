@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import typing
 
 if typing.TYPE_CHECKING:
     from typing_extensions import TypeGuard
+    import numpy as np
     import pandas as pd  # type: ignore
     import polars as pl
+    import pyarrow as pa  # type: ignore
 
 from . import table_utils
 
@@ -19,11 +23,38 @@ def print_dataframe_as_table(
     **table_kwargs: typing.Any,
 ) -> str | None:
     if _is_polars_dataframe(df) or _is_pandas_dataframe(df):
-        rows, columns = _dataframe_to_rows(
-            df, include_index=include_index, columns=columns
+        # convert only rows that limit_rows can show, keeping their positions
+        limited_df = _limit_dataframe_rows(df, table_kwargs)
+        if limited_df is not df and table_kwargs.get('add_row_index'):
+            row_start_index = table_kwargs.get('row_start_index', 1)
+            limit_rows = table_kwargs['limit_rows']
+            table_kwargs['row_indices'] = [
+                row_start_index + r
+                for r in itertools.chain(
+                    range(limit_rows), range(len(df) - limit_rows, len(df))
+                )
+            ]
+
+        data_columns, columns = _dataframe_to_columns(
+            limited_df, include_index=include_index, columns=columns
         )
+
+        # reduce footer aggregates natively within dataframe library
+        footer = table_kwargs.get('footer')
+        if footer is not None and table_kwargs.get('footer_row') is None:
+            table_kwargs['footer_row'] = _get_dataframe_footer_row(
+                df, columns, footer
+            )
+
+        # pass columns to print_table without transposing them into rows
+        return table_utils.print_table(
+            rows=table_utils._ColumnarRows(data_columns),
+            labels=columns,
+            **table_kwargs,
+        )
+
     elif isinstance(df, (list, tuple)):
-        rows = []
+        rows: list[typing.Sequence[typing.Any] | None] = []
         candidate_columns = None
         for item in df:
             if _is_polars_dataframe(item) or _is_pandas_dataframe(item):
@@ -50,18 +81,62 @@ def print_dataframe_as_table(
     return table_utils.print_table(rows=rows, labels=columns, **table_kwargs)
 
 
+def _limit_dataframe_rows(
+    df: pl.DataFrame | pd.DataFrame,
+    table_kwargs: typing.Mapping[str, typing.Any],
+) -> pl.DataFrame | pd.DataFrame:
+    """slice head and tail rows that limit_rows can show from dataframe
+
+    returns df itself if rows are reordered or the whole frame is needed
+    """
+    limit_rows = table_kwargs.get('limit_rows')
+    if (
+        limit_rows is None
+        or len(df) <= 2 * limit_rows
+        or table_kwargs.get('sort_column') is not None
+        or table_kwargs.get('sort_key') is not None
+        or table_kwargs.get('row_indices') is not None
+        or table_kwargs.get('separate_all_rows')
+    ):
+        return df
+
+    if _is_polars_dataframe(df):
+        import polars as pl
+
+        return pl.concat([df.head(limit_rows), df.tail(limit_rows)])
+    elif _is_pandas_dataframe(df):
+        import pandas as pd
+
+        return pd.concat([df.iloc[:limit_rows], df.iloc[-limit_rows:]])
+    else:
+        raise Exception('invalid dataframe format: ' + str(type(df)))
+
+
 def _dataframe_to_rows(
     df: pl.DataFrame | pd.DataFrame,
     include_index: bool = True,
     columns: typing.Sequence[typing.Any] | None = None,
 ) -> tuple[typing.Sequence[typing.Sequence[typing.Any]], typing.Sequence[str]]:
+    data_columns, columns = _dataframe_to_columns(
+        df, include_index=include_index, columns=columns
+    )
+    return list(zip(*data_columns)), columns
+
+
+def _dataframe_to_columns(
+    df: pl.DataFrame | pd.DataFrame,
+    include_index: bool = True,
+    columns: typing.Sequence[typing.Any] | None = None,
+) -> tuple[list[typing.Sequence[typing.Any]], typing.Sequence[str]]:
 
     if _is_polars_dataframe(df):
         if columns is not None:
             df = df.select(columns)
         if columns is None:
             columns = list(df.columns)
-        rows = df.rows()
+        data_columns: list[typing.Sequence[typing.Any]] = [
+            _polars_series_to_list(series) for series in df.get_columns()
+        ]
 
     elif _is_pandas_dataframe(df):
         # promote index columns to plain columns
@@ -82,13 +157,99 @@ def _dataframe_to_rows(
             # use all columns
             columns = list(df.columns.values)
 
-        # convert to list of lists
-        rows = df.values.tolist()
+        # convert column by column to keep native dtype of each column
+        data_columns = [
+            _pandas_series_to_list(df.iloc[:, c]) for c in range(df.shape[1])
+        ]
 
     else:
         raise Exception('invalid dataframe format: ' + str(type(df)))
 
-    return rows, columns
+    return data_columns, columns
+
+
+def _get_dataframe_footer_row(
+    df: pl.DataFrame | pd.DataFrame,
+    columns: typing.Sequence[str],
+    footer: typing.Mapping[str | int, str],
+) -> list[typing.Any]:
+    footer_row: list[typing.Any] = [None] * len(columns)
+    for column, aggregation in footer.items():
+        if isinstance(column, str):
+            index = list(columns).index(column)
+        else:
+            index = column
+        name = columns[index]
+        if _is_pandas_dataframe(df) and name not in df.columns:
+            # index column promoted by include_index
+            series = df.index.to_series()
+        else:
+            series = df[name]
+        footer_row[index] = _aggregate_series(series, aggregation)
+    return footer_row
+
+
+def _aggregate_series(
+    series: pl.Series | pd.Series, aggregation: str
+) -> typing.Any:
+    """aggregate polars or pandas series, ignoring nulls and nan"""
+    if type(series).__module__.startswith('polars'):
+        if series.dtype.is_float():
+            series = series.fill_nan(None)
+        if aggregation == 'count':
+            return series.len() - series.null_count()
+    else:
+        if aggregation == 'count':
+            return series.count()
+
+    if aggregation in ['sum', 'mean', 'min', 'max', 'median', 'std']:
+        result = getattr(series, aggregation)()
+    elif aggregation.startswith('p'):
+        try:
+            quantile = float(aggregation[1:]) / 100
+        except ValueError:
+            raise Exception('unknown aggregation: ' + str(aggregation))
+        if type(series).__module__.startswith('polars'):
+            result = series.quantile(quantile, interpolation='linear')
+        else:
+            result = series.quantile(quantile)
+    else:
+        raise Exception('unknown aggregation: ' + str(aggregation))
+
+    # convert numpy scalars to python scalars
+    if hasattr(result, 'item'):
+        result = result.item()
+    if isinstance(result, float) and result != result:
+        result = None
+    return result
+
+
+def _polars_series_to_list(series: pl.Series) -> list[typing.Any]:
+    import polars as pl
+
+    # convert temporal columns to str natively, matching str() of each value
+    time_zone = getattr(series.dtype, 'time_zone', None)
+    if series.dtype == pl.Datetime and time_zone is None:
+        series = series.dt.to_string('%Y-%m-%d %H:%M:%S%.6f').str.replace(
+            r'\.000000$', ''
+        )
+    elif series.dtype == pl.Date:
+        series = series.cast(pl.Utf8)
+
+    return series.to_list()
+
+
+def _pandas_series_to_list(series: pd.Series) -> list[typing.Any]:
+    import pandas as pd
+
+    # convert temporal columns to str natively, matching str() of each value
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        as_str = series.dt.strftime('%Y-%m-%d %H:%M:%S.%f').str.replace(
+            r'\.000000$', '', regex=True
+        )
+        series = as_str.where(series.notna(), 'NaT')
+
+    return series.tolist()  # type: ignore
 
 
 def _is_polars_dataframe(df: typing.Any) -> TypeGuard[pl.DataFrame]:
@@ -147,3 +308,279 @@ def print_list_of_dicts_as_table(
 
     return table_utils.print_table(rows=rows, labels=keys, **table_kwargs)
 
+
+def print_objects_as_table(
+    objs: typing.Sequence[typing.Any],
+    fields: typing.Sequence[str] | None = None,
+    **table_kwargs: typing.Any,
+) -> str | None:
+    """print dataclass, namedtuple, attrs, or __slots__ objects as a table
+
+    each class is introspected once, then every object's fields are read as a
+    row by a compiled attrgetter, without building intermediate dicts
+    """
+    # determine fields, taking union across classes in order of appearance
+    if fields is None:
+        fields = []
+        field_set = set()
+        for cls in dict.fromkeys(type(obj) for obj in objs):
+            class_fields = _get_object_fields(cls)
+            if class_fields is None:
+                raise Exception(
+                    'cannot determine fields of class: ' + cls.__name__
+                )
+            for field in class_fields:
+                if field not in field_set:
+                    fields.append(field)
+                    field_set.add(field)
+    fields = tuple(fields)
+
+    # extract rows using accessor of each class
+    classes = set(map(type, objs))
+    if len(classes) == 1:
+        accessor = _get_object_accessor(next(iter(classes)), fields)
+        rows = list(map(accessor, objs))
+    else:
+        accessors = {cls: _get_object_accessor(cls, fields) for cls in classes}
+        rows = [accessors[type(obj)](obj) for obj in objs]
+
+    return table_utils.print_table(rows=rows, labels=fields, **table_kwargs)
+
+
+def _get_object_fields(cls: type) -> tuple[str, ...] | None:
+    import dataclasses
+
+    if dataclasses.is_dataclass(cls):
+        return tuple(field.name for field in dataclasses.fields(cls))
+    elif hasattr(cls, '_fields'):
+        # namedtuple
+        return tuple(cls._fields)
+    elif hasattr(cls, '__attrs_attrs__'):
+        return tuple(attribute.name for attribute in cls.__attrs_attrs__)
+    elif hasattr(cls, '__slots__'):
+        fields = []
+        for parent in reversed(cls.__mro__):
+            slots = parent.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = [slots]
+            for slot in slots:
+                if slot not in ('__dict__', '__weakref__'):
+                    fields.append(slot)
+        return tuple(fields)
+    else:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _get_object_accessor(
+    cls: type,
+    fields: tuple[str, ...],
+) -> typing.Callable[[typing.Any], typing.Sequence[typing.Any]]:
+    """build function that reads fields of an object of cls as a tuple
+
+    fields that cls does not have are read as None
+    """
+    import operator
+
+    class_fields = _get_object_fields(cls)
+    if class_fields is None or all(field in class_fields for field in fields):
+        getter = operator.attrgetter(*fields)
+        if len(fields) == 1:
+            return lambda obj: (getter(obj),)
+        else:
+            return getter
+
+    getters = [
+        operator.attrgetter(field) if field in class_fields else None
+        for field in fields
+    ]
+
+    def accessor(obj: typing.Any) -> typing.Sequence[typing.Any]:
+        return tuple(
+            getter(obj) if getter is not None else None for getter in getters
+        )
+
+    return accessor
+
+
+def print_structured_array_as_table(
+    array: np.ndarray[typing.Any, typing.Any] | str,
+    columns: typing.Sequence[str] | None = None,
+    **table_kwargs: typing.Any,
+) -> str | None:
+    """print numpy structured array, reading only the rows that are shown
+
+    array can be a structured ndarray, an np.memmap, or a path to a .npy
+    file (which will be memory-mapped rather than loaded)
+    """
+    import numpy as np
+
+    if isinstance(array, str):
+        records: np.ndarray[typing.Any, typing.Any] = np.load(
+            array, mmap_mode='r'
+        )
+    else:
+        records = array
+    if records.dtype.names is None or records.ndim != 1:
+        raise Exception('array must be a 1d structured array')
+    if columns is None:
+        columns = list(records.dtype.names)
+    fields = list(columns)
+
+    def get_columns(start: int, stop: int) -> list[list[typing.Any]]:
+        column_values = []
+        for field in fields:
+            # slicing a field is a view, so only the rows in window are read
+            values = records[field][start:stop]
+            if values.dtype.kind == 'S':
+                values = values.astype(str)
+            column_values.append(values.tolist())
+        return column_values
+
+    return _print_column_windows(
+        get_columns=get_columns,
+        n_rows=len(records),
+        labels=fields,
+        table_kwargs=table_kwargs,
+        get_column_array=lambda c: records[fields[c]],
+    )
+
+
+def print_buffer_as_table(
+    buffer: typing.Any,
+    dtype: typing.Any,
+    columns: typing.Sequence[str] | None = None,
+    *,
+    offset: int = 0,
+    count: int = -1,
+    **table_kwargs: typing.Any,
+) -> str | None:
+    """print any object supporting the buffer protocol as a table
+
+    buffer is interpreted in place as records of the given structured dtype
+    """
+    import numpy as np
+
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return print_structured_array_as_table(
+        array,
+        columns=columns,
+        **table_kwargs,
+    )
+
+
+def print_record_batch_as_table(
+    batch: pa.RecordBatch | pa.Table,
+    columns: typing.Sequence[str] | None = None,
+    **table_kwargs: typing.Any,
+) -> str | None:
+    """print arrow-style record batch or table, converting only shown rows
+
+    works with any object providing num_rows, column_names, slice(), and
+    column(), such as pyarrow RecordBatch and Table objects
+    """
+    if columns is None:
+        columns = list(batch.column_names)
+    names = list(columns)
+
+    def get_columns(start: int, stop: int) -> list[list[typing.Any]]:
+        window = batch.slice(start, stop - start)
+        return [window.column(name).to_pylist() for name in names]
+
+    def get_column_array(c: int) -> typing.Any:
+        return batch.column(names[c]).to_numpy(zero_copy_only=False)
+
+    return _print_column_windows(
+        get_columns=get_columns,
+        n_rows=batch.num_rows,
+        labels=names,
+        table_kwargs=table_kwargs,
+        get_column_array=get_column_array,
+    )
+
+
+def _print_column_windows(
+    get_columns: typing.Callable[[int, int], list[list[typing.Any]]],
+    n_rows: int,
+    labels: typing.Sequence[str],
+    table_kwargs: typing.Mapping[str, typing.Any],
+    get_column_array: typing.Callable[[int], typing.Any] | None = None,
+) -> str | None:
+    """print table whose columns can be read one window of rows at a time
+
+    when rows are limited, only the rows that will be shown are read, and
+    footer aggregates are computed over whole column arrays
+    """
+    footer = table_kwargs.get('footer')
+    if (
+        footer is not None
+        and table_kwargs.get('footer_row') is None
+        and get_column_array is not None
+    ):
+        footer_row = table_utils._get_footer_row(
+            footer,
+            labels=labels,
+            n_columns=len(labels),
+            get_column=get_column_array,
+        )
+        table_kwargs = dict(table_kwargs, footer_row=footer_row)
+
+    windows = _get_row_windows(n_rows, table_kwargs)
+    if windows is None:
+        return table_utils.print_table(
+            rows=list(zip(*get_columns(0, n_rows))),
+            labels=labels,
+            **table_kwargs,
+        )
+
+    # read each window of rows and put fill rows between them
+    rows: list[typing.Sequence[typing.Any]] = []
+    row_indices: list[typing.Any] = []
+    start_index = table_kwargs.get('row_start_index', 1)
+    fill = ['...'] * len(labels)
+    for start, stop in windows:
+        if start > 0:
+            rows.append(fill)
+            row_indices.append('...')
+        rows.extend(zip(*get_columns(start, stop)))
+        row_indices.extend(range(start_index + start, start_index + stop))
+    if windows[-1][1] < n_rows:
+        rows.append(fill)
+        row_indices.append('...')
+
+    table_kwargs = dict(table_kwargs, row_indices=row_indices)
+    del table_kwargs['limit_rows']
+    return table_utils.print_table(rows=rows, labels=labels, **table_kwargs)
+
+
+def _get_row_windows(
+    n_rows: int,
+    table_kwargs: typing.Mapping[str, typing.Any],
+) -> list[tuple[int, int]] | None:
+    """get (start, stop) of row windows kept by limit_rows, if any clipping
+
+    matches the windows kept by table_utils.clip_rows()
+    """
+    import math
+
+    limit_rows = table_kwargs.get('limit_rows')
+    if limit_rows is None or n_rows <= limit_rows:
+        return None
+    if (
+        table_kwargs.get('sort_column') is not None
+        or table_kwargs.get('sort_key') is not None
+    ):
+        return None
+
+    n = limit_rows - 1
+    limit_rows_at = table_kwargs.get('limit_rows_at', 'middle')
+    if limit_rows_at == 'start':
+        return [(n_rows - n, n_rows)]
+    elif limit_rows_at == 'end':
+        return [(0, n)]
+    elif limit_rows_at == 'middle':
+        n_head = math.ceil(n / 2)
+        n_tail = n - n_head
+        return [(0, n_head), (n_rows - n_tail, n_rows)]
+    else:
+        raise Exception('invalid clip_rows specification')
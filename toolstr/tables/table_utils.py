@@ -6,12 +6,16 @@ from typing_extensions import TypedDict
 
 from .. import formats
 from .. import outlines
+from .. import render_cache
+from .. import render_context
 from .. import spec
 from . import multiline_tables
+from . import style_rules
 
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Literal
+    import numpy as np
     import rich.console
 
     class TableData(TypedDict):
@@ -29,7 +33,11 @@ if typing.TYPE_CHECKING:
         c: int
 
     Row = typing.Sequence[typing.Any]
-    Style = typing.Union[str, typing.Callable[[TableStyleContext], str]]
+    Style = typing.Union[
+        str,
+        typing.Callable[[TableStyleContext], typing.Optional[str]],
+        style_rules.StyleRule,
+    ]
     HeaderSingleLocation = typing.Literal['top', 'bottom']
     HeaderPluralLocation = typing.Tuple[
         HeaderSingleLocation,
@@ -66,6 +74,61 @@ def transpose_table(
     return {'rows': new_rows, 'labels': new_labels}
 
 
+class _ColumnarRows(typing.Sequence[typing.Sequence[typing.Any]]):
+    """rows of a table stored as columns, such as columns of a dataframe
+
+    print_table() stringifies the columns directly, and rows are only
+    assembled if a step such as sorting or a style function iterates them
+    """
+
+    def __init__(self, columns: list[typing.Sequence[typing.Any]]) -> None:
+        self.columns = columns
+        self._rows: list[typing.Sequence[typing.Any]] | None = None
+
+    def __len__(self) -> int:
+        if len(self.columns) == 0:
+            return 0
+        return len(self.columns[0])
+
+    @typing.overload
+    def __getitem__(self, index: int) -> typing.Sequence[typing.Any]:
+        ...
+
+    @typing.overload
+    def __getitem__(
+        self, index: slice
+    ) -> typing.Sequence[typing.Sequence[typing.Any]]:
+        ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> (
+        typing.Sequence[typing.Any]
+        | typing.Sequence[typing.Sequence[typing.Any]]
+    ):
+        if isinstance(index, int) and self._rows is None:
+            return tuple(column[index] for column in self.columns)
+        return self._get_rows()[index]
+
+    def __iter__(self) -> typing.Iterator[typing.Sequence[typing.Any]]:
+        return iter(self._get_rows())
+
+    def _get_rows(self) -> list[typing.Sequence[typing.Any]]:
+        if self._rows is None:
+            self._rows = list(zip(*self.columns))
+        return self._rows
+
+
+_uncached_print_table_args = {
+    'rows',
+    'labels',
+    'file',
+    'console',
+    'return_str',
+    'use_render_cache',
+}
+
+
 def print_table(
     #
     # content
@@ -74,20 +137,26 @@ def print_table(
     *,
     add_row_index: bool = False,
     row_start_index: int = 1,
+    row_indices: typing.Sequence[typing.Any] | None = None,
     limit_rows: int | None = None,
     limit_rows_at: Literal['start', 'middle', 'end'] = 'middle',
+    footer: typing.Mapping[str | int, str] | None = None,
+    footer_row: typing.Sequence[typing.Any] | None = None,
     sort_key: typing.Callable[..., typing.Any] | None = None,
     sort_column: str
     | int
     | typing.Sequence[str]
     | typing.Sequence[int]
     | None = None,
-    descending: bool = False,
+    descending: bool | typing.Sequence[bool] = False,
+    sort_nulls: Literal['first', 'last'] = 'last',
     missing_columns: typing.Literal['fill', 'clip', 'error'] = 'error',
     empty_str: str = '',
     format: FormatKwargs | None = None,
     column_formats: ColumnData[FormatKwargs] | None = None,
+    dictionary_encode: bool | ColumnData[bool] | None = None,
     return_str: bool = False,
+    use_render_cache: bool = True,
     #
     # io
     file: typing.TextIO | None = None,
@@ -97,8 +166,12 @@ def print_table(
     # table
     label_location: HeaderLocation | None = None,
     max_table_width: int | None = None,
+    fold_columns: bool = False,
+    repeat_columns: typing.Sequence[str | int] | None = None,
     column_widths: typing.Sequence[int] | None = None,
     max_column_widths: ColumnData[int] | None = None,
+    min_column_widths: ColumnData[int] | None = None,
+    shrink_columns: Literal['largest', 'proportional'] | None = None,
     indent: str | int | None = None,
     outer_gap: int | str | None = None,
     column_gap: int | str | None = None,
@@ -114,10 +187,44 @@ def print_table(
     label_justify: ColumnData[spec.HorizontalJustification] | None = None,
     label_vertical_justify: ColumnData[spec.VerticalJustification]
     | None = 'bottom',
+    wrap_cells: bool = False,
     style: Style | None = None,
     column_styles: ColumnData[Style] | None = None,
     label_style: ColumnData[Style] | None = None,
 ) -> str | None:
+    # use default number format of render context
+    if format is None:
+        format = render_context.get_render_context()['number_format']
+
+    # reuse rendered table if inputs are identical to a cached render
+    if use_render_cache:
+        options = {
+            key: value
+            for key, value in locals().items()
+            if key not in _uncached_print_table_args
+        }
+        render_key = render_cache._get_render_key(
+            'print_table', rows, labels, **options
+        )
+        if render_key is not None:
+            table_as_str = render_cache._get_cached_render(render_key)
+            if table_as_str is None:
+                table_as_str = print_table(
+                    rows,
+                    labels,
+                    return_str=True,
+                    use_render_cache=False,
+                    **options,
+                )
+                if table_as_str is not None:
+                    render_cache._cache_render(render_key, table_as_str)
+            if return_str:
+                return table_as_str
+            else:
+                use_styles = _should_use_styles(use_styles)
+                _print_table(table_as_str, use_styles, console, file)  # type: ignore
+                return None
+
     # filter row separators
     rows, separator_indices = _filter_separator_indices(rows, separate_all_rows)
 
@@ -125,21 +232,72 @@ def print_table(
     rows, labels = _fix_missing_data(rows, labels, missing_columns, empty_str)
 
     # sort rows
-    rows = _sort_rows(rows, labels, sort_column, sort_key, descending)
+    rows = _sort_rows(
+        rows, labels, sort_column, sort_key, descending, sort_nulls
+    )
+
+    # compute footer aggregates over all rows
+    if footer is not None and footer_row is None:
+        data_rows = rows
+        footer_row = _get_footer_row(
+            footer,
+            labels=labels,
+            n_columns=len(rows[0]) if len(rows) > 0 else len(labels or []),
+            get_column=lambda c: [row[c] for row in data_rows],
+        )
 
     # add row index
-    rows, labels = _add_index(rows, labels, add_row_index, row_start_index)
+    rows, labels = _add_index(
+        rows, labels, add_row_index, row_start_index, row_indices
+    )
+    if footer_row is not None and add_row_index:
+        footer_row = [None] + list(footer_row)
     if limit_rows is not None and len(rows) > limit_rows:
         rows = clip_rows(rows, n=limit_rows, clip_position=limit_rows_at)
 
+    # determine width available to column contents when shrinking columns
+    if shrink_columns is not None and max_table_width is not None:
+        if len(rows) > 0:
+            n_columns = len(rows[0])
+        elif labels is not None:
+            n_columns = len(labels)
+        else:
+            n_columns = 0
+        max_columns_width: int | None = max_table_width - _get_chrome_width(
+            n_columns=n_columns,
+            indent=indent,
+            compact=compact,
+            border=border,
+            label_border=label_border,
+            outer_border=outer_border,
+            column_gap=column_gap,
+            outer_gap=outer_gap,
+        )
+    else:
+        max_columns_width = None
+
     # convert cells and labels to str
-    str_cells, str_labels, column_widths, use_styles = _stringify_all(
+    (
+        str_cells,
+        str_labels,
+        str_footer,
+        column_widths,
+        use_styles,
+        separator_indices,
+    ) = _stringify_all(
         rows=rows,
         labels=labels,
+        footer_row=footer_row,
+        separator_indices=separator_indices,
+        wrap_cells=wrap_cells,
         column_widths=column_widths,
         max_column_widths=max_column_widths,
+        min_column_widths=min_column_widths,
+        max_columns_width=max_columns_width,
+        shrink_columns=shrink_columns,
         format=format,
         column_formats=column_formats,
+        dictionary_encode=dictionary_encode,
         empty_str=empty_str,
         justify=justify,
         column_justify=column_justify,
@@ -152,22 +310,68 @@ def print_table(
         add_row_index=add_row_index,
     )
 
-    # layout table as single str
-    table_as_str = _convert_table_to_str(
-        str_cells=str_cells,
-        str_labels=str_labels,
-        column_widths=column_widths,
-        compact=compact,
-        indent=indent,
-        max_table_width=max_table_width,
-        label_location=label_location,
-        border=border,
-        column_gap=column_gap,
-        outer_gap=outer_gap,
-        label_border=label_border,
-        outer_border=outer_border,
-        separator_indices=separator_indices,
-    )
+    # split columns into horizontal pages that each fit in max_table_width
+    if fold_columns and max_table_width is not None and column_widths:
+        pages = _get_column_pages(
+            column_widths=column_widths,
+            max_table_width=max_table_width,
+            repeat_columns=_get_repeat_column_indices(
+                repeat_columns, labels, add_row_index
+            ),
+            indent=indent,
+            compact=compact,
+            border=border,
+            label_border=label_border,
+            outer_border=outer_border,
+            column_gap=column_gap,
+            outer_gap=outer_gap,
+        )
+        page_strs = []
+        for page in pages:
+            page_str = _convert_table_to_str(
+                str_cells=[[row[c] for c in page] for row in str_cells],
+                str_labels=[[row[c] for c in page] for row in str_labels],
+                str_footer=[[row[c] for c in page] for row in str_footer],
+                column_widths=[column_widths[c] for c in page],
+                compact=compact,
+                indent=indent,
+                max_table_width=None,
+                label_location=label_location,
+                border=border,
+                column_gap=column_gap,
+                outer_gap=outer_gap,
+                label_border=label_border,
+                outer_border=outer_border,
+                separator_indices=separator_indices,
+            )
+            page_strs.append(page_str)
+        table_as_str = '\n\n'.join(page_strs)
+
+    else:
+        # lines only need trimming if solved column widths could not fit
+        if (
+            max_columns_width is not None
+            and sum(column_widths) <= max_columns_width
+        ):
+            max_table_width = None
+
+        # layout table as single str
+        table_as_str = _convert_table_to_str(
+            str_cells=str_cells,
+            str_labels=str_labels,
+            str_footer=str_footer,
+            column_widths=column_widths,
+            compact=compact,
+            indent=indent,
+            max_table_width=max_table_width,
+            label_location=label_location,
+            border=border,
+            column_gap=column_gap,
+            outer_gap=outer_gap,
+            label_border=label_border,
+            outer_border=outer_border,
+            separator_indices=separator_indices,
+        )
 
     # return or print table
     if return_str:
@@ -204,7 +408,14 @@ def _should_use_styles(use_styles: bool | None) -> bool:
 def _filter_separator_indices(
     rows: typing.Sequence[None | typing.Sequence[typing.Any]],
     separate_all_rows: bool,
-) -> tuple[list[typing.Sequence[typing.Any]], set[int]]:
+) -> tuple[typing.Sequence[typing.Sequence[typing.Any]], set[int]]:
+    # columnar rows cannot contain separators
+    if isinstance(rows, _ColumnarRows):
+        if separate_all_rows:
+            return rows, set(range(len(rows) - 1))
+        else:
+            return rows, set()
+
     filtered: list[typing.Sequence[typing.Any]] = []
     indices = set()
     for row in rows:
@@ -223,11 +434,19 @@ def _filter_separator_indices(
 
 
 def _fix_missing_data(
-    rows: list[typing.Sequence[typing.Any]],
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
     labels: typing.Sequence[str] | None,
     missing_columns: typing.Literal['clip', 'fill', 'error'],
     empty_str: str,
-) -> tuple[list[typing.Sequence[typing.Any]], typing.Sequence[str] | None]:
+) -> tuple[
+    typing.Sequence[typing.Sequence[typing.Any]], typing.Sequence[str] | None
+]:
+    # columnar rows all have the same number of columns
+    if isinstance(rows, _ColumnarRows):
+        if labels is None or len(labels) == len(rows.columns):
+            return rows, labels
+        rows = list(rows)
+
     if len(rows) > 0:
         min_columns = 1_000_000_000
         max_columns = 0
@@ -259,11 +478,14 @@ def _fix_missing_data(
 
 
 def _add_index(
-    rows: list[typing.Sequence[typing.Any]],
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
     labels: typing.Sequence[str] | None,
     add_row_index: bool,
     row_start_index: int,
-) -> tuple[list[typing.Sequence[typing.Any]], typing.Sequence[str] | None]:
+    row_indices: typing.Sequence[typing.Any] | None = None,
+) -> tuple[
+    typing.Sequence[typing.Sequence[typing.Any]], typing.Sequence[str] | None
+]:
     if add_row_index:
         if labels is not None:
             if isinstance(add_row_index, str):
@@ -271,9 +493,18 @@ def _add_index(
             else:
                 index_name = ''
             labels = [index_name] + list(labels)
-        rows = [
-            [str(row_start_index + r)] + list(row) for r, row in enumerate(rows)
-        ]
+        if row_indices is not None:
+            if len(row_indices) != len(rows):
+                raise Exception('row_indices must have same length as rows')
+            index_column = [str(index) for index in row_indices]
+        else:
+            index_column = [str(row_start_index + r) for r in range(len(rows))]
+        if isinstance(rows, _ColumnarRows):
+            rows = _ColumnarRows([index_column] + rows.columns)
+        else:
+            rows = [
+                [index] + list(row) for index, row in zip(index_column, rows)
+            ]
 
     return rows, labels
 
@@ -281,11 +512,18 @@ def _add_index(
 def _stringify_all(
     rows: typing.Sequence[typing.Sequence[typing.Any]],
     labels: typing.Sequence[str] | None,
+    footer_row: typing.Sequence[typing.Any] | None,
+    separator_indices: set[int],
+    wrap_cells: bool,
     column_widths: typing.Sequence[int] | None,
     max_column_widths: ColumnData[int] | None,
+    min_column_widths: ColumnData[int] | None,
+    max_columns_width: int | None,
+    shrink_columns: Literal['largest', 'proportional'] | None,
     empty_str: str,
     format: FormatKwargs | None,
     column_formats: ColumnData[FormatKwargs] | None,
+    dictionary_encode: bool | ColumnData[bool] | None,
     add_row_index: bool,
     justify: spec.HorizontalJustification,
     column_justify: ColumnData[spec.HorizontalJustification] | None,
@@ -297,22 +535,62 @@ def _stringify_all(
     style: Style | None,
     column_styles: ColumnData[Style] | None,
     label_style: ColumnData[Style] | None,
-) -> tuple[list[list[str]], list[list[str]], typing.Sequence[int], bool]:
+) -> tuple[
+    list[list[str]],
+    list[list[str]],
+    list[list[str]],
+    typing.Sequence[int],
+    bool,
+    set[int],
+]:
     # determine number of columns
     if len(rows) > 0:
         n_columns = len(rows[0])
     elif labels is not None:
         n_columns = len(labels)
     else:
-        return [], [], [], False
+        return [], [], [], [], False, separator_indices
 
     # convert cells to str
     column_formats = _convert_column_dict_to_list(
         column_formats, n_columns, labels
     )
-    str_cells = [
-        _stringify_cells(row, format, column_formats, empty_str) for row in rows
-    ]
+    if column_formats is None:
+        column_formats = [None] * n_columns
+    if isinstance(dictionary_encode, bool) or dictionary_encode is None:
+        encode_columns = [dictionary_encode] * n_columns
+    else:
+        if isinstance(dictionary_encode, list) and add_row_index:
+            dictionary_encode = [False] + dictionary_encode
+        encode_columns = list(
+            _convert_column_dict_to_list(dictionary_encode, n_columns, labels)
+        )
+    if isinstance(rows, _ColumnarRows):
+        columns: list[typing.Sequence[typing.Any]] = list(rows.columns)
+    elif len(rows) > 0:
+        columns = list(zip(*rows))
+    else:
+        columns = [[] for c in range(n_columns)]
+    str_columns = []
+    column_codes: list[list[int] | None] = []
+    for column, column_format, encode in zip(
+        columns, column_formats, encode_columns
+    ):
+        # repeated values are formatted once and referenced by code
+        codes = None
+        if encode is not False:
+            encoding = _encode_column(column, auto=encode is None)
+            if encoding is not None:
+                column, codes = encoding
+        str_column = _stringify_column(
+            column,
+            format,
+            column_format,
+            empty_str,
+            first_line_only=not wrap_cells,
+        )
+        str_columns.append(str_column)
+        column_codes.append(codes)
     if labels is not None:
         label_lines = multiline_tables._split_multiline_row(
             labels,
@@ -324,6 +602,14 @@ def _stringify_all(
         ]
     else:
         str_labels = []
+    if footer_row is not None:
+        if len(footer_row) != n_columns:
+            raise Exception('footer_row has wrong length')
+        str_footer = [
+            _stringify_cells(footer_row, format, column_formats, empty_str)
+        ]
+    else:
+        str_footer = []
 
     # determine column widths
     if column_widths is None:
@@ -332,19 +618,77 @@ def _stringify_all(
         max_column_widths = _convert_column_dict_to_list(
             max_column_widths, n_columns, labels
         )
+        if len(str_labels + str_footer) > 0:
+            label_columns = [
+                list(column) for column in zip(*(str_labels + str_footer))
+            ]
+        else:
+            label_columns = [[] for c in range(n_columns)]
+        if wrap_cells:
+            width_columns = [
+                multiline_tables._get_longest_lines(str_column)
+                for str_column in str_columns
+            ]
+        else:
+            width_columns = str_columns
         column_widths = _get_column_widths(
-            str_cells + str_labels, max_column_widths
+            [
+                str_column + label_column
+                for str_column, label_column in zip(width_columns, label_columns)
+            ],
+            max_column_widths,
         )
 
+        # shrink columns to fit in total width
+        if max_columns_width is not None and shrink_columns is not None:
+            if isinstance(min_column_widths, list) and add_row_index:
+                min_column_widths = [min_column_widths[0]] + min_column_widths
+            min_column_widths = _convert_column_dict_to_list(
+                min_column_widths, n_columns, labels
+            )
+            column_widths = _solve_column_widths(
+                column_widths,
+                max_columns_width=max_columns_width,
+                min_column_widths=min_column_widths,
+                shrink_columns=shrink_columns,
+            )
+
+    # wrap cells into lines that fit column widths
+    if wrap_cells and len(rows) > 0:
+        str_columns, line_rows = multiline_tables._wrap_columns(
+            [
+                str_column
+                if codes is None
+                else [str_column[code] for code in codes]
+                for str_column, codes in zip(str_columns, column_codes)
+            ],
+            column_widths,
+        )
+        column_codes = [None] * n_columns
+        rows = [rows[r] for r in line_rows]
+        last_lines = {r: line for line, r in enumerate(line_rows)}
+        separator_indices = {
+            last_lines[r] for r in separator_indices if r in last_lines
+        }
+
     # trim and justify cells to column widths
     if isinstance(column_justify, list) and add_row_index:
         column_justify = [column_justify[0]] + column_justify
     column_justify = _convert_column_dict_to_list(
         column_justify, n_columns, labels
     )
-    str_cells = [
+    for c, str_column in enumerate(str_columns):
+        cell_justify = justify
+        if column_justify is not None:
+            cell_justify = column_justify[c] or justify
+        str_columns[c] = [
+            _trim_justify_cell(str_cell, column_widths[c], cell_justify)
+            for str_cell in str_column
+        ]
+    str_cells = _expand_columns(str_columns, column_codes)
+    str_footer = [
         _trim_justify(str_row, column_widths, column_justify, justify)
-        for str_row in str_cells
+        for str_row in str_footer
     ]
     if label_justify is None:
         label_justify = 'right'
@@ -367,6 +711,17 @@ def _stringify_all(
             column_styles, n_columns, labels
         )
 
+        # style each distinct value of encoded columns once
+        styled_columns: dict[int, list[str]] = {}
+        if any(codes is not None for codes in column_codes):
+            styled_columns, column_styles = _stylize_encoded_columns(
+                str_columns=str_columns,
+                column_codes=column_codes,
+                style=style,
+                column_styles=column_styles,
+            )
+            style = None
+
         # style rows
         str_cells = _stylize_rows(
             rows=rows,
@@ -376,6 +731,9 @@ def _stringify_all(
             labels=labels,
             str_labels=str_labels,
         )
+        for c, styled_column in styled_columns.items():
+            for str_row, str_cell in zip(str_cells, styled_column):
+                str_row[c] = str_cell
 
         # stylize label
         if isinstance(label_style, list) and add_row_index:
@@ -399,28 +757,37 @@ def _stringify_all(
             str_labels=str_labels,
         )
 
-    return str_cells, str_labels, column_widths, use_styles
+    return (
+        str_cells,
+        str_labels,
+        str_footer,
+        column_widths,
+        use_styles,
+        separator_indices,
+    )
 
 
 def _get_column_widths(
-    str_cells: list[list[str]],
+    str_columns: typing.Sequence[typing.Sequence[str]],
     max_column_widths: typing.Sequence[int | None] | None,
 ) -> list[int]:
-    if len(str_cells) > 0:
-        n_columns = len(str_cells[0])
-    else:
-        return []
-    column_widths: list[int] = [0] * n_columns
-    for row_str_cells in str_cells:
-        for c, str_cell in enumerate(row_str_cells):
-            if '[' in str_cell:
-                import rich.text
-
-                cell_width = rich.text.Text.from_markup(str_cell).cell_len
-            else:
-                cell_width = len(str_cell)
-            if cell_width > column_widths[c]:
-                column_widths[c] = cell_width
+    column_widths: list[int] = []
+    for str_column in str_columns:
+        if len(str_column) == 0:
+            column_widths.append(0)
+        elif any('[' in str_cell for str_cell in str_column):
+            import rich.text
+
+            column_widths.append(
+                max(
+                    rich.text.Text.from_markup(str_cell).cell_len
+                    if '[' in str_cell
+                    else len(str_cell)
+                    for str_cell in str_column
+                )
+            )
+        else:
+            column_widths.append(max(map(len, str_column)))
 
     if max_column_widths is not None:
         for c, max_column_width in enumerate(max_column_widths):
@@ -433,6 +800,123 @@ def _get_column_widths(
     return column_widths
 
 
+def _solve_column_widths(
+    column_widths: typing.Sequence[int],
+    max_columns_width: int,
+    min_column_widths: typing.Sequence[int | None] | None,
+    shrink_columns: Literal['largest', 'proportional'],
+    default_min_width: int = 3,
+) -> list[int]:
+    """shrink column widths so that their sum fits in max_columns_width
+
+    - 'largest' shrinks the widest columns first, down to a common width
+    - 'proportional' shrinks each column in proportion to its shrinkable width
+
+    columns are never shrunk below their min width, so the result can still
+    exceed max_columns_width if the min widths do not fit
+    """
+    widths = list(column_widths)
+    if sum(widths) <= max_columns_width:
+        return widths
+
+    # determine lower bound of each column
+    min_widths = []
+    for c, width in enumerate(widths):
+        min_width = None
+        if min_column_widths is not None:
+            min_width = min_column_widths[c]
+        if min_width is None:
+            min_width = default_min_width
+        min_widths.append(min(min_width, width))
+    if sum(min_widths) >= max_columns_width:
+        return min_widths
+
+    if shrink_columns == 'largest':
+        # find largest common width cap such that columns fit
+        def capped_total(cap: int) -> int:
+            return sum(
+                max(min_width, min(width, cap))
+                for width, min_width in zip(widths, min_widths)
+            )
+
+        low = 0
+        high = max(widths)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if capped_total(middle) <= max_columns_width:
+                low = middle
+            else:
+                high = middle - 1
+        solved = [
+            max(min_width, min(width, low))
+            for width, min_width in zip(widths, min_widths)
+        ]
+
+        # give leftover width to capped columns, from left to right
+        leftover = max_columns_width - sum(solved)
+        for c in range(len(solved)):
+            if leftover <= 0:
+                break
+            if solved[c] < widths[c]:
+                solved[c] += 1
+                leftover -= 1
+
+    elif shrink_columns == 'proportional':
+        excess = sum(widths) - max_columns_width
+        shrinkable = [
+            width - min_width for width, min_width in zip(widths, min_widths)
+        ]
+        total_shrinkable = sum(shrinkable)
+        solved = [
+            width - (excess * amount) // total_shrinkable
+            for width, amount in zip(widths, shrinkable)
+        ]
+
+        # remove rounding remainder from columns with most shrinkable width
+        remainder = sum(solved) - max_columns_width
+        order = sorted(
+            range(len(solved)),
+            key=lambda c: solved[c] - min_widths[c],
+            reverse=True,
+        )
+        for c in order[:remainder]:
+            solved[c] -= 1
+
+    else:
+        raise Exception('unknown shrink_columns: ' + str(shrink_columns))
+
+    return solved
+
+
+def _get_chrome_width(
+    n_columns: int,
+    indent: str | int | None,
+    compact: bool | int,
+    border: str | spec.BorderChars | None,
+    label_border: str | spec.BorderChars | None,
+    outer_border: bool | str | spec.BorderChars | None,
+    column_gap: int | str | None,
+    outer_gap: int | str | None,
+) -> int:
+    """compute width of table lines not occupied by column contents"""
+    border, _, outer_border, column_gap, outer_gap = _resolve_table_chrome(
+        compact=compact,
+        border=border,
+        label_border=label_border,
+        outer_border=outer_border,
+        column_gap=column_gap,
+        outer_gap=outer_gap,
+    )
+    return _get_table_width(
+        column_widths=[0] * n_columns,
+        indent=indent,
+        border=border,
+        outer_border=outer_border,
+        column_gap=column_gap,
+        outer_gap=outer_gap,
+    )
+
+
 @typing.overload
 def _convert_column_dict_to_list(
     column_data: None,
@@ -486,8 +970,86 @@ def _convert_column_dict_to_list(
         raise Exception('unknown format: ' + str(column_data))
 
 
+def _get_footer_row(
+    footer: typing.Mapping[str | int, str],
+    labels: typing.Sequence[str] | None,
+    n_columns: int,
+    get_column: typing.Callable[[int], typing.Any],
+) -> list[typing.Any]:
+    """compute footer aggregates, reading each aggregated column once
+
+    get_column should return the values of column as a list or array
+    """
+    footer_row: list[typing.Any] = [None] * n_columns
+    for column, aggregation in footer.items():
+        if isinstance(column, str):
+            if labels is None:
+                raise Exception('must specify labels when using named footer')
+            index = labels.index(column)
+        else:
+            index = column
+        footer_row[index] = aggregate_values(get_column(index), aggregation)
+    return footer_row
+
+
+def aggregate_values(
+    values: typing.Sequence[typing.Any] | np.ndarray[typing.Any, typing.Any],
+    aggregation: str,
+) -> typing.Any:
+    """aggregate values, ignoring None and nan
+
+    aggregation is one of count, sum, mean, min, max, median, std, or a
+    percentile such as p99 or p99.9
+    """
+    import numpy as np
+
+    # convert to array without nulls
+    array = np.asarray(values)
+    if array.dtype.kind == 'O':
+        array = np.asarray([value for value in values if value is not None])
+    if array.dtype.kind == 'f':
+        array = array[~np.isnan(array)]
+    elif array.dtype.kind == 'b':
+        array = array.astype(np.int64)
+
+    if aggregation == 'count':
+        return len(array)
+    if array.dtype.kind not in 'iuf':
+        raise Exception('cannot compute ' + aggregation + ' of non-numbers')
+    if len(array) == 0:
+        if aggregation == 'sum':
+            return 0
+        return None
+
+    # compute aggregate
+    if aggregation == 'sum':
+        result = array.sum()
+    elif aggregation == 'mean':
+        result = array.mean()
+    elif aggregation == 'min':
+        result = array.min()
+    elif aggregation == 'max':
+        result = array.max()
+    elif aggregation == 'median':
+        result = np.median(array)
+    elif aggregation == 'std':
+        if len(array) < 2:
+            return None
+        result = array.std(ddof=1)
+    elif aggregation.startswith('p'):
+        try:
+            percentile = float(aggregation[1:])
+        except ValueError:
+            raise Exception('unknown aggregation: ' + str(aggregation))
+        result = np.percentile(array, percentile)
+    else:
+        raise Exception('unknown aggregation: ' + str(aggregation))
+
+    return result.item()
+
+
 def _sort_rows(
-    rows: list[typing.Sequence[typing.Any]],
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
     labels: typing.Sequence[str] | None,
     sort_column: str
     | int
@@ -495,34 +1057,50 @@ def _sort_rows(
     | typing.Sequence[int]
     | None = None,
     sort_key: typing.Callable[..., typing.Any] | None = None,
-    descending: bool = False,
-) -> list[typing.Sequence[typing.Any]]:
+    descending: bool | typing.Sequence[bool] = False,
+    sort_nulls: Literal['first', 'last'] = 'last',
+) -> typing.Sequence[typing.Sequence[typing.Any]]:
     if sort_column is not None and sort_key is not None:
         raise Exception('should not specify both sort_key and sort_column')
-    for raw_row in rows:
-        if raw_row is None:
-            raise Exception('cannot sort gap rows equal to None')
+    if isinstance(rows, _ColumnarRows):
+        # columnar rows cannot contain gap rows
+        if sort_column is None and sort_key is None:
+            return rows
+    else:
+        for raw_row in rows:
+            if raw_row is None:
+                raise Exception('cannot sort gap rows equal to None')
 
     # sort by values of particular columns
     if sort_column is not None:
         if labels is None:
             raise Exception('must specify labels when specifying sort_column')
         if isinstance(sort_column, (str, int)):
-            index = _get_label_index(sort_column, labels)
-            sorted_rows = sorted(rows, key=lambda row: row[index])  # type: ignore
+            indices = [_get_label_index(sort_column, labels)]
         elif isinstance(sort_column, (list, tuple)):
             indices = [_get_label_index(label, labels) for label in sort_column]
-            sorted_rows = sorted(
-                rows, key=lambda row: tuple(row[i] for i in indices)
-            )
         else:
             raise Exception('unknown sort_column format')
 
-        if descending:
-            sorted_rows = sorted_rows[::-1]
-        return sorted_rows
+        if isinstance(descending, bool):
+            directions = [descending] * len(indices)
+        elif len(descending) == len(indices):
+            directions = list(descending)
+        else:
+            raise Exception('descending must have one entry per sort column')
+
+        permutation = _get_sort_permutation(
+            rows, indices, directions, sort_nulls
+        )
+        if isinstance(rows, _ColumnarRows):
+            return _ColumnarRows(
+                [[column[i] for i in permutation] for column in rows.columns]
+            )
+        return [rows[i] for i in permutation]
 
     if sort_key is not None:
+        if not isinstance(descending, bool):
+            raise Exception('descending must be a bool when using sort_key')
         pairs = [(row, dict(zip(labels, row))) for row in rows]  # type: ignore
         pairs = sorted(pairs, key=sort_key(pairs[1]))
         sorted_rows = [pair[0] for pair in pairs]
@@ -533,6 +1111,135 @@ def _sort_rows(
     return rows
 
 
+def _get_sort_permutation(
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
+    indices: typing.Sequence[int],
+    directions: typing.Sequence[bool],
+    sort_nulls: Literal['first', 'last'],
+) -> list[int]:
+    """compute stable row order using one array per sort column
+
+    None and nan values are nulls, placed according to sort_nulls
+    regardless of the direction of their column
+    """
+    import numpy as np
+
+    if sort_nulls not in ('first', 'last'):
+        raise Exception('sort_nulls must be "first" or "last"')
+    n_rows = len(rows)
+    if n_rows == 0:
+        return []
+
+    # build keys from most to least significant
+    keys = []
+    for index, descending in zip(indices, directions):
+        values: typing.Sequence[typing.Any]
+        if isinstance(rows, _ColumnarRows):
+            values = rows.columns[index]
+        else:
+            values = [row[index] for row in rows]
+        nulls = None
+        if None in values:
+            nulls = np.fromiter(
+                (value is None for value in values), dtype=bool, count=n_rows
+            )
+            if nulls.all():
+                continue
+            placeholder = values[int(np.argmin(nulls))]
+            values = [
+                placeholder if value is None else value for value in values
+            ]
+
+        array = _get_sort_key_array(values)
+        if array.dtype.kind == 'f':
+            nans = np.isnan(array)
+            if nans.any():
+                if nulls is None:
+                    nulls = nans
+                else:
+                    nulls = nulls | nans
+                array = np.where(nans, 0, array)
+
+        # reverse order of column values without reversing ties
+        if descending:
+            if array.dtype.kind in 'iub':
+                array = ~array
+            else:
+                array = -array
+
+        if nulls is not None:
+            if sort_nulls == 'last':
+                keys.append(nulls)
+            else:
+                keys.append(~nulls)
+        keys.append(array)
+
+    if len(keys) == 0:
+        return list(range(n_rows))
+    elif len(keys) == 1:
+        permutation: list[int] = np.argsort(keys[0], kind='stable').tolist()
+    else:
+        # lexsort treats last key as primary
+        permutation = np.lexsort(keys[::-1]).tolist()
+    return permutation
+
+
+def _get_sort_key_array(values: typing.Sequence[typing.Any]) -> np.ndarray:
+    """convert column values to array whose order matches python order"""
+    import numpy as np
+
+    try:
+        array = np.asarray(values)
+    except (ValueError, TypeError):
+        array = np.empty(0, dtype=object)
+
+    if array.ndim == 1 and array.dtype.kind in 'iufb':
+        return array
+    if array.ndim == 1 and array.dtype.kind == 'U':
+        # numpy coerces mixed values to str, python would not compare them
+        if not all(isinstance(value, str) for value in values):
+            array = np.empty(0, dtype=object)
+    if array.ndim == 1 and array.dtype.kind in 'UMm':
+        _, ranks = np.unique(array, return_inverse=True)
+        return ranks.astype(np.int64)
+
+    # rank arbitrary python values using their own comparisons
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = np.empty(len(values), dtype=np.int64)
+    rank = 0
+    for position, i in enumerate(order):
+        if position > 0 and values[order[position - 1]] != values[i]:
+            rank += 1
+        ranks[i] = rank
+    return ranks
+
+
+def _get_repeat_column_indices(
+    repeat_columns: typing.Sequence[str | int] | None,
+    labels: typing.Sequence[str] | None,
+    add_row_index: bool,
+) -> list[int]:
+    """get indices of columns repeated on every page of a folded table
+
+    the row index column is always repeated, and int column indices refer to
+    columns of the input rows, not counting the row index column
+    """
+    indices = []
+    offset = 0
+    if add_row_index:
+        indices.append(0)
+        offset = 1
+    if repeat_columns is not None:
+        for column in repeat_columns:
+            if isinstance(column, str):
+                if labels is None:
+                    raise Exception('must specify labels to repeat columns')
+                indices.append(labels.index(column))
+            else:
+                indices.append(column + offset)
+    return indices
+
+
 def _get_label_index(label: str | int, labels: typing.Sequence[str]) -> int:
     if isinstance(label, str):
         return labels.index(label)
@@ -542,12 +1249,23 @@ def _get_label_index(label: str | int, labels: typing.Sequence[str]) -> int:
         raise Exception('unknown sort_column format')
 
 
+# keys of column formats that apply to whole columns rather than cells
+_column_format_keys = {
+    'align_decimals',
+    'chart',
+    'chart_width',
+    'chart_min',
+    'chart_max',
+}
+
+
 def _stringify_cells(
     row: typing.Sequence[typing.Any],
     format: FormatKwargs | None,
     column_formats: typing.Sequence[None | typing.Mapping[str, typing.Any]]
     | None,
     empty_str: str,
+    first_line_only: bool = True,
 ) -> list[str]:
     row_str_cells = []
     for c, cell in enumerate(row):
@@ -571,6 +1289,14 @@ def _stringify_cells(
                     cell_format = column_formats[c]
                 if format is not None and cell_format is None:
                     cell_format = format
+                if cell_format is not None and any(
+                    key in cell_format for key in _column_format_keys
+                ):
+                    cell_format = {
+                        key: value
+                        for key, value in cell_format.items()
+                        if key not in _column_format_keys
+                    }
 
                 # format as str
                 if cell_format is not None:
@@ -582,7 +1308,7 @@ def _stringify_cells(
                 as_str = str(cell)
 
         # use only first line
-        if '\n' in as_str:
+        if first_line_only and '\n' in as_str:
             as_str = as_str.split('\n')[0]
 
         row_str_cells.append(as_str)
@@ -590,6 +1316,272 @@ def _stringify_cells(
     return row_str_cells
 
 
+def _stringify_column(
+    column: typing.Sequence[typing.Any],
+    format: FormatKwargs | None,
+    column_format: FormatKwargs | None,
+    empty_str: str,
+    first_line_only: bool = True,
+) -> list[str]:
+    """convert column of cells to str, formatting numeric columns in batch"""
+
+    cell_format = column_format
+    if cell_format is None:
+        cell_format = format
+    if cell_format is None:
+        cell_format = {}
+
+    # render series or fractions of whole column as inline charts
+    if cell_format.get('chart') is not None:
+        return _render_chart_column(column, cell_format, empty_str)
+
+    # line up decimal points of numeric columns using one shared layout
+    if cell_format.get('align_decimals'):
+        cell_format = {
+            key: value
+            for key, value in cell_format.items()
+            if key != 'align_decimals'
+        }
+        is_number = [
+            isinstance(cell, (int, float)) and not isinstance(cell, bool)
+            for cell in column
+        ]
+        if (
+            cell_format.get('format_type', 'number') == 'number'
+            and any(is_number)
+            and all(
+                cell_is_number or cell is None or isinstance(cell, str)
+                for cell, cell_is_number in zip(column, is_number)
+            )
+        ):
+            number_format = {
+                key: value
+                for key, value in cell_format.items()
+                if key != 'format_type'
+            }
+            aligned = formats.format_aligned_numbers(
+                [
+                    cell if cell_is_number else float('nan')
+                    for cell, cell_is_number in zip(column, is_number)
+                ],
+                **number_format,
+            )
+
+            # pass through missing cells and str cells such as '...' rows
+            if not all(is_number):
+                other_strs = iter(
+                    _stringify_cells(
+                        [
+                            cell
+                            for cell, cell_is_number in zip(column, is_number)
+                            if not cell_is_number
+                        ],
+                        None,
+                        None,
+                        empty_str,
+                        first_line_only,
+                    )
+                )
+                aligned = [
+                    str_cell if cell_is_number else next(other_strs)
+                    for str_cell, cell_is_number in zip(aligned, is_number)
+                ]
+            return aligned
+
+    if (
+        cell_format.get('format_type', 'number') == 'number'
+        and _is_numeric_column(column)
+    ):
+        try:
+            import numpy  # noqa: F401
+
+            number_format = {
+                key: value
+                for key, value in cell_format.items()
+                if key != 'format_type'
+            }
+            return formats.format_numbers(column, **number_format)
+        except ImportError:
+            pass
+
+    # convert numeric timestamps in batch, formatting each distinct value once
+    # other cells, such as strs and datetimes, are converted one at a time
+    if cell_format.get('format_type') == 'timestamp' and set(cell_format) <= {
+        'format_type',
+        'representation',
+    }:
+        representation = cell_format.get('representation', 'TimestampISO')
+        if _is_numeric_column(column):
+            return formats.format_timestamps(
+                column, representation=representation
+            )
+        numeric = [
+            c
+            for c, cell in enumerate(column)
+            if isinstance(cell, (int, float)) and not isinstance(cell, bool)
+        ]
+        if len(numeric) > 0:
+            numeric_set = set(numeric)
+            str_column = _stringify_cells(
+                [
+                    None if c in numeric_set else cell
+                    for c, cell in enumerate(column)
+                ],
+                cell_format,
+                None,
+                empty_str,
+                first_line_only,
+            )
+            str_cells = formats.format_timestamps(
+                [column[c] for c in numeric], representation=representation
+            )
+            for c, str_cell in zip(numeric, str_cells):
+                str_column[c] = str_cell
+            return str_column
+
+    if cell_format.get('format_type') == 'nbytes' and _is_numeric_column(
+        column
+    ):
+        try:
+            import numpy  # noqa: F401
+
+            nbytes_format = {
+                key: value
+                for key, value in cell_format.items()
+                if key != 'format_type'
+            }
+            return formats.format_nbytes(column, **nbytes_format)
+        except ImportError:
+            pass
+
+    return _stringify_cells(
+        column, cell_format, None, empty_str, first_line_only
+    )
+
+
+def _render_chart_column(
+    column: typing.Sequence[typing.Any],
+    cell_format: FormatKwargs,
+    empty_str: str,
+) -> list[str]:
+    """render cells of column as charts, rasterizing all cells in one batch
+
+    chart can be 'braille' or 'bars' for a sparkline of each cell's series,
+    or 'fraction' for a horizontal bar of each cell's value scaled between
+    chart_min and chart_max
+    """
+    from .. import charts
+
+    chart = cell_format['chart']
+    width = cell_format.get('chart_width', 10)
+
+    # render missing cells and non-chart cells, like the '...' row of
+    # limit_rows, as blank
+    if chart == 'fraction':
+        present = [
+            c
+            for c, cell in enumerate(column)
+            if isinstance(cell, (int, float))
+            or type(cell).__name__.startswith(('int', 'float'))
+        ]
+    else:
+        present = [
+            c
+            for c, cell in enumerate(column)
+            if cell is not None
+            and not isinstance(cell, (str, bytes))
+            and hasattr(cell, '__len__')
+        ]
+    cells = [column[c] for c in present]
+    if chart == 'braille':
+        rendered = charts.create_braille_sparklines(cells, width)
+    elif chart == 'bars':
+        rendered = charts.create_bar_sparklines(cells, width)
+    elif chart == 'fraction':
+        rendered = charts.create_fraction_bars(
+            cells,
+            width,
+            min_value=cell_format.get('chart_min', 0),
+            max_value=cell_format.get('chart_max'),
+        )
+    else:
+        raise Exception('unknown chart: ' + str(chart))
+
+    if len(present) == len(column):
+        return rendered
+    str_column = [empty_str] * len(column)
+    for c, str_cell in zip(present, rendered):
+        str_column[c] = str_cell
+    return str_column
+
+
+def _is_numeric_column(column: typing.Sequence[typing.Any]) -> bool:
+    """whether column is an int or float array, or a list of one of those"""
+    if len(column) == 0:
+        return False
+    dtype = getattr(column, 'dtype', None)
+    if dtype is not None:
+        return getattr(dtype, 'kind', None) in ('i', 'u', 'f')
+    cell_type = type(column[0])
+    if cell_type is not int and cell_type is not float:
+        return False
+    return all(type(cell) is cell_type for cell in column)
+
+
+def _encode_column(
+    column: typing.Sequence[typing.Any],
+    auto: bool,
+    min_rows: int = 64,
+    min_repetition: int = 4,
+) -> tuple[list[typing.Any], list[int]] | None:
+    """encode column as its distinct values and a code for each cell
+
+    when auto, only encode non-numeric columns whose values repeat at least
+    min_repetition times on average, returning None otherwise
+    """
+    if auto:
+        if len(column) < min_rows or _is_numeric_column(column):
+            return None
+        max_distinct = len(column) // min_repetition
+    else:
+        max_distinct = len(column)
+
+    # key non-str values by type so that 1, 1.0, and True stay distinct
+    codes_by_value: dict[typing.Any, int] = {}
+    values: list[typing.Any] = []
+    codes = []
+    try:
+        for cell in column:
+            key = cell if type(cell) is str else (type(cell), cell)
+            code = codes_by_value.get(key)
+            if code is None:
+                code = len(values)
+                if code >= max_distinct:
+                    return None
+                codes_by_value[key] = code
+                values.append(cell)
+            codes.append(code)
+    except TypeError:
+        # unhashable values
+        return None
+
+    return values, codes
+
+
+def _expand_columns(
+    str_columns: typing.Sequence[typing.Sequence[str]],
+    column_codes: typing.Sequence[typing.Sequence[int] | None],
+) -> list[list[str]]:
+    """convert str columns to rows, expanding encoded columns"""
+    expanded = [
+        str_column
+        if codes is None
+        else [str_column[code] for code in codes]
+        for str_column, codes in zip(str_columns, column_codes)
+    ]
+    return [list(str_row) for str_row in zip(*expanded)]
+
+
 def _trim_justify(
     str_row: typing.Sequence[str],
     column_widths: typing.Sequence[int],
@@ -598,40 +1590,53 @@ def _trim_justify(
 ) -> list[str]:
     """trim or justify cells in row to target sizes"""
 
-    import rich.text
-
     if column_justify is not None and len(column_justify) != len(str_row):
         raise Exception('wrong length of list')
 
     output = []
     for c, cell in enumerate(str_row):
-        rich_cell = rich.text.Text.from_markup(cell)
-        length = len(rich_cell.plain)
+        # determine justification
+        cell_justify = None
+        if column_justify is not None:
+            cell_justify = column_justify[c]
+        if cell_justify is None:
+            cell_justify = justify
 
-        width = column_widths[c]
-        if length == width:
-            output.append(cell)
-        elif length > width:
-            # trim
+        output.append(_trim_justify_cell(cell, column_widths[c], cell_justify))
 
-            if width >= 3:
-                trimmed = rich_cell.fit(width - 3)[0].markup + '...'
-            else:
-                trimmed = '.' * width
-            output.append(trimmed)
+    return output
 
-        else:
-            # determine justification
-            cell_justify = None
-            if column_justify is not None:
-                cell_justify = column_justify[c]
-            if cell_justify is None:
-                cell_justify = justify
 
-            # justify
-            output.append(formats.hjustify(cell, cell_justify, width))
+def _trim_justify_cell(
+    cell: str,
+    width: int,
+    justify: spec.HorizontalJustification,
+) -> str:
+    """trim or justify cell to target size"""
+
+    if '[' in cell:
+        import rich.text
 
-    return output
+        rich_cell = rich.text.Text.from_markup(cell)
+        length = len(rich_cell.plain)
+    else:
+        rich_cell = None
+        length = len(cell)
+
+    if length == width:
+        return cell
+    elif length > width:
+        # trim
+        if width < 3:
+            return '.' * width
+        if rich_cell is None:
+            import rich.text
+
+            rich_cell = rich.text.Text(cell)
+        return rich_cell.fit(width - 3)[0].markup + '...'
+    else:
+        # justify
+        return formats.hjustify(cell, justify, width)
 
 
 def _stylize_rows(
@@ -642,23 +1647,48 @@ def _stylize_rows(
     style: Style | None,
     column_styles: ColumnData[Style] | None,
 ) -> list[list[str]]:
-    stylized_rows = []
-    for r, (row, str_row) in enumerate(zip(rows, str_rows)):
-        stylized_row = []
-        for c, (cell, str_cell) in enumerate(zip(row, str_row)):
-            # use column style if specified, otherwise use global style
-            if column_styles is not None and column_styles[c] is not None:
-                cell_style: Style | None = column_styles[c]
-            elif style is not None:
-                cell_style = style
-            else:
-                cell_style = None
+    if style is None and (
+        column_styles is None
+        or all(column_style is None for column_style in column_styles)
+    ):
+        return str_rows
+
+    # style column by column, reading str cells from the unstyled rows
+    stylized_rows = [list(str_row) for str_row in str_rows]
+    n_columns = len(str_rows[0]) if len(str_rows) > 0 else 0
+    for c in range(n_columns):
+        # use column style if specified, otherwise use global style
+        if column_styles is not None and column_styles[c] is not None:
+            column_style: Style | None = column_styles[c]
+        else:
+            column_style = style
+        if column_style is None:
+            continue
+
+        if isinstance(column_style, str):
+            for stylized_row in stylized_rows:
+                stylized_row[c] = formats.add_style(
+                    stylized_row[c], column_style
+                )
 
-            # if a function, call with table style context
-            if isinstance(cell_style, types.FunctionType):
+        elif style_rules._is_style_rule(column_style):
+            # evaluate rule over whole column into an index of styles
+            styles, indices = style_rules._evaluate_style_rule(
+                column_style, [row[c] for row in rows]
+            )
+            for stylized_row, index in zip(stylized_rows, indices.tolist()):
+                cell_style = styles[index]
+                if cell_style is not None:
+                    stylized_row[c] = formats.add_style(
+                        stylized_row[c], cell_style
+                    )
+
+        elif isinstance(column_style, types.FunctionType):
+            # call function with table style context of each cell
+            for r, (row, str_row) in enumerate(zip(rows, str_rows)):
                 table_style_context: TableStyleContext = {
-                    'cell': cell,
-                    'str_cell': str_cell,
+                    'cell': row[c],
+                    'str_cell': str_row[c],
                     'row': row,
                     'str_row': str_row,
                     'labels': labels,
@@ -666,20 +1696,48 @@ def _stylize_rows(
                     'r': r,
                     'c': c,
                 }
-                cell_style = cell_style(table_style_context)
-
-            # apply style if present
-            if cell_style is not None:
-                if not isinstance(cell_style, str):
-                    raise Exception('could not convert style to str')
-                str_cell = formats.add_style(str_cell, cell_style)
-            stylized_row.append(str_cell)
+                cell_style = column_style(table_style_context)
+                if cell_style is not None:
+                    if not isinstance(cell_style, str):
+                        raise Exception('could not convert style to str')
+                    stylized_rows[r][c] = formats.add_style(
+                        str_row[c], cell_style
+                    )
 
-        stylized_rows.append(stylized_row)
+        else:
+            raise Exception('could not convert style to str')
 
     return stylized_rows
 
 
+def _stylize_encoded_columns(
+    str_columns: typing.Sequence[typing.Sequence[str]],
+    column_codes: typing.Sequence[typing.Sequence[int] | None],
+    style: Style | None,
+    column_styles: typing.Sequence[Style | None] | None,
+) -> tuple[dict[int, list[str]], list[Style | None]]:
+    """style distinct values of encoded columns that use a fixed style
+
+    returns styled encoded columns and the styles left for other columns
+    """
+    styled_columns = {}
+    remaining_styles: list[Style | None] = []
+    for c, (str_column, codes) in enumerate(zip(str_columns, column_codes)):
+        if column_styles is not None and column_styles[c] is not None:
+            cell_style = column_styles[c]
+        else:
+            cell_style = style
+        if codes is not None and isinstance(cell_style, str):
+            styled = [
+                formats.add_style(str_cell, cell_style)
+                for str_cell in str_column
+            ]
+            styled_columns[c] = [styled[code] for code in codes]
+            cell_style = None
+        remaining_styles.append(cell_style)
+    return styled_columns, remaining_styles
+
+
 def _process_label_location(
     label_location: HeaderLocation | None,
 ) -> tuple[bool, bool]:
@@ -698,22 +1756,21 @@ def _process_label_location(
     return top_label, bottom_label
 
 
-def _convert_table_to_str(
-    str_cells: list[list[str]],
-    str_labels: list[list[str]],
-    column_widths: typing.Sequence[int],
+def _resolve_table_chrome(
     compact: bool | int,
-    indent: str | int | None,
-    max_table_width: int | None,
-    label_location: HeaderLocation | None,
     border: str | spec.BorderChars | None,
     label_border: str | spec.BorderChars | None,
     outer_border: bool | str | spec.BorderChars | None,
     column_gap: int | str | None,
     outer_gap: int | str | None,
-    separator_indices: set[int],
-) -> str:
-    import rich.text
+) -> tuple[
+    spec.BorderChars,
+    spec.BorderChars,
+    spec.BorderChars | None,
+    str,
+    str,
+]:
+    """resolve border and gap specifications into border chars and gap strs"""
 
     # use compact format
     if compact:
@@ -752,15 +1809,6 @@ def _convert_table_to_str(
     if isinstance(outer_border, str):
         outer_border = outlines.get_border_chars_by_name(outer_border)
 
-    # determine whether borders match
-    label_equals_inner = label_border['cross'] == border['cross']
-    if outer_border is not None:
-        outer_equals_inner = outer_border['cross'] == border['cross']
-        label_equals_outer = label_border['cross'] == outer_border['cross']
-    else:
-        outer_equals_inner = True
-        label_equals_outer = True
-
     # determine gaps and delimiters
     if column_gap is None:
         column_gap = '  '
@@ -771,6 +1819,134 @@ def _convert_table_to_str(
     if outer_gap is None:
         outer_gap = column_gap
 
+    return border, label_border, outer_border, column_gap, outer_gap
+
+
+def _get_table_width(
+    column_widths: typing.Sequence[int],
+    indent: str | int | None,
+    border: spec.BorderChars,
+    outer_border: spec.BorderChars | None,
+    column_gap: str,
+    outer_gap: str,
+) -> int:
+    """compute width of table lines, excluding any styling markup"""
+    if isinstance(indent, int):
+        indent = ' ' * indent
+    if indent is None:
+        indent = ''
+    width = len(indent) + 2 * len(outer_gap) + sum(column_widths)
+    if len(column_widths) > 1:
+        delimiter = column_gap + border['vertical'] + column_gap
+        width += (len(column_widths) - 1) * _get_plain_width(delimiter)
+    if outer_border is not None:
+        width += 2 * _get_plain_width(outer_border['vertical'])
+    return width
+
+
+def _get_plain_width(text: str) -> int:
+    if '[' in text:
+        return formats.get_styled_width(text)
+    else:
+        return len(text)
+
+
+def _get_column_pages(
+    column_widths: typing.Sequence[int],
+    max_table_width: int,
+    repeat_columns: typing.Sequence[int],
+    indent: str | int | None,
+    compact: bool | int,
+    border: str | spec.BorderChars | None,
+    label_border: str | spec.BorderChars | None,
+    outer_border: bool | str | spec.BorderChars | None,
+    column_gap: int | str | None,
+    outer_gap: int | str | None,
+) -> list[list[int]]:
+    """split columns into horizontal pages that each fit in max_table_width
+
+    repeated columns are included in every page, and every page includes at
+    least one non-repeated column even if it does not fit
+    """
+    border, _, outer_border, column_gap, outer_gap = _resolve_table_chrome(
+        compact=compact,
+        border=border,
+        label_border=label_border,
+        outer_border=outer_border,
+        column_gap=column_gap,
+        outer_gap=outer_gap,
+    )
+    repeated = sorted(set(repeat_columns))
+    remaining = [
+        c for c in range(len(column_widths)) if c not in set(repeated)
+    ]
+
+    pages = []
+    page: list[int] = []
+    for c in remaining:
+        candidate = sorted(repeated + page + [c])
+        candidate_widths = [column_widths[i] for i in candidate]
+        width = _get_table_width(
+            column_widths=candidate_widths,
+            indent=indent,
+            border=border,
+            outer_border=outer_border,
+            column_gap=column_gap,
+            outer_gap=outer_gap,
+        )
+        if width > max_table_width and len(page) > 0:
+            pages.append(sorted(repeated + page))
+            page = [c]
+        else:
+            page.append(c)
+    if len(page) > 0 or len(pages) == 0:
+        pages.append(sorted(repeated + page))
+
+    return pages
+
+
+def _convert_table_to_str(
+    str_cells: list[list[str]],
+    str_labels: list[list[str]],
+    str_footer: list[list[str]],
+    column_widths: typing.Sequence[int],
+    compact: bool | int,
+    indent: str | int | None,
+    max_table_width: int | None,
+    label_location: HeaderLocation | None,
+    border: str | spec.BorderChars | None,
+    label_border: str | spec.BorderChars | None,
+    outer_border: bool | str | spec.BorderChars | None,
+    column_gap: int | str | None,
+    outer_gap: int | str | None,
+    separator_indices: set[int],
+) -> str:
+    import rich.text
+
+    (
+        border,
+        label_border,
+        outer_border,
+        column_gap,
+        outer_gap,
+    ) = _resolve_table_chrome(
+        compact=compact,
+        border=border,
+        label_border=label_border,
+        outer_border=outer_border,
+        column_gap=column_gap,
+        outer_gap=outer_gap,
+    )
+
+    # determine whether borders match
+    label_equals_inner = label_border['cross'] == border['cross']
+    if outer_border is not None:
+        outer_equals_inner = outer_border['cross'] == border['cross']
+        label_equals_outer = label_border['cross'] == outer_border['cross']
+    else:
+        outer_equals_inner = True
+        label_equals_outer = True
+
     # render rows as strs
     inner_delimiter = column_gap + border['vertical'] + column_gap
     formatted_rows = [
@@ -784,8 +1960,10 @@ def _convert_table_to_str(
         outer_gap=outer_gap,
     )
 
-    # render label as strs
-    if len(str_labels) > 0:
+    # render label and footer as strs
+    formatted_labels: list[str] = []
+    formatted_footer: list[str] = []
+    if len(str_labels) > 0 or len(str_footer) > 0:
         # build label delimiter
         if not label_equals_outer and not label_equals_inner:
             label_vertical = ' '
@@ -798,6 +1976,10 @@ def _convert_table_to_str(
             outer_gap + label_delimiter.join(str_label) + outer_gap
             for str_label in str_labels
         ]
+        formatted_footer = [
+            outer_gap + label_delimiter.join(str_row) + outer_gap
+            for str_row in str_footer
+        ]
 
         # build top label row separator
         if label_equals_inner:
@@ -862,6 +2044,11 @@ def _convert_table_to_str(
             outer_vertical + formatted_label + outer_vertical
             for formatted_label in formatted_labels
         ]
+        if len(str_footer) > 0:
+            formatted_footer = [
+                outer_vertical + formatted_row + outer_vertical
+                for formatted_row in formatted_footer
+            ]
 
         # load more chars
         outer_horizontal = outer_border['horizontal']
@@ -893,7 +2080,7 @@ def _convert_table_to_str(
         )
 
         # create bottom outer border
-        if bottom_label:
+        if bottom_label or len(str_footer) > 0:
             bottom_interface = label_equals_outer
         else:
             bottom_interface = outer_equals_inner
@@ -919,18 +2106,19 @@ def _convert_table_to_str(
         )
 
         # add outer border to label row separator
-        if label_equals_outer:
-            outer_left_t = outer_border['left_t']
-            outer_right_t = outer_border['right_t']
-        else:
-            outer_left_t = outer_border['vertical']
-            outer_right_t = outer_border['vertical']
-        label_top_row_separator = (
-            outer_left_t + label_top_row_separator + outer_right_t
-        )
-        label_bottom_row_separator = (
-            outer_left_t + label_bottom_row_separator + outer_right_t
-        )
+        if len(str_labels) > 0 or len(str_footer) > 0:
+            if label_equals_outer:
+                outer_left_t = outer_border['left_t']
+                outer_right_t = outer_border['right_t']
+            else:
+                outer_left_t = outer_border['vertical']
+                outer_right_t = outer_border['vertical']
+            label_top_row_separator = (
+                outer_left_t + label_top_row_separator + outer_right_t
+            )
+            label_bottom_row_separator = (
+                outer_left_t + label_bottom_row_separator + outer_right_t
+            )
 
     # gather lines
     lines = []
@@ -942,6 +2130,10 @@ def _convert_table_to_str(
         lines.append(formatted_row)
         if r in separator_indices:
             lines.append(row_separator)
+    if len(str_footer) > 0:
+        lines.append(label_bottom_row_separator)
+        for formatted_row in formatted_footer:
+            lines.append(formatted_row)
     if bottom_label:
         lines.append(label_bottom_row_separator)
         for formatted_label in formatted_labels:
@@ -1005,44 +2197,67 @@ def _print_table(
         if console is None:
             import rich.console
 
-            console = rich.console.Console(
-                file=file,
-                theme=rich.theme.Theme(inherit=False),
-                width=10000,
-            )
+            context = render_context.get_render_context()
+            console = context['console']
+            if console is None:
+                kwargs: dict[str, typing.Any] = {}
+                if context['color_system'] is not None:
+                    kwargs['color_system'] = context['color_system']
+                if file is None:
+                    file = context['file']
+                console = rich.console.Console(
+                    file=file,
+                    theme=rich.theme.Theme(inherit=False),
+                    width=10000,
+                    **kwargs,
+                )
         console.print(table_as_str)
 
     else:
-        print(table_as_str)
+        if file is None:
+            file = render_context.get_render_context()['file']
+        print(table_as_str, file=file)
 
 
 def clip_rows(
-    rows: list[typing.Sequence[typing.Any]],
+    rows: typing.Sequence[typing.Sequence[typing.Any]],
     n: int,
     *,
     clip_position: Literal['start', 'middle', 'end'] = 'end',
     fill: str | None = '...',
-) -> list[typing.Sequence[typing.Any]]:
+) -> typing.Sequence[typing.Sequence[typing.Any]]:
     if len(rows) <= n:
         return rows
 
     # construct fill
+    fill_rows: list[typing.Sequence[typing.Any]] = []
     if fill is not None:
         n_columns = len(rows[0])
-        fill_rows: list[typing.Sequence[typing.Any]] = [[fill] * n_columns]
+        fill_rows = [[fill] * n_columns]
         n = n - 1
 
-    # clip
-    if clip_position == 'start':
-        return fill_rows + rows[-n:]
-    elif clip_position == 'end':
-        return rows[:n] + fill_rows
-    elif clip_position == 'middle':
-        import math
-
-        n_head = math.ceil(n / 2)
-        n_tail = n - n_head
-        return rows[:n_head] + fill_rows + rows[-n_tail:]
-    else:
-        raise Exception('invalid clip_rows specification')
+    def clip(
+        items: typing.Sequence[typing.Any], fill_items: list[typing.Any]
+    ) -> list[typing.Any]:
+        if clip_position == 'start':
+            return fill_items + list(items[-n:])
+        elif clip_position == 'end':
+            return list(items[:n]) + fill_items
+        elif clip_position == 'middle':
+            import math
+
+            n_head = math.ceil(n / 2)
+            n_tail = n - n_head
+            return list(items[:n_head]) + fill_items + list(items[-n_tail:])
+        else:
+            raise Exception('invalid clip_rows specification')
+
+    # clip columnar rows column by column
+    if isinstance(rows, _ColumnarRows):
+        fill_cells = [] if fill is None else [fill]
+        return _ColumnarRows(
+            [clip(column, fill_cells) for column in rows.columns]
+        )
+
+    return clip(rows, fill_rows)
 